@@ -0,0 +1,108 @@
+"""
+Rock-Paper-Scissors Animation Timeline
+Precompiled frame sequence for the computer's "thinking" animation.
+
+The animation does not depend on the round being played, so it is compiled
+once into a list of steps.  Each step holds only the label texts that differ
+from the previous step, plus the delay before the next step.  The GUI then
+walks the timeline with one reusable callback instead of recomputing phases
+and indices on every tick.  This module does not import tkinter, so
+timelines can be inspected and measured without a display.
+"""
+
+from typing import Dict, NamedTuple, Sequence, Tuple
+
+# Label keys used in timeline updates
+COMPUTER_LABEL = 'computer'
+RESULT_LABEL = 'result'
+
+
+class Step(NamedTuple):
+    """One animation tick: label updates to apply, then a delay in ms."""
+    updates: Tuple[Tuple[str, str], ...]
+    delay: int
+
+
+class AnimationTimeline:
+    """An immutable, inspectable sequence of animation steps."""
+
+    def __init__(self, steps: Sequence[Step]):
+        """Store the compiled steps."""
+        self.steps = tuple(steps)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __getitem__(self, index: int) -> Step:
+        return self.steps[index]
+
+    @property
+    def total_duration(self) -> int:
+        """Total scheduled time in milliseconds before the reveal."""
+        return sum(step.delay for step in self.steps)
+
+    @property
+    def configure_calls(self) -> int:
+        """Number of widget ``configure`` calls one playback issues."""
+        return sum(len(step.updates) for step in self.steps)
+
+    def scaled(self, factor: float) -> "AnimationTimeline":
+        """The same updates with every delay multiplied by ``factor`` (0 runs back to back)."""
+        return AnimationTimeline(Step(step.updates, int(step.delay * factor)) for step in self.steps)
+
+
+def compile_frames(frames: Sequence[Tuple[Dict[str, str], int]]) -> AnimationTimeline:
+    """Compile full ``({label: text}, delay)`` frames into a diffed timeline.
+
+    The first frame always sets every label it mentions, since the labels'
+    text before the animation starts is unknown.  Frames that change nothing
+    are folded into the previous step's delay, so they cost no tick at all.
+    """
+    steps = []
+    shown: Dict[str, str] = {}
+    for texts, delay in frames:
+        updates = tuple((label, text) for label, text in texts.items() if shown.get(label) != text)
+        shown.update(texts)
+        if not updates and steps:
+            previous = steps[-1]
+            steps[-1] = Step(previous.updates, previous.delay + delay)
+        else:
+            steps.append(Step(updates, delay))
+    return AnimationTimeline(steps)
+
+
+def compile_choice_animation(loading_frames: Sequence[str],
+                             thinking_messages: Sequence[str],
+                             countdown_messages: Sequence[str],
+                             reveal_text: Tuple[str, str] = ("💫", "🎭 Revealing..."),
+                             reveal_delay: int = 300) -> AnimationTimeline:
+    """Compile the loading, countdown and reveal phases into one timeline."""
+    total_frames = len(loading_frames) * 4  # Extended animation
+    loading_end = total_frames * 0.75
+    frames = []
+
+    for frame in range(total_frames):
+        if frame < loading_end:
+            # Phase 1: Loading animation with thinking messages that speed up
+            texts = {
+                COMPUTER_LABEL: loading_frames[frame % len(loading_frames)],
+                RESULT_LABEL: thinking_messages[(frame // 3) % len(thinking_messages)]
+            }
+            delay = max(80, 200 - (frame * 3))
+        else:
+            # Phase 2: Dramatic countdown, slower for effect
+            countdown_index = (frame - int(loading_end)) // 3
+            if countdown_index < len(countdown_messages):
+                texts = {
+                    COMPUTER_LABEL: "❓",
+                    RESULT_LABEL: countdown_messages[countdown_index]
+                }
+                delay = 400
+            else:
+                texts = {}
+                delay = 100
+        frames.append((texts, delay))
+
+    # Phase 3: Brief flash before the computer's choice is revealed
+    frames.append(({COMPUTER_LABEL: reveal_text[0], RESULT_LABEL: reveal_text[1]}, reveal_delay))
+    return compile_frames(frames)
@@ -0,0 +1,130 @@
+"""
+Rock-Paper-Scissors Batch Scoring
+Vectorized round resolution over NumPy arrays of integer-coded choices.
+
+Choices are encoded with ``engine.CHOICE_CODES`` (rock=0, paper=1,
+scissors=2) and results with ``engine.RESULT_CODES`` (tie=0, win=1,
+lose=2).  NumPy is an optional dependency only needed by this module.
+"""
+
+import time
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError("batch scoring requires NumPy: pip install numpy") from exc
+
+from engine import (GameStats, CHOICE_ORDER, CHOICE_CODES,
+                    RESULT_CODES, RESULT_ORDER, GameResult, determine_winner)
+
+# Precomputed 3x3 outcome table indexed as OUTCOME_TABLE[player, computer]
+OUTCOME_TABLE = np.array(
+    [[RESULT_CODES[determine_winner(player, computer)] for computer in CHOICE_ORDER]
+     for player in CHOICE_ORDER],
+    dtype=np.uint8
+)
+
+# The modular shortcut used by resolve_batch must agree with the rules table
+_codes = np.arange(3, dtype=np.uint8)
+assert (OUTCOME_TABLE == (_codes[:, None] + 3 - _codes[None, :]) % 3).all()
+del _codes
+
+
+def encode_choices(choices) -> np.ndarray:
+    """Convert an iterable of ``Choice`` members to a uint8 code array."""
+    return np.fromiter((CHOICE_CODES[choice] for choice in choices), dtype=np.uint8)
+
+
+def decode_results(results: np.ndarray) -> list:
+    """Convert a result code array back to ``GameResult`` members."""
+    return [RESULT_ORDER[code] for code in results.tolist()]
+
+
+def _choice_codes(codes) -> np.ndarray:
+    """Check an array of choice codes before narrowing it to uint8."""
+    codes = np.asarray(codes)
+    if not codes.size:
+        return codes.astype(np.uint8)
+    # Range-check the original values: casting first would wrap 256 to 0 and -1 to 255
+    if not np.issubdtype(codes.dtype, np.integer) or codes.min() < 0 or codes.max() > 2:
+        raise ValueError("choice codes must be 0 (rock), 1 (paper) or 2 (scissors)")
+    return codes.astype(np.uint8, copy=False)
+
+
+def resolve_batch(player: np.ndarray, computer: np.ndarray) -> np.ndarray:
+    """Resolve many rounds at once and return their result codes.
+
+    Both arguments are equally shaped integer arrays of choice codes.
+    The result is a uint8 array of result codes, from the player's side.
+    """
+    player = np.asarray(player)
+    computer = np.asarray(computer)
+    if player.shape != computer.shape:
+        raise ValueError(f"shape mismatch: {player.shape} vs {computer.shape}")
+    player = _choice_codes(player)
+    computer = _choice_codes(computer)
+
+    # Adding 3 keeps the uint8 difference non-negative before the modulo
+    results = player + np.uint8(3)
+    results -= computer
+    results %= np.uint8(3)
+    return results
+
+
+def aggregate_stats(results: np.ndarray, stats: Optional[GameStats] = None) -> GameStats:
+    """Fold an array of result codes into ``GameStats`` totals."""
+    counts = np.bincount(np.asarray(results, dtype=np.uint8).ravel(), minlength=3)
+    stats = stats if stats is not None else GameStats()
+    stats.ties += int(counts[RESULT_CODES[GameResult.TIE]])
+    stats.wins += int(counts[RESULT_CODES[GameResult.WIN]])
+    stats.losses += int(counts[RESULT_CODES[GameResult.LOSE]])
+    stats.total_games += int(counts.sum())
+    return stats
+
+
+def score_batch(player: np.ndarray, computer: np.ndarray,
+                stats: Optional[GameStats] = None) -> GameStats:
+    """Resolve a batch of rounds and return the aggregated totals."""
+    return aggregate_stats(resolve_batch(player, computer), stats)
+
+
+def benchmark(rounds: int = 1_000_000, seed: int = 0) -> dict:
+    """Compare scalar ``determine_winner`` with the vectorized path.
+
+    Returns rounds per second for both paths and the speedup factor.
+    """
+    rng = np.random.default_rng(seed)
+    player = rng.integers(0, 3, size=rounds, dtype=np.uint8)
+    computer = rng.integers(0, 3, size=rounds, dtype=np.uint8)
+
+    player_choices = [CHOICE_ORDER[code] for code in player.tolist()]
+    computer_choices = [CHOICE_ORDER[code] for code in computer.tolist()]
+
+    start = time.perf_counter()
+    scalar_stats = GameStats()
+    for player_choice, computer_choice in zip(player_choices, computer_choices):
+        scalar_stats.record(determine_winner(player_choice, computer_choice))
+    scalar_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_stats = score_batch(player, computer)
+    batch_elapsed = time.perf_counter() - start
+
+    if scalar_stats != batch_stats:
+        raise AssertionError(f"batch totals {batch_stats} differ from scalar {scalar_stats}")
+
+    return {
+        'rounds': rounds,
+        'scalar_rounds_per_sec': rounds / scalar_elapsed,
+        'batch_rounds_per_sec': rounds / batch_elapsed,
+        'speedup': scalar_elapsed / batch_elapsed
+    }
+
+
+if __name__ == "__main__":
+    result = benchmark()
+    print(f"Rounds:        {result['rounds']:,}")
+    print(f"Scalar:        {result['scalar_rounds_per_sec']:,.0f} rounds/s")
+    print(f"Batch (NumPy): {result['batch_rounds_per_sec']:,.0f} rounds/s")
+    print(f"Speedup:       {result['speedup']:.1f}x")
@@ -0,0 +1,369 @@
+"""
+Rock-Paper-Scissors Benchmarks
+Reproducible timings for the engine, persistence and UI hot paths.
+
+Each benchmark returns named metrics with a unit and a direction (higher
+or lower is better).  Results are written as JSON and compared against a
+stored baseline; any metric that got worse by more than the tolerance is
+reported as a regression and the run exits with status 1.  The Tk
+animation benchmark needs a display; on a headless machine run it under
+Xvfb (``xvfb-run python benchmarks.py``), otherwise it is skipped, as it
+is on a Python built without Tk.
+The same goes for the window benchmark, which times building the window,
+hovering a button and switching the color theme.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from engine import CHOICE_ORDER, GameStats, determine_winner
+from instrument import percentile
+from journal import StatsJournal
+from storage import SQLiteBackend
+from writer import StatsWriter
+
+DEFAULT_BASELINE = 'benchmark_baseline.json'
+SCHEMA_VERSION = 1
+GUI_BENCHMARKS = frozenset({'animation_ticks', 'window'})
+
+
+def metric(value: float, unit: str, better: str = 'lower') -> dict:
+    """One benchmark figure; ``better`` is 'higher' or 'lower'."""
+    return {'value': value, 'unit': unit, 'better': better}
+
+
+def random_rounds(count: int, seed: int):
+    """``count`` reproducible ``(player, computer)`` choice pairs."""
+    rng = random.Random(seed)
+    return [(rng.choice(CHOICE_ORDER), rng.choice(CHOICE_ORDER)) for _ in range(count)]
+
+
+def bench_determine_winner(rounds: int = 1_000_000, repeats: int = 5, seed: int = 0) -> Dict[str, dict]:
+    """Scalar ``determine_winner`` throughput, best of ``repeats``."""
+    pairs = random_rounds(rounds, seed)
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for player_choice, computer_choice in pairs:
+            determine_winner(player_choice, computer_choice)
+        best = min(best, time.perf_counter() - start)
+    return {'determine_winner.calls_per_sec': metric(rounds / best, 'calls/s', 'higher')}
+
+
+def bench_stats_persistence(rounds: int = 5000, seed: int = 0) -> Dict[str, dict]:
+    """Per-round ``update_stats`` + ``save_stats`` cost against a SQLite backend.
+
+    Submit latency is what the Tk thread pays per round (count the result,
+    queue the round and a snapshot); flush latency is the background write
+    of everything queued so far.
+    """
+    pairs = random_rounds(rounds, seed)
+    with tempfile.TemporaryDirectory() as directory:
+        backend = SQLiteBackend(os.path.join(directory, 'bench.db'), legacy_paths=[])
+        writer = StatsWriter(backend, flush_interval=3600, max_queue=rounds * 2 + 1)
+        stats = GameStats()
+        submit = []
+        for player_choice, computer_choice in pairs:
+            start = time.perf_counter()
+            result = determine_winner(player_choice, computer_choice)
+            stats.record(result)
+            writer.record_round(player_choice, computer_choice, result)
+            writer.save_snapshot(stats)
+            submit.append(time.perf_counter() - start)
+
+        # Not started: flush drains inline, so this times the write itself
+        start = time.perf_counter()
+        writer.flush()
+        flush = time.perf_counter() - start
+        writer.close()
+
+    submit.sort()
+    return {
+        'stats.submit_p50_us': metric(percentile(submit, 0.50) * 1e6, 'us'),
+        'stats.submit_p99_us': metric(percentile(submit, 0.99) * 1e6, 'us'),
+        'stats.flush_per_round_us': metric(flush / rounds * 1e6, 'us')
+    }
+
+
+def bench_journal_load(sizes=(1_000, 10_000, 100_000), repeats: int = 3,
+                       seed: int = 0) -> Dict[str, dict]:
+    """Time to load a stats journal holding ``size`` JSON-lines entries, best of ``repeats``."""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            snapshot = os.path.join(directory, f'stats_{size}.json')
+            journal = StatsJournal(snapshot, fsync_every=size, compact_every=size + 1)
+            journal.append_many((player_choice, computer_choice,
+                                 determine_winner(player_choice, computer_choice), None)
+                                for player_choice, computer_choice in random_rounds(size, seed))
+            journal.close()
+
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                StatsJournal(snapshot).load()
+                best = min(best, time.perf_counter() - start)
+            results[f'journal.load_{size}_ms'] = metric(best * 1000, 'ms')
+    return results
+
+
+def bench_animation_ticks(rounds: int = 20, seed: int = 0) -> Dict[str, dict]:
+    """Per-tick cost of the thinking animation in the real Tk GUI.
+
+    The timeline's delays are set to zero so ticks run back to back; each
+    tick is timed from inside its ``after`` callback.  Raises
+    ``tkinter.TclError`` when no display is available.
+    """
+    from main import RockPaperScissorsGame
+
+    with tempfile.TemporaryDirectory() as directory:
+        backend = SQLiteBackend(os.path.join(directory, 'bench.db'), legacy_paths=[])
+        game = RockPaperScissorsGame(backend=backend)
+        try:
+            while game.writer is None:  # Wait for the background stats load
+                game.root.update()
+            game.animation_timeline = game.animation_timeline.scaled(0)
+
+            ticks = []
+            advance = game._advance_animation
+
+            def timed_advance():
+                start = time.perf_counter()
+                advance()
+                ticks.append(time.perf_counter() - start)
+
+            # Rescheduling looks the method up on the instance, so every tick is timed
+            game._advance_animation = timed_advance
+            rng = random.Random(seed)
+            start = time.perf_counter()
+            for _ in range(rounds):
+                game.play_round(rng.choice(CHOICE_ORDER))
+                while game.animation_running:
+                    game.root.update()
+            elapsed = time.perf_counter() - start
+        finally:
+            if game.writer is not None:
+                game.writer.close()
+            game.pump.stop()
+            game.root.destroy()
+
+    ticks.sort()
+    return {
+        'tk.animation_tick_p50_us': metric(percentile(ticks, 0.50) * 1e6, 'us'),
+        'tk.animation_tick_p99_us': metric(percentile(ticks, 0.99) * 1e6, 'us'),
+        'tk.animated_rounds_per_sec': metric(rounds / elapsed, 'rounds/s', 'higher')
+    }
+
+
+def bench_window(hovers: int = 1000, rebuilds: int = 5) -> Dict[str, dict]:
+    """Window build time, per-hover cost and theme switch time in the real Tk GUI.
+
+    Each hover is an Enter and a Leave event on a choice button.  Besides
+    the time, it counts the Tcl commands run on the button and the Python
+    callbacks made, which show the cost of the hover handler itself.
+    Raises ``tkinter.TclError`` when no display is available.
+    """
+    import tkinter as tk
+
+    from main import RockPaperScissorsGame
+    from theme import THEMES
+
+    builds = []
+    for _ in range(rebuilds):
+        start = time.perf_counter()
+        game = RockPaperScissorsGame(backend=SQLiteBackend(':memory:', legacy_paths=[]))
+        game.build_secondary_panels()
+        game.root.update_idletasks()
+        builds.append(time.perf_counter() - start)
+        if len(builds) < rebuilds:
+            while game.writer is None:
+                game.root.update()
+            game.writer.close()
+            game.pump.stop()
+            game.root.destroy()
+
+    try:
+        while game.writer is None:  # Wait for the background stats load
+            game.root.update()
+        game.root.update()
+        button = game.choice_buttons[0]
+        x, y = button.winfo_width() // 2, button.winfo_height() // 2
+
+        # Count widget commands in Tcl and Python callbacks from Tcl while hovering
+        game.root.tk.eval('set ::benchHoverCalls 0; proc benchCountCall args {incr ::benchHoverCalls}')
+        game.root.tk.call('trace', 'add', 'execution', str(button), 'enter', 'benchCountCall')
+        callbacks = [0]
+        original_call = tk.CallWrapper.__call__
+
+        def counting_call(wrapper, *args):
+            callbacks[0] += 1
+            return original_call(wrapper, *args)
+
+        tk.CallWrapper.__call__ = counting_call
+        try:
+            start = time.perf_counter()
+            for _ in range(hovers):
+                button.event_generate("<Enter>", x=x, y=y)
+                button.event_generate("<Leave>", x=x, y=y)
+            hover_elapsed = time.perf_counter() - start
+        finally:
+            tk.CallWrapper.__call__ = original_call
+            game.root.tk.call('trace', 'remove', 'execution', str(button), 'enter', 'benchCountCall')
+        widget_calls = int(game.root.tk.globalgetvar('benchHoverCalls'))
+
+        switches = []
+        for name in list(THEMES) * 3:
+            start = time.perf_counter()
+            game.switch_theme(name)
+            game.root.update_idletasks()
+            switches.append(time.perf_counter() - start)
+    finally:
+        if game.writer is not None:
+            game.writer.close()
+        game.pump.stop()
+        game.root.destroy()
+
+    builds.sort()
+    switches.sort()
+    return {
+        'tk.window_build_ms': metric(percentile(builds, 0.50) * 1000, 'ms'),
+        'tk.hover_us': metric(hover_elapsed / hovers * 1e6, 'us'),
+        'tk.hover_widget_calls': metric(widget_calls / hovers, 'calls'),
+        'tk.hover_python_callbacks': metric(callbacks[0] / hovers, 'calls'),
+        'tk.theme_switch_ms': metric(percentile(switches, 0.50) * 1000, 'ms')
+    }
+
+
+def run_benchmarks(quick: bool = False, seed: int = 0) -> dict:
+    """Run every benchmark and return a JSON-serializable report."""
+    scale = 10 if quick else 1
+    benchmarks = [
+        ('determine_winner', lambda: bench_determine_winner(1_000_000 // scale, seed=seed)),
+        ('stats_persistence', lambda: bench_stats_persistence(5000 // scale, seed=seed)),
+        ('journal_load', lambda: bench_journal_load(
+            (1_000, 10_000) if quick else (1_000, 10_000, 100_000), seed=seed)),
+        ('animation_ticks', lambda: bench_animation_ticks(5 if quick else 20, seed=seed)),
+        ('window', lambda: bench_window(100 if quick else 1000, 2 if quick else 5))
+    ]
+
+    # The GUI benchmarks are skipped on a Python without Tk or without a display
+    try:
+        import tkinter
+        gui_errors = (tkinter.TclError,)
+        gui_missing = None
+    except ImportError as e:
+        gui_errors = ()
+        gui_missing = str(e)
+
+    metrics, skipped = {}, {}
+    for name, bench in benchmarks:
+        if name in GUI_BENCHMARKS and gui_missing:
+            skipped[name] = gui_missing
+            continue
+        try:
+            metrics.update(bench())
+        except gui_errors as e:
+            skipped[name] = str(e)
+    return {
+        'schema': SCHEMA_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': quick,
+        'metrics': metrics,
+        'skipped': skipped
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.5) -> List[dict]:
+    """Compare each metric with the baseline; ``regressed`` marks changes past ``tolerance``."""
+    rows = []
+    for name, current in report['metrics'].items():
+        previous = baseline.get('metrics', {}).get(name)
+        if previous is None or not previous['value']:
+            continue
+        change = current['value'] / previous['value'] - 1
+        worse = -change if current['better'] == 'higher' else change
+        rows.append({
+            'name': name,
+            'baseline': previous['value'],
+            'current': current['value'],
+            'change': change,
+            'regressed': worse > tolerance
+        })
+    return rows
+
+
+def load_report(path: str) -> Optional[dict]:
+    """Read a saved report, or None if the file does not exist."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_report(report: dict, path: str):
+    """Write a report as indented JSON."""
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv=None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Rock-Paper-Scissors benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads for a fast check")
+    parser.add_argument("--seed", type=int, default=0, help="seed for generated rounds")
+    parser.add_argument("--output", default=None, help="write the JSON report to this file")
+    parser.add_argument("--json", action="store_true", help="print the JSON report instead of a table")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline report to compare with")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed slowdown before a metric counts as a regression (default: 0.5)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.quick, args.seed)
+    if args.output:
+        save_report(report, args.output)
+
+    baseline = load_report(args.baseline)
+    if baseline and baseline.get('quick') != report['quick']:
+        print("⚠️ Baseline was recorded with a different --quick setting; not comparing.",
+              file=sys.stderr)
+        baseline = None
+    rows = compare(report, baseline, args.tolerance) if baseline else []
+    if args.json:
+        json.dump(dict(report, comparison=rows), sys.stdout, indent=2, sort_keys=True)
+        print()
+    else:
+        for name, figure in sorted(report['metrics'].items()):
+            print(f"{name:<34}{figure['value']:>16,.2f} {figure['unit']}")
+        for name, reason in report['skipped'].items():
+            print(f"⏭️ Skipped {name}: {reason}")
+        for row in rows:
+            flag = "❌ REGRESSION" if row['regressed'] else "✅"
+            print(f"{flag} {row['name']}: {row['baseline']:,.2f} -> {row['current']:,.2f} "
+                  f"({row['change']:+.1%})")
+
+    if args.save_baseline and report['skipped']:
+        # A baseline without the GUI metrics would stop them from ever being compared
+        print(f"⚠️ Not saving a baseline without {', '.join(report['skipped'])}; "
+              f"run under Xvfb (xvfb-run python benchmarks.py --save-baseline).", file=sys.stderr)
+        return 2
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        print(f"💾 Baseline saved to {args.baseline}", file=sys.stderr)
+    return 1 if any(row['regressed'] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
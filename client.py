@@ -0,0 +1,90 @@
+"""
+Rock-Paper-Scissors Match Client
+asyncio client for the match server protocol (see ``server.py``).
+"""
+
+import asyncio
+from typing import List, Tuple
+
+from engine import Choice, GameResult
+from server import DEFAULT_HOST, DEFAULT_POOL, DEFAULT_PORT, make_commitment
+
+_CHOICES = {choice.value: choice for choice in Choice}
+_RESULTS = {result.value: result for result in GameResult}
+
+
+class MatchError(Exception):
+    """The server rejected a command or the match ended."""
+
+
+class MatchEnded(MatchError):
+    """The opponent left, ending the match."""
+
+
+class MatchClient:
+    """One player's connection to a match server."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Remember the server address; call ``connect`` before playing."""
+        self.host = host
+        self.port = port
+        self.opponent = None
+        self._reader = None
+        self._writer = None
+
+    async def connect(self):
+        """Open the connection."""
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self):
+        """Say goodbye and close the connection."""
+        if self._writer is not None:
+            try:
+                self._send("QUIT")
+                self._writer.close()
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._writer = None
+
+    def _send(self, line: str):
+        self._writer.write(line.encode('ascii') + b'\n')
+
+    async def _expect(self, *keywords: str) -> List[str]:
+        """Wait for a line starting with one of ``keywords``."""
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                raise MatchError("connection closed by server")
+            words = line.decode('ascii').split()
+            if not words:
+                continue
+            if words[0] in keywords:
+                return words
+            if words[0] == 'ERROR':
+                raise MatchError(' '.join(words[1:]))
+            if words[0] == 'LEFT':
+                self.opponent = None
+                raise MatchEnded("opponent left the match")
+
+    async def join(self, name: str, pool: str = DEFAULT_POOL) -> str:
+        """Enter matchmaking and wait until paired; returns the opponent's name."""
+        self._send(f"JOIN {name} {pool}")
+        words = await self._expect('MATCH')
+        self.opponent = words[2] if len(words) > 2 else '?'
+        return self.opponent
+
+    async def play(self, choice: Choice) -> Tuple[GameResult, Choice]:
+        """Commit, reveal and return ``(result, opponent_choice)`` for one round."""
+        digest, nonce = make_commitment(choice)
+        self._send(f"COMMIT {digest}")
+        await self._expect('REVEAL')
+        self._send(f"OPEN {choice.value} {nonce}")
+        words = await self._expect('RESULT')
+        return _RESULTS[words[1]], _CHOICES[words[2]]
+
+    async def leave(self):
+        """Leave the current match."""
+        self._send("LEAVE")
+        await self._expect('LEFT')
+        self.opponent = None
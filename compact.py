@@ -0,0 +1,196 @@
+"""
+Rock-Paper-Scissors Compact Records
+Integer-coded choices, results, rounds and stats for bulk data.
+
+The ``Choice`` and ``GameResult`` enums are right for the GUI and the
+public API.  They are heavy to keep by the million, though: a ``Round`` of
+three enum references takes about 64 bytes plus a list slot.  Here a
+choice and a result are small ints (the engine's ``CHOICE_ORDER`` and
+``RESULT_ORDER`` positions), and a round is the packed code
+``player * 3 + computer``, so a bulk history needs one byte per round.
+``PackedRound`` and ``StatsRecord`` convert to and from the enum types at
+the API boundary.
+
+For files and the wire, round codes are packed two per byte (one per
+nibble) behind a small header.  ``iter_rounds`` decodes such data a chunk
+at a time, so a memory-mapped file is never unpacked whole.  Stats records
+pack into 24 bytes.
+"""
+
+import operator
+import struct
+from typing import Iterator, NamedTuple
+
+from engine import (CHOICE_CODES, CHOICE_ORDER, RESULT_CODES, RESULT_ORDER, Choice,
+                    GameResult, GameStats, Round)
+
+# Choice and result codes
+ROCK, PAPER, SCISSORS = (CHOICE_CODES[choice] for choice in (Choice.ROCK, Choice.PAPER, Choice.SCISSORS))
+TIE, WIN, LOSE = (RESULT_CODES[result] for result in (GameResult.TIE, GameResult.WIN, GameResult.LOSE))
+
+# Result code of each of the 9 round codes, as a translate() table
+RESULT_OF_ROUND = bytes(((code // 3) - (code % 3)) % 3 for code in range(9)) + bytes(247)
+
+# Player's choice code of each of the 9 round codes, as a translate() table
+PLAYER_OF_ROUND = bytes(code // 3 for code in range(9)) + bytes(247)
+
+# Nibble packing tables
+_HIGH_NIBBLE = bytes((code << 4) & 0xFF for code in range(256))
+_UNPACK_HIGH = bytes(byte >> 4 for byte in range(256))
+_UNPACK_LOW = bytes(byte & 0x0F for byte in range(256))
+
+_ROUNDS_HEADER = struct.Struct('<4sBQ')  # magic, version, round count
+_ROUNDS_MAGIC = b'RPSR'
+_ROUNDS_VERSION = 1
+
+
+def result_code(player: int, computer: int) -> int:
+    """Result code of a round from the player's choice and computer's choice codes."""
+    return (player - computer) % 3
+
+
+class PackedRound(int):
+    """One round as the int ``player * 3 + computer`` (the result is derived)."""
+
+    __slots__ = ()
+
+    def __new__(cls, code: int) -> "PackedRound":
+        """Wrap a round code; codes outside 0-8 raise ``ValueError``."""
+        value = int.__new__(cls, code)
+        if not 0 <= value < 9:
+            raise ValueError(f"invalid round code {value}")
+        return value
+
+    @classmethod
+    def from_codes(cls, player: int, computer: int) -> "PackedRound":
+        """Pack two choice codes (0-2 each)."""
+        if not (0 <= player < 3 and 0 <= computer < 3):
+            raise ValueError(f"invalid choice codes {player}, {computer}")
+        return cls(player * 3 + computer)
+
+    @classmethod
+    def from_choices(cls, player_choice: Choice, computer_choice: Choice) -> "PackedRound":
+        """Pack two enum choices."""
+        return cls(CHOICE_CODES[player_choice] * 3 + CHOICE_CODES[computer_choice])
+
+    @classmethod
+    def from_round(cls, round_: Round) -> "PackedRound":
+        """Pack an engine ``Round``."""
+        return cls.from_choices(round_.player, round_.computer)
+
+    @property
+    def player(self) -> int:
+        """The player's choice code."""
+        return self // 3
+
+    @property
+    def computer(self) -> int:
+        """The computer's choice code."""
+        return self % 3
+
+    @property
+    def result(self) -> int:
+        """The result code from the player's point of view."""
+        return RESULT_OF_ROUND[self]
+
+    def to_round(self) -> Round:
+        """Unpack into an engine ``Round`` of enums."""
+        return Round(CHOICE_ORDER[self // 3], CHOICE_ORDER[self % 3], RESULT_ORDER[RESULT_OF_ROUND[self]])
+
+
+class StatsRecord(NamedTuple):
+    """Immutable win/loss/tie counts (a tuple, so no per-instance ``__dict__``)."""
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+
+    _PACKED = struct.Struct('<3Q')
+
+    @property
+    def total_games(self) -> int:
+        """Number of rounds counted."""
+        return self.wins + self.losses + self.ties
+
+    @property
+    def win_rate(self) -> float:
+        """Win percentage."""
+        total = self.total_games
+        return self.wins / total * 100 if total else 0.0
+
+    def add(self, result: int) -> "StatsRecord":
+        """A new record with one more round of result code ``result``."""
+        if result == WIN:
+            return self._replace(wins=self.wins + 1)
+        if result == LOSE:
+            return self._replace(losses=self.losses + 1)
+        return self._replace(ties=self.ties + 1)
+
+    @classmethod
+    def from_rounds(cls, codes: bytes) -> "StatsRecord":
+        """Count a run of packed round codes at C speed."""
+        results = bytes(codes).translate(RESULT_OF_ROUND)
+        return cls(results.count(WIN), results.count(LOSE), results.count(TIE))
+
+    @classmethod
+    def from_stats(cls, stats: GameStats) -> "StatsRecord":
+        """Freeze a ``GameStats``."""
+        return cls(stats.wins, stats.losses, stats.ties)
+
+    def to_stats(self) -> GameStats:
+        """Thaw into a mutable ``GameStats``."""
+        return GameStats(wins=self.wins, losses=self.losses, ties=self.ties,
+                         total_games=self.total_games)
+
+    def pack(self) -> bytes:
+        """Serialize as 24 bytes."""
+        return self._PACKED.pack(*self)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "StatsRecord":
+        """Read a record written by ``pack``."""
+        return cls(*cls._PACKED.unpack(data))
+
+
+def pack_rounds(codes: bytes) -> bytes:
+    """Serialize packed round codes at two rounds per byte, behind a header."""
+    codes = bytes(codes)
+    if codes.translate(None, bytes(range(9))):
+        raise ValueError("round codes must be 0-8")
+    high = codes[0::2].translate(_HIGH_NIBBLE)
+    low = codes[1::2]
+    if len(low) < len(high):
+        low += b'\x00'
+    body = bytes(map(operator.or_, high, low))
+    return _ROUNDS_HEADER.pack(_ROUNDS_MAGIC, _ROUNDS_VERSION, len(codes)) + body
+
+
+def unpack_rounds(data: bytes) -> bytes:
+    """Read round codes (one byte each) from ``pack_rounds`` output."""
+    return b''.join(iter_rounds(data))
+
+
+def iter_rounds(data, chunk_rounds: int = 1 << 16) -> Iterator[bytes]:
+    """Read round codes from ``pack_rounds`` output, up to ``chunk_rounds`` at a time.
+
+    ``data`` can be any buffer, such as an ``mmap`` of a round file; only
+    the current chunk is copied and decoded.
+    """
+    magic, version, count = _ROUNDS_HEADER.unpack_from(data)
+    if magic != _ROUNDS_MAGIC or version != _ROUNDS_VERSION:
+        raise ValueError("not a packed round file")
+    if len(data) - _ROUNDS_HEADER.size != (count + 1) // 2:
+        raise ValueError("packed round data is truncated")
+    chunk_bytes = max(1, chunk_rounds // 2)
+    offset = _ROUNDS_HEADER.size
+    remaining = count
+    while remaining > 0:
+        body = bytes(data[offset:offset + chunk_bytes])
+        offset += len(body)
+        codes = bytearray(len(body) * 2)
+        codes[0::2] = body.translate(_UNPACK_HIGH)
+        codes[1::2] = body.translate(_UNPACK_LOW)
+        del codes[remaining:]  # Padding nibble of an odd count
+        if codes.translate(None, bytes(range(9))):
+            raise ValueError("round codes must be 0-8")
+        remaining -= len(codes)
+        yield bytes(codes)
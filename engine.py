@@ -0,0 +1,183 @@
+"""
+Rock-Paper-Scissors Engine
+Headless game core: rules, round resolution, statistics and opponents.
+
+This module never imports tkinter, so it can be used from simulations,
+servers and tests where no display is available.
+"""
+
+import random
+from enum import Enum
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+
+class Choice(Enum):
+    """Game choices enumeration."""
+    ROCK = "rock"
+    PAPER = "paper"
+    SCISSORS = "scissors"
+
+
+class GameResult(Enum):
+    """Game result enumeration."""
+    WIN = "win"
+    LOSE = "lose"
+    TIE = "tie"
+
+
+# Game rules mapping: each choice beats the choice it maps to
+RULES = {
+    Choice.ROCK: Choice.SCISSORS,
+    Choice.SCISSORS: Choice.PAPER,
+    Choice.PAPER: Choice.ROCK
+}
+
+# Every (player, computer) pair resolved once, so a round is a single lookup
+_OUTCOMES = {
+    (player, computer): (
+        GameResult.TIE if player == computer
+        else GameResult.WIN if RULES[player] == computer
+        else GameResult.LOSE
+    )
+    for player in Choice
+    for computer in Choice
+}
+
+
+# Integer encodings used by batch and bulk code paths.  Results are ordered
+# so that ``(player - computer) % 3`` is the result code of a round.
+CHOICE_ORDER = (Choice.ROCK, Choice.PAPER, Choice.SCISSORS)
+CHOICE_CODES = {choice: code for code, choice in enumerate(CHOICE_ORDER)}
+RESULT_ORDER = (GameResult.TIE, GameResult.WIN, GameResult.LOSE)
+RESULT_CODES = {result: code for code, result in enumerate(RESULT_ORDER)}
+
+
+def determine_winner(player_choice: Choice, computer_choice: Choice) -> GameResult:
+    """Determine the result of a round from the player's point of view."""
+    return _OUTCOMES[(player_choice, computer_choice)]
+
+
+@dataclass
+class GameStats:
+    """Player statistics."""
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    total_games: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        """Calculate win percentage."""
+        if self.total_games == 0:
+            return 0.0
+        return (self.wins / self.total_games) * 100
+
+    def record(self, result: GameResult):
+        """Count a single round result."""
+        self.total_games += 1
+
+        if result is GameResult.WIN:
+            self.wins += 1
+        elif result is GameResult.LOSE:
+            self.losses += 1
+        else:
+            self.ties += 1
+
+    def merge(self, other: "GameStats") -> "GameStats":
+        """Add another set of counters into this one and return self."""
+        self.wins += other.wins
+        self.losses += other.losses
+        self.ties += other.ties
+        self.total_games += other.total_games
+        return self
+
+    def to_dict(self) -> dict:
+        """Return the counters as a plain dict for persistence."""
+        return {
+            'wins': self.wins,
+            'losses': self.losses,
+            'ties': self.ties,
+            'total_games': self.total_games
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameStats":
+        """Build stats from a persisted dict, ignoring unknown keys."""
+        return cls(
+            wins=int(data.get('wins', 0)),
+            losses=int(data.get('losses', 0)),
+            ties=int(data.get('ties', 0)),
+            total_games=int(data.get('total_games', 0))
+        )
+
+
+class Round(NamedTuple):
+    """Outcome of a single resolved round."""
+    player: Choice
+    computer: Choice
+    result: GameResult
+
+
+class Opponent:
+    """Base class for computer opponents.
+
+    ``choose`` is called before the player's move is known and ``observe``
+    after the round is resolved, so adaptive opponents can learn.
+    """
+
+    name = "opponent"
+
+    def choose(self) -> Choice:
+        """Pick the computer's next move."""
+        raise NotImplementedError
+
+    def observe(self, player_choice: Choice, computer_choice: Choice):
+        """Learn from a finished round (no-op by default)."""
+
+
+class RandomOpponent(Opponent):
+    """Opponent that picks uniformly at random."""
+
+    name = "random"
+
+    CHOICES = tuple(Choice)
+
+    def __init__(self, rng=None):
+        """Use the given ``random.Random``-like source, or the global one."""
+        self.rng = rng if rng is not None else random
+
+    def choose(self) -> Choice:
+        """Pick the computer's next move."""
+        return self.rng.choice(self.CHOICES)
+
+
+class GameEngine:
+    """Plays rounds against a pluggable opponent and accumulates stats."""
+
+    def __init__(self, opponent=None, stats: Optional[GameStats] = None):
+        """Initialize the engine with an ``Opponent`` (random by default)."""
+        self.opponent = opponent if opponent is not None else RandomOpponent()
+        self.stats = stats if stats is not None else GameStats()
+
+    def computer_choice(self) -> Choice:
+        """Ask the opponent for its next move."""
+        return self.opponent.choose()
+
+    def play_round(self, player_choice: Choice,
+                   computer_choice: Optional[Choice] = None) -> Round:
+        """Resolve a round, record it in the stats and return the outcome."""
+        if computer_choice is None:
+            computer_choice = self.opponent.choose()
+        result = _OUTCOMES[(player_choice, computer_choice)]
+        self.stats.record(result)
+        self.opponent.observe(player_choice, computer_choice)
+        return Round(player_choice, computer_choice, result)
+
+    def observe(self, player_choice: Choice, computer_choice: Choice):
+        """Report a round resolved outside ``play_round`` to the opponent."""
+        self.opponent.observe(player_choice, computer_choice)
+
+    def reset_stats(self):
+        """Start counting from zero."""
+        self.stats = GameStats()
@@ -0,0 +1,292 @@
+"""
+Rock-Paper-Scissors Strategy Evaluation
+Scores candidate opponent strategies offline against recorded player histories.
+
+The pipeline is a chain of generators, so memory does not grow with the
+log size.  A reader streams ``(player, choice codes)`` chunks from a round
+log:
+- a stats journal (JSON lines), memory-mapped and read line by line;
+- a packed round file (``compact.pack_rounds``), memory-mapped and decoded
+  a chunk at a time;
+- the SQLite stats database (every profile), read with a cursor;
+- a session log (small, so it is read whole).
+``StrategyEvaluator`` replays each player's moves against a fresh instance
+of every candidate strategy in one pass.  Every reader yields a player's
+chunks back to back, so only the current player's strategies are kept.
+Results come from a table built with ``determine_winner`` and are counted
+at C speed per chunk.  Every ``curve_every`` rounds it yields a point of
+the cumulative win-rate curves.
+
+The player's recorded moves answered the original computer, not the
+candidate, so the scores estimate how each strategy would have done
+against that move sequence.
+"""
+
+import argparse
+import csv
+import json
+import mmap
+import os
+import random
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from compact import PLAYER_OF_ROUND, iter_rounds
+from engine import CHOICE_CODES, CHOICE_ORDER, RESULT_CODES, GameResult, GameStats, determine_winner
+from replay import SessionLog
+from strategies import STRATEGIES, create_opponent
+
+DEFAULT_CHUNK_ROUNDS = 1 << 14
+
+# Result code of each (strategy * 3 + player) pair, from the strategy's point of view
+STRATEGY_RESULT = bytes(
+    RESULT_CODES[determine_winner(strategy_choice, player_choice)]
+    for strategy_choice in CHOICE_ORDER
+    for player_choice in CHOICE_ORDER
+) + bytes(247)
+_WIN = RESULT_CODES[GameResult.WIN]
+_LOSE = RESULT_CODES[GameResult.LOSE]
+_TIE = RESULT_CODES[GameResult.TIE]
+
+# Choice code of each journal ``player`` value, and of each session digit ('0'-'8')
+_CHOICE_VALUES = {choice.value: CHOICE_CODES[choice] for choice in CHOICE_ORDER}
+_PLAYER_OF_DIGIT = bytes(48) + PLAYER_OF_ROUND[:9] + bytes(199)
+_SQLITE_MAGIC = b'SQLite format 3\x00'
+_PACKED_MAGIC = b'RPSR'
+
+Chunk = Tuple[str, bytes]  # (player, choice codes 0-2)
+
+
+class CurvePoint(NamedTuple):
+    """Cumulative win rate of each strategy after ``rounds`` rounds."""
+    rounds: int
+    win_rates: Dict[str, float]
+
+
+@contextmanager
+def _mapped(path: str):
+    """The file's bytes as a read-only mmap, or the open file where mapping fails."""
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # Empty files and pipes cannot be mapped
+            yield f
+            return
+        try:
+            yield data
+        finally:
+            data.close()
+
+
+def read_journal(path: str, player: str, chunk_rounds: int = DEFAULT_CHUNK_ROUNDS) -> Iterator[Chunk]:
+    """Stream the player's moves from a stats journal.
+
+    As when the journal is loaded, reading stops at a torn or corrupt line.
+    """
+    with _mapped(path) as data:
+        codes = bytearray()
+        for line in iter(data.readline, b''):
+            try:
+                codes.append(_CHOICE_VALUES[json.loads(line)['player']])
+            except (ValueError, KeyError, TypeError):
+                break
+            if len(codes) >= chunk_rounds:
+                yield player, bytes(codes)
+                codes.clear()
+        if codes:
+            yield player, bytes(codes)
+
+
+def read_packed(path: str, player: str, chunk_rounds: int = DEFAULT_CHUNK_ROUNDS) -> Iterator[Chunk]:
+    """Stream the player's moves from a packed round file."""
+    with _mapped(path) as data:
+        if not isinstance(data, mmap.mmap):
+            data = data.read()
+        for codes in iter_rounds(data, chunk_rounds):
+            yield player, codes.translate(PLAYER_OF_ROUND)
+
+
+def read_session(path: str, chunk_rounds: int = DEFAULT_CHUNK_ROUNDS) -> Iterator[Chunk]:
+    """Stream the player's moves from a session log, named after its file."""
+    player = os.path.splitext(os.path.basename(path))[0]
+    moves = SessionLog.load(path).rounds.encode('ascii').translate(_PLAYER_OF_DIGIT)
+    for start in range(0, len(moves), chunk_rounds):
+        yield player, moves[start:start + chunk_rounds]
+
+
+def read_database(path: str, chunk_rounds: int = DEFAULT_CHUNK_ROUNDS,
+                  profiles: Optional[Sequence[str]] = None) -> Iterator[Chunk]:
+    """Stream every profile's moves (or only ``profiles``) from the SQLite stats database."""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(
+            "SELECT profiles.name, rounds.code FROM rounds "
+            "JOIN profiles ON profiles.id = rounds.profile_id "
+            "ORDER BY rounds.profile_id, rounds.seq")
+        wanted = set(profiles) if profiles else None
+        player, codes = None, bytearray()
+        while True:
+            rows = cursor.fetchmany(chunk_rounds)
+            if not rows:
+                break
+            for name, code in rows:
+                if name != player:
+                    if codes:
+                        yield player, bytes(codes).translate(PLAYER_OF_ROUND)
+                        codes.clear()
+                    player = name
+                if wanted is None or name in wanted:
+                    codes.append(code)
+            if len(codes) >= chunk_rounds:
+                yield player, bytes(codes).translate(PLAYER_OF_ROUND)
+                codes.clear()
+        if codes:
+            yield player, bytes(codes).translate(PLAYER_OF_ROUND)
+    finally:
+        conn.close()
+
+
+def read_log(path: str, chunk_rounds: int = DEFAULT_CHUNK_ROUNDS) -> Iterator[Chunk]:
+    """Stream moves from any supported round log, recognized by its first bytes."""
+    if chunk_rounds < 1:
+        raise ValueError("chunk_rounds must be at least 1")
+    with open(path, 'rb') as f:
+        head = f.read(16)
+    if head.startswith(_SQLITE_MAGIC):
+        return read_database(path, chunk_rounds)
+    player = os.path.splitext(os.path.basename(path))[0]
+    if head.startswith(_PACKED_MAGIC):
+        return read_packed(path, player, chunk_rounds)
+    if head.startswith(b'{"seq"'):
+        return read_journal(path, player, chunk_rounds)
+    return read_session(path, chunk_rounds)
+
+
+class StrategyEvaluator:
+    """Plays recorded player moves against several strategies at once."""
+
+    def __init__(self, strategies: Sequence[str], seed: int = 0, curve_every: int = 10_000):
+        """Evaluate the named strategies; their random draws derive from ``seed``."""
+        for name in strategies:
+            if name not in STRATEGIES:
+                raise ValueError(f"unknown strategy {name!r}; choose from {', '.join(STRATEGIES)}")
+        if curve_every < 0:
+            raise ValueError("curve_every must not be negative")
+        self.strategies = list(strategies)
+        self.seed = seed
+        self.curve_every = curve_every
+        self.stats: Dict[str, GameStats] = {name: GameStats() for name in self.strategies}
+        self.rounds = 0
+        self.players = 0  # Runs of consecutive chunks from one player
+        self._player = None
+        self._opponents: List = []
+
+    def _opponents_for(self, player: str) -> list:
+        """Each strategy's opponent for ``player``, created fresh when the player changes."""
+        if player != self._player:
+            self._opponents = [create_opponent(name, random.Random(f"{self.seed}:{player}:{name}"))
+                               for name in self.strategies]
+            self._player = player
+            self.players += 1
+        return self._opponents
+
+    def feed(self, player: str, codes: bytes) -> Iterator[CurvePoint]:
+        """Play a chunk of one player's moves; yields any curve points reached."""
+        opponents = self._opponents_for(player)
+        position = 0
+        while position < len(codes):
+            end = len(codes)
+            if self.curve_every:
+                end = min(end, position + self.curve_every - self.rounds % self.curve_every)
+            self._play(opponents, [CHOICE_ORDER[code] for code in codes[position:end]])
+            self.rounds += end - position
+            position = end
+            if self.curve_every and self.rounds % self.curve_every == 0:
+                yield self.curve_point()
+
+    def _play(self, opponents: list, moves: List):
+        """Play ``moves`` against every strategy and count the results."""
+        codes = CHOICE_CODES
+        for name, opponent in zip(self.strategies, opponents):
+            choose, observe = opponent.choose, opponent.observe
+            pairs = bytearray()
+            append = pairs.append
+            for player_choice in moves:
+                computer_choice = choose()
+                observe(player_choice, computer_choice)
+                append(codes[computer_choice] * 3 + codes[player_choice])
+            results = pairs.translate(STRATEGY_RESULT)
+            stats = self.stats[name]
+            stats.wins += results.count(_WIN)
+            stats.losses += results.count(_LOSE)
+            stats.ties += results.count(_TIE)
+            stats.total_games += len(results)
+
+    def curve_point(self) -> CurvePoint:
+        """The current cumulative win rates."""
+        return CurvePoint(self.rounds, {name: stats.win_rate for name, stats in self.stats.items()})
+
+    def run(self, chunks: Iterable[Chunk]) -> Iterator[CurvePoint]:
+        """Consume a stream of chunks, yielding the curve as it grows and a final point."""
+        for player, codes in chunks:
+            yield from self.feed(player, codes)
+        if not self.curve_every or self.rounds % self.curve_every:
+            yield self.curve_point()
+
+
+def main():
+    """Command-line entry point: score strategies against one or more round logs."""
+    parser = argparse.ArgumentParser(description="Score opponent strategies against recorded rounds")
+    parser.add_argument("logs", nargs="+",
+                        help="round logs: stats journal, packed round file, session log or stats.db")
+    parser.add_argument("--strategies", nargs="+", default=sorted(STRATEGIES),
+                        choices=sorted(STRATEGIES), help="strategies to score (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the strategies' random draws")
+    parser.add_argument("--chunk-rounds", type=int, default=DEFAULT_CHUNK_ROUNDS,
+                        help="rounds read per chunk")
+    parser.add_argument("--curve-every", type=int, default=10_000,
+                        help="rounds between win-rate curve points (0 for only the final point)")
+    parser.add_argument("--curve", metavar="FILE", default=None,
+                        help="write the win-rate curves as CSV (streamed, one row per point)")
+    args = parser.parse_args()
+    if args.chunk_rounds < 1:
+        parser.error("--chunk-rounds must be at least 1")
+    if args.curve_every < 0:
+        parser.error("--curve-every must not be negative")
+
+    evaluator = StrategyEvaluator(args.strategies, args.seed, args.curve_every)
+    chunks = (chunk for path in args.logs for chunk in read_log(path, args.chunk_rounds))
+    curve_file = open(args.curve, 'w', newline='') if args.curve else None
+    start = time.perf_counter()
+    try:
+        writer = csv.writer(curve_file) if curve_file else None
+        if writer:
+            writer.writerow(['rounds'] + evaluator.strategies)
+        for point in evaluator.run(chunks):
+            if writer:
+                writer.writerow([point.rounds] + [f"{point.win_rates[name]:.3f}"
+                                                  for name in evaluator.strategies])
+    except (OSError, ValueError, KeyError, sqlite3.Error) as e:
+        print(f"Error reading round log: {e}")
+        sys.exit(1)
+    finally:
+        if curve_file:
+            curve_file.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"🧪 {evaluator.rounds:,} rounds from {evaluator.players} player(s) "
+          f"against {len(evaluator.strategies)} strategies")
+    for name, stats in sorted(evaluator.stats.items(), key=lambda item: item[1].win_rate, reverse=True):
+        print(f"  {name:>10}  W {stats.wins:>8,}  L {stats.losses:>8,}  T {stats.ties:>8,}  "
+              f"Win Rate {stats.win_rate:.1f}%")
+    rate = evaluator.rounds * len(evaluator.strategies) / elapsed if elapsed else 0.0
+    print(f"⏱️ {elapsed:.2f}s ({rate:,.0f} strategy rounds/s)")
+    if args.curve:
+        print(f"📈 Win-rate curves written to {args.curve}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Rock-Paper-Scissors GUI Load Driver
+Plays tens of thousands of rounds through the real Tk window.
+
+The driver clicks the choice buttons with ``event_generate`` (or presses
+the R/P/S keys) at a fixed rate.  While it runs, it samples:
+- memory (RSS) over time;
+- how many ``after`` callbacks are pending;
+- event-loop latency, from a probe timer that measures how late it fires.
+
+Every probe also checks that the choice buttons stay enabled (input during
+an animation is queued, not dropped) and that the queue stays within its
+limit.  The animation delays are scaled (to zero by
+default), so long sessions finish quickly.  The driver needs a display; on
+a headless machine, run it under Xvfb:
+``xvfb-run python guidriver.py --rounds 20000``.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tkinter as tk
+from typing import List, Tuple
+
+from engine import CHOICE_ORDER
+from instrument import percentile
+from main import RockPaperScissorsGame
+from storage import SQLiteBackend
+from strategies import STRATEGIES
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process, or 0 if it cannot be read."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # Peak rather than current RSS; kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class GuiLoadDriver:
+    """Injects input into a running game and records how the event loop copes."""
+
+    def __init__(self, game: RockPaperScissorsGame, rounds: int = 10_000, rate: float = 0.0,
+                 input_mode: str = 'button', probe_ms: int = 10, sample_every: float = 1.0,
+                 seed: int = 0):
+        """Drive ``game`` for ``rounds`` rounds at ``rate`` presses/s (0 = as fast as possible)."""
+        self.game = game
+        self.root = game.root
+        self.rounds = rounds
+        self.interval_ms = int(1000 / rate) if rate > 0 else 0
+        self.input_mode = input_mode
+        self.probe_ms = probe_ms
+        self.sample_every = sample_every
+        self.rng = random.Random(seed)
+
+        self.presses = 0
+        self.latencies: List[float] = []
+        self.samples: List[Tuple[float, int, int, int]] = []  # (elapsed, rounds, rss, pending after)
+        self.violations = 0
+        self.max_pending_after = 0
+        self._start = 0.0
+        self._next_sample = 0.0
+        self._probe_due = 0.0
+        self._finished = False
+
+    def _rounds_played(self) -> int:
+        return self.game.stats.total_games
+
+    def _pending_after(self) -> int:
+        """Number of ``after`` callbacks currently scheduled in Tcl."""
+        return len(self.root.tk.splitlist(self.root.tk.call('after', 'info')))
+
+    def run(self) -> dict:
+        """Run until ``rounds`` rounds are played and return the report."""
+        self._start = time.perf_counter()
+        self._next_sample = self._start
+        self._sample()
+        if self.input_mode == 'key':
+            self.root.focus_force()  # Generated key events go to the focus window
+        self.root.after(0, self._press)
+        self._probe_due = time.perf_counter() + self.probe_ms / 1000
+        self.root.after(self.probe_ms, self._probe)
+        self.root.mainloop()
+        return self.report()
+
+    def _press(self):
+        """Inject one choice, then schedule the next."""
+        if self._finished:
+            return
+        choice = self.rng.choice(CHOICE_ORDER)
+        if self.input_mode == 'key':
+            key = next(key for key, bound in self.game.KEY_BINDINGS.items() if bound == choice)
+            self.root.event_generate(f"<KeyPress-{key}>")
+        else:
+            button = self.game.choice_buttons[CHOICE_ORDER.index(choice)]
+            x, y = button.winfo_width() // 2, button.winfo_height() // 2
+            # The Tk button class only invokes when the pointer entered, pressed and released
+            button.event_generate("<Enter>", x=x, y=y)
+            button.event_generate("<ButtonPress-1>", x=x, y=y)
+            button.event_generate("<ButtonRelease-1>", x=x, y=y)
+        self.presses += 1
+        self.root.after(self.interval_ms, self._press)
+
+    def _probe(self):
+        """Measure event-loop latency and check the buttons and input queue."""
+        now = time.perf_counter()
+        self.latencies.append(max(0.0, now - self._probe_due))
+
+        states = {button.cget('state') for button in self.game.choice_buttons}
+        if states != {'normal'} or len(self.game.pending_choices) > self.game.MAX_QUEUED_INPUTS:
+            self.violations += 1
+
+        if now >= self._next_sample:
+            self._sample()
+        if self._rounds_played() >= self.rounds:
+            self._finish()
+            return
+        self._probe_due = time.perf_counter() + self.probe_ms / 1000
+        self.root.after(self.probe_ms, self._probe)
+
+    def _sample(self):
+        """Record memory and backlog at this point in the run."""
+        pending = self._pending_after()
+        self.max_pending_after = max(self.max_pending_after, pending)
+        self.samples.append((time.perf_counter() - self._start, self._rounds_played(),
+                             rss_bytes(), pending))
+        self._next_sample += self.sample_every
+
+    def _finish(self):
+        """Stop injecting input and leave the main loop."""
+        self._finished = True
+        self._sample()
+        self.root.quit()
+
+    def report(self) -> dict:
+        """Throughput, latency percentiles, memory growth and consistency figures."""
+        elapsed = self.samples[-1][0] if self.samples else 0.0
+        rounds = self._rounds_played()
+        latencies = sorted(self.latencies)
+        first_rss, last_rss = self.samples[0][2], self.samples[-1][2]
+        return {
+            'rounds': rounds,
+            'presses': self.presses,
+            'rejected_inputs': self.game.rejected_inputs,
+            'elapsed_s': elapsed,
+            'rounds_per_sec': rounds / elapsed if elapsed else 0.0,
+            'latency_p50_ms': percentile(latencies, 0.50) * 1000,
+            'latency_p99_ms': percentile(latencies, 0.99) * 1000,
+            'latency_max_ms': (latencies[-1] if latencies else 0.0) * 1000,
+            'rss_start_mb': first_rss / 2**20,
+            'rss_end_mb': last_rss / 2**20,
+            'rss_growth_bytes_per_round': (last_rss - first_rss) / rounds if rounds else 0.0,
+            'max_pending_after': self.max_pending_after,
+            'state_violations': self.violations,
+            'queued_inputs_left': len(self.game.pending_choices),
+            'samples': [
+                {'elapsed_s': t, 'rounds': n, 'rss_mb': rss / 2**20, 'pending_after': pending}
+                for t, n, rss, pending in self.samples
+            ]
+        }
+
+
+def main():
+    """Command-line entry point for the GUI load driver."""
+    parser = argparse.ArgumentParser(description="Stress the Tk GUI with scripted input")
+    parser.add_argument("--rounds", type=int, default=10_000, help="rounds to play")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="presses per second (default: 0, as fast as possible)")
+    parser.add_argument("--input", choices=('button', 'key'), default='button',
+                        help="click the buttons or press R/P/S")
+    parser.add_argument("--speed", type=float, default=0.0,
+                        help="animation delay scale: 1 is real time, 0 (default) skips the waits")
+    parser.add_argument("--turbo", action="store_true", help="play in turbo mode")
+    parser.add_argument("--opponent", choices=sorted(STRATEGIES), default="random")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the computer and the input")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args()
+
+    try:
+        game = RockPaperScissorsGame(opponent=args.opponent, turbo=args.turbo,
+                                     backend=SQLiteBackend(':memory:', legacy_paths=[]),
+                                     seed=args.seed)
+    except tk.TclError as e:
+        print(f"Error opening the game window (run under xvfb-run when headless): {e}")
+        sys.exit(1)
+
+    game.animation_timeline = game.animation_timeline.scaled(args.speed)
+    # Let the window map and the lazy panels appear before injecting input
+    while not game.panels_built or game.writer is None:
+        game.root.update()
+
+    driver = GuiLoadDriver(game, args.rounds, args.rate, args.input, seed=args.seed)
+    report = driver.run()
+    game.writer.close()
+    game.pump.stop()
+    game.root.destroy()
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    print(f"🎮 {report['rounds']:,} rounds in {report['elapsed_s']:.1f}s "
+          f"({report['rounds_per_sec']:,.0f} rounds/s), {report['presses']:,} presses, "
+          f"{report['rejected_inputs']:,} refused by a full input queue")
+    print(f"⏱️ Event-loop latency p50 {report['latency_p50_ms']:.2f} ms, "
+          f"p99 {report['latency_p99_ms']:.2f} ms, max {report['latency_max_ms']:.2f} ms")
+    print(f"🧠 RSS {report['rss_start_mb']:.1f} -> {report['rss_end_mb']:.1f} MB "
+          f"({report['rss_growth_bytes_per_round']:.1f} bytes/round), "
+          f"max pending after callbacks {report['max_pending_after']}")
+    status = "✅" if report['state_violations'] == 0 else "❌"
+    print(f"{status} Disabled buttons or overfull queue: {report['state_violations']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Rock-Paper-Scissors Round History
+Compact, indexed record of every round played.
+
+Each round is stored as a single byte, ``player_code * 3 + computer_code``,
+in a ``bytearray``; the result can be derived from those two codes.  Small
+incremental indexes sit on top:
+
+* running totals and a 3x3 player/computer outcome matrix,
+* current and longest streak per result,
+* cumulative result counts at every ``BLOCK``-th round.
+
+A rolling-window query such as "win rate over the last N rounds" reads two
+block checkpoints and scans at most ``BLOCK`` bytes at C speed with
+``bytes.translate``, so its cost does not grow with the history.  The
+indexes add well under 0.1 byte per round.
+"""
+
+from array import array
+from typing import Dict, Iterator, Tuple
+
+from compact import RESULT_OF_ROUND, pack_rounds, unpack_rounds
+from engine import (Choice, GameResult, GameStats, Round, RULES, CHOICE_CODES, CHOICE_ORDER,
+                    RESULT_CODES, RESULT_ORDER)
+
+# Rounds per prefix-count checkpoint
+BLOCK = 256
+
+# Result code for each of the 9 round codes, as a translate() table
+_RESULT_OF = RESULT_OF_ROUND
+
+_WIN = RESULT_CODES[GameResult.WIN]
+_LOSE = RESULT_CODES[GameResult.LOSE]
+_TIE = RESULT_CODES[GameResult.TIE]
+
+
+class RoundHistory:
+    """Append-only round history with O(1) streak and window queries."""
+
+    def __init__(self):
+        """Create an empty history."""
+        self._rounds = bytearray()
+        self._pairs = [0] * 9
+        self._totals = [0, 0, 0]
+        # Cumulative result counts before round 0, BLOCK, 2*BLOCK, ...
+        self._checkpoints = [array('Q', [0]) for _ in range(3)]
+        self._streak_result = None
+        self._streak_length = 0
+        self._longest = [0, 0, 0]
+
+    def __len__(self) -> int:
+        return len(self._rounds)
+
+    def __getitem__(self, index: int) -> Round:
+        code = self._rounds[index]
+        return Round(CHOICE_ORDER[code // 3], CHOICE_ORDER[code % 3], RESULT_ORDER[_RESULT_OF[code]])
+
+    def __iter__(self) -> Iterator[Round]:
+        for index in range(len(self._rounds)):
+            yield self[index]
+
+    def append(self, player_choice: Choice, computer_choice: Choice):
+        """Record a round and update every index."""
+        self._append_code(CHOICE_CODES[player_choice] * 3 + CHOICE_CODES[computer_choice])
+
+    def _append_code(self, code: int):
+        """Record a round given its packed code."""
+        result = _RESULT_OF[code]
+        self._rounds.append(code)
+        self._pairs[code] += 1
+        self._totals[result] += 1
+
+        if result == self._streak_result:
+            self._streak_length += 1
+        else:
+            self._streak_result = result
+            self._streak_length = 1
+        if self._streak_length > self._longest[result]:
+            self._longest[result] = self._streak_length
+
+        if len(self._rounds) % BLOCK == 0:
+            for counts, total in zip(self._checkpoints, self._totals):
+                counts.append(total)
+
+    @property
+    def stats(self) -> GameStats:
+        """Totals over the whole history."""
+        return GameStats(wins=self._totals[_WIN], losses=self._totals[_LOSE],
+                         ties=self._totals[_TIE], total_games=len(self._rounds))
+
+    @property
+    def current_streak(self) -> Tuple[GameResult, int]:
+        """The result of the latest rounds and how many times in a row."""
+        if self._streak_result is None:
+            return GameResult.TIE, 0
+        return RESULT_ORDER[self._streak_result], self._streak_length
+
+    def longest_streak(self, result: GameResult = GameResult.WIN) -> int:
+        """Longest run of consecutive rounds with the given result."""
+        return self._longest[RESULT_CODES[result]]
+
+    def outcome_matrix(self) -> Dict[Choice, Dict[Choice, int]]:
+        """Round counts indexed as ``matrix[player_choice][computer_choice]``."""
+        return {
+            player: {computer: self._pairs[p * 3 + c] for c, computer in enumerate(CHOICE_ORDER)}
+            for p, player in enumerate(CHOICE_ORDER)
+        }
+
+    def choice_win_rate(self, choice: Choice) -> float:
+        """Win percentage of rounds where the player picked ``choice``."""
+        p = CHOICE_CODES[choice]
+        row = self._pairs[p * 3:p * 3 + 3]
+        played = sum(row)
+        if played == 0:
+            return 0.0
+        beaten = CHOICE_CODES[RULES[choice]]
+        return row[beaten] / played * 100
+
+    def _count_before(self, end: int, result: int) -> int:
+        """Number of rounds with ``result`` among the first ``end`` rounds."""
+        block = end // BLOCK
+        count = self._checkpoints[result][block]
+        start = block * BLOCK
+        if start < end:
+            tail = self._rounds[start:end].translate(_RESULT_OF)
+            count += tail.count(result)
+        return count
+
+    def window_stats(self, rounds: int) -> GameStats:
+        """Totals over the last ``rounds`` rounds (or all, if fewer)."""
+        if rounds <= 0:
+            raise ValueError("window must be at least 1 round")
+        end = len(self._rounds)
+        start = max(0, end - rounds)
+        wins = self._count_before(end, _WIN) - self._count_before(start, _WIN)
+        losses = self._count_before(end, _LOSE) - self._count_before(start, _LOSE)
+        total = end - start
+        return GameStats(wins=wins, losses=losses, ties=total - wins - losses, total_games=total)
+
+    def win_rate(self, last: int = 0) -> float:
+        """Win percentage over the last ``last`` rounds, or all rounds if 0."""
+        if last <= 0:
+            return self.stats.win_rate
+        return self.window_stats(last).win_rate
+
+    def to_bytes(self) -> bytes:
+        """Serialize the history as one byte per round."""
+        return bytes(self._rounds)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RoundHistory":
+        """Rebuild a history, and its indexes, from ``to_bytes`` output."""
+        history = cls()
+        for code in data:
+            if code > 8:
+                raise ValueError(f"invalid round code {code}")
+            history._append_code(code)
+        return history
+
+    def pack(self) -> bytes:
+        """Serialize the history at two rounds per byte (see ``compact.pack_rounds``)."""
+        return pack_rounds(self._rounds)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "RoundHistory":
+        """Rebuild a history from ``pack`` output."""
+        return cls.from_bytes(unpack_rounds(data))
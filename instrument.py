@@ -0,0 +1,155 @@
+"""
+Rock-Paper-Scissors Instrumentation
+Opt-in timers, counters and ``after`` drift for the GUI's hot paths.
+
+Nothing here runs unless instrumentation is switched on: ``wrap`` replaces
+the chosen methods on one object with timing wrappers, and ``wrap_after``
+does the same for a Tk root's ``after`` so every scheduled callback reports
+how late it actually ran.  When instrumentation is off the originals are
+never touched, so the disabled cost is zero.  Spans and drift samples can
+be exported as Chrome trace-event JSON (open it in ``chrome://tracing`` or
+https://ui.perfetto.dev).  ``percentile`` is shared with the benchmark and
+load tools.  This module does not import tkinter.
+"""
+
+import json
+import math
+import os
+import time
+from collections import deque
+from typing import Dict, List
+
+_PID = os.getpid()
+_TID = 1  # All instrumented code runs on the Tk main thread
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Timer:
+    """Call count and total/max duration of one instrumented function."""
+
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        """Start with no calls recorded."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float):
+        """Record one call taking ``duration`` seconds."""
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    @property
+    def mean(self) -> float:
+        """Average duration in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+
+class Instrumentation:
+    """Collects timings for wrapped methods and ``after`` callbacks."""
+
+    def __init__(self, max_events: int = 200_000):
+        """Keep at most ``max_events`` spans and drift samples for the trace."""
+        self.origin = time.perf_counter()
+        self.timers: Dict[str, Timer] = {}
+        self.drift: Dict[str, Timer] = {}
+        self.spans = deque(maxlen=max_events)  # (name, start, duration)
+        self.drift_samples = deque(maxlen=max_events)  # (name, fired_at, drift)
+
+    def wrap(self, obj, *names: str):
+        """Time every call of the named methods on ``obj`` (this instance only)."""
+        for name in names:
+            setattr(obj, name, self._timed(name, getattr(obj, name)))
+
+    def _timed(self, name: str, func):
+        """Return ``func`` wrapped in a timer named ``name``."""
+        timer = self.timers.setdefault(name, Timer())
+        spans = self.spans
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = clock() - start
+                timer.add(duration)
+                spans.append((name, start, duration))
+
+        timed.__name__ = getattr(func, '__name__', name)
+        return timed
+
+    def wrap_after(self, root):
+        """Measure how late each ``root.after`` callback runs versus its requested delay."""
+        after = root.after
+        drift = self.drift
+        samples = self.drift_samples
+        clock = time.perf_counter
+
+        def instrumented_after(ms, func=None, *args):
+            if func is None:
+                return after(ms)  # Plain sleep, nothing to measure
+            name = getattr(func, '__name__', 'callback')
+            timer = drift.get(name)
+            if timer is None:
+                timer = drift[name] = Timer()
+            due = clock() + ms / 1000
+
+            def fire():
+                fired = clock()
+                late = max(0.0, fired - due)
+                timer.add(late)
+                samples.append((name, fired, late))
+                return func(*args)
+
+            return after(ms, fire)
+
+        root.after = instrumented_after
+
+    def summary(self) -> dict:
+        """Counts and timings in milliseconds, keyed by function and by ``after`` callback."""
+        def figures(timers):
+            return {name: {'count': timer.count, 'mean_ms': timer.mean * 1000,
+                           'max_ms': timer.max * 1000, 'total_ms': timer.total * 1000}
+                    for name, timer in timers.items()}
+        return {'timers': figures(self.timers), 'after_drift': figures(self.drift)}
+
+    def report(self) -> str:
+        """Format the timers and drift as a fixed-width table."""
+        lines = [f"{'function':<26}{'calls':>8}{'mean ms':>10}{'max ms':>10}"]
+        for name, timer in self.timers.items():
+            lines.append(f"{name:<26}{timer.count:>8}{timer.mean * 1000:>10.2f}{timer.max * 1000:>10.2f}")
+        lines.append("")
+        lines.append(f"{'after drift':<26}{'fired':>8}{'mean ms':>10}{'max ms':>10}")
+        for name, timer in sorted(self.drift.items()):
+            lines.append(f"{name:<26}{timer.count:>8}{timer.mean * 1000:>10.2f}{timer.max * 1000:>10.2f}")
+        return "\n".join(lines)
+
+    def trace_events(self) -> List[dict]:
+        """Spans as complete ('X') events and drift as counter ('C') events."""
+        origin = self.origin
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': _PID, 'tid': _TID,
+                   'args': {'name': 'Tk main thread'}}]
+        for name, start, duration in self.spans:
+            events.append({'name': name, 'cat': 'gui', 'ph': 'X', 'pid': _PID, 'tid': _TID,
+                           'ts': (start - origin) * 1e6, 'dur': duration * 1e6})
+        for name, fired, late in self.drift_samples:
+            events.append({'name': 'after drift', 'cat': 'after', 'ph': 'C', 'pid': _PID,
+                           'tid': _TID, 'ts': (fired - origin) * 1e6,
+                           'args': {name: late * 1000}})
+        return events
+
+    def export_chrome_trace(self, path: str):
+        """Write the collected events as Chrome trace-event JSON."""
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, f)
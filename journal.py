@@ -0,0 +1,185 @@
+"""
+Rock-Paper-Scissors Stats Journal
+Crash-safe, append-only persistence for game statistics.
+
+Every round is appended as one JSON line to a journal file, which costs the
+same no matter how many games have been played.  Appends are flushed to the
+OS immediately and fsync'd in batches.  Periodically the journal is compacted
+into a snapshot (the familiar ``game_stats.json``), written atomically via a
+temporary file and ``os.replace``, after which the journal is truncated.
+
+Loading reads the snapshot and replays journal entries newer than it.  A torn
+final line left by a crash is discarded, so the last consistent state is
+always recovered.
+"""
+
+import json
+import os
+import time
+from typing import Optional
+
+from engine import Choice, GameResult, GameStats
+
+
+class StatsJournal:
+    """Append-only round journal with periodic snapshot compaction."""
+
+    def __init__(self, snapshot_path: str = 'game_stats.json',
+                 journal_path: Optional[str] = None,
+                 fsync_every: int = 16, compact_every: int = 1000):
+        """Configure file locations and the fsync/compaction cadence."""
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or os.path.splitext(snapshot_path)[0] + '.journal'
+        self.fsync_every = max(1, fsync_every)
+        self.compact_every = max(1, compact_every)
+        self.seq = 0
+        self._stats = GameStats()
+        self._file = None
+        self._unsynced = 0
+        self._since_compaction = 0
+
+    def load(self) -> GameStats:
+        """Recover the last consistent stats from the snapshot and journal."""
+        stats, snapshot_seq = self._read_snapshot()
+        self.seq = snapshot_seq
+        self._since_compaction = 0
+
+        if os.path.exists(self.journal_path):
+            good_offset = 0
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        seq = int(entry['seq'])
+                        result = GameResult(entry['result'])
+                    except (ValueError, KeyError, TypeError):
+                        # Torn or corrupt tail from an interrupted write
+                        break
+                    good_offset += len(line)
+                    if seq <= snapshot_seq:
+                        continue  # Already folded into the snapshot
+                    stats.record(result)
+                    self.seq = seq
+                    self._since_compaction += 1
+
+            # Drop anything after the last complete entry
+            if good_offset != os.path.getsize(self.journal_path):
+                with open(self.journal_path, 'r+b') as f:
+                    f.truncate(good_offset)
+
+        self._stats = GameStats(**stats.to_dict())
+        return stats
+
+    def _read_snapshot(self):
+        """Return the snapshot stats and the journal sequence they include."""
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                data = json.load(f)
+            return GameStats.from_dict(data), int(data.get('seq', 0))
+        except FileNotFoundError:
+            return GameStats(), 0
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"Error reading stats snapshot, starting from journal only: {e}")
+            return GameStats(), 0
+
+    def _open(self):
+        """Open the journal for appending on first use."""
+        if self._file is None:
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+        return self._file
+
+    def append(self, player_choice: Choice, computer_choice: Choice,
+               result: GameResult, timestamp: Optional[float] = None):
+        """Append one round event to the journal."""
+        self.append_many([(player_choice, computer_choice, result, timestamp)])
+
+    def append_many(self, rounds):
+        """Append several ``(player, computer, result, timestamp)`` events at once.
+
+        The batch is written with a single ``write`` call; a ``None``
+        timestamp means "now".
+        """
+        lines = []
+        now = time.time()
+        for player_choice, computer_choice, result, timestamp in rounds:
+            self.seq += 1
+            entry = {
+                'seq': self.seq,
+                'player': player_choice.value,
+                'computer': computer_choice.value,
+                'result': result.value,
+                'ts': round(now if timestamp is None else timestamp, 3)
+            }
+            lines.append(json.dumps(entry, separators=(',', ':')) + '\n')
+            self._stats.record(result)
+        if not lines:
+            return
+
+        f = self._open()
+        f.write(''.join(lines))
+        f.flush()
+
+        self._unsynced += len(lines)
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+
+        self._since_compaction += len(lines)
+        if self._since_compaction >= self.compact_every:
+            self.compact()
+
+    def sync(self):
+        """Force buffered journal entries to stable storage."""
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def compact(self, stats: Optional[GameStats] = None):
+        """Write a snapshot of the current stats and truncate the journal.
+
+        Passing ``stats`` replaces the journal's view of the totals, which is
+        how a reset is persisted.
+        """
+        if stats is not None:
+            self._stats = GameStats(**stats.to_dict())
+        self.sync()
+
+        data = self._stats.to_dict()
+        data['seq'] = self.seq
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._fsync_directory()
+
+        # Entries up to self.seq now live in the snapshot; a crash before the
+        # truncate below is harmless because replay skips them by sequence.
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        with open(self.journal_path, 'w'):
+            pass
+        self._since_compaction = 0
+
+    def _fsync_directory(self):
+        """Persist the snapshot rename where the platform supports it."""
+        directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return  # Directories cannot be opened on Windows
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def close(self):
+        """Sync and close the journal file."""
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
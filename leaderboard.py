@@ -0,0 +1,526 @@
+"""
+Rock-Paper-Scissors Leaderboard Service
+Aggregates many players' rounds and ranks them by win rate, volume and streaks.
+
+``Leaderboard`` can be used in-process or served over a localhost socket by
+``LeaderboardServer`` (see ``LeaderboardClient``).  Rounds arrive in
+batches of ``(player, results)``, where ``results`` is a string of
+``W``/``L``/``T`` letters.  Each player's totals and streaks are updated
+once per batch with C-speed string operations.  Every ranking is an
+indexable skip list of sort keys, so updating a player, finding their rank
+and reading the top K all take O(log n) (plus K for the top K) at millions
+of rounds and players.
+
+Protocol (one ASCII command per line, replies are ``OK <json>`` or ``ERROR <reason>``):
+
+    INGEST <n>                  followed by n lines: <player> <results>
+    TOP <metric> <k>            best k entries of a ranking
+    RANK <metric> <player>      1-based rank of one player
+    PLAYER <player>             one player's totals
+    QUIT
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from engine import GameResult, GameStats
+from instrument import percentile
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8766
+MAX_LINE = 64 * 1024
+
+# Letters for round results in ingested batches
+RESULT_LETTERS = {GameResult.WIN: 'W', GameResult.LOSE: 'L', GameResult.TIE: 'T'}
+METRICS = ('win_rate', 'games', 'wins', 'streak')
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key, next_nodes, widths):
+        self.key = key
+        self.next = next_nodes
+        self.width = widths
+
+
+class RankIndex:
+    """Indexable skip list: sorted keys with O(log n) insert, remove, rank and index.
+
+    Each forward link also stores how many positions it skips, so the
+    position of a key is the sum of the widths followed to reach it.
+    """
+
+    def __init__(self, max_levels: int = 24, seed: int = 0):
+        """Create an empty index sized for up to about ``2 ** max_levels`` keys."""
+        self.max_levels = max_levels
+        self._end = _Node(None, [], [])  # Tail; compared by identity, never by key
+        self._head = _Node(None, [self._end] * max_levels, [1] * max_levels)
+        self._size = 0
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int):
+        """The key at sorted position ``index``."""
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        node = self._head
+        index += 1
+        for level in reversed(range(self.max_levels)):
+            while node.width[level] <= index:
+                index -= node.width[level]
+                node = node.next[level]
+        return node.key
+
+    def _level(self) -> int:
+        """Random tower height with P(height > k) = 2 ** -k."""
+        bits = self._rng.getrandbits(self.max_levels - 1) | (1 << (self.max_levels - 1))
+        return min(self.max_levels, (bits & -bits).bit_length())
+
+    def insert(self, key):
+        """Add ``key`` (duplicates are kept)."""
+        chain = [None] * self.max_levels
+        steps_at_level = [0] * self.max_levels
+        node, end = self._head, self._end
+        for level in reversed(range(self.max_levels)):
+            while node.next[level] is not end and node.next[level].key <= key:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        height = self._level()
+        new = _Node(key, [None] * height, [0] * height)
+        steps = 0
+        for level in range(height):
+            previous = chain[level]
+            new.next[level] = previous.next[level]
+            previous.next[level] = new
+            new.width[level] = previous.width[level] - steps
+            previous.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(height, self.max_levels):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key):
+        """Remove one occurrence of ``key``; raises ``KeyError`` if absent."""
+        chain = [None] * self.max_levels
+        node, end = self._head, self._end
+        for level in reversed(range(self.max_levels)):
+            while node.next[level] is not end and node.next[level].key < key:
+                node = node.next[level]
+            chain[level] = node
+        target = chain[0].next[0]
+        if target is self._end or target.key != key:
+            raise KeyError(key)
+        for level in range(len(target.next)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(len(target.next), self.max_levels):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def rank(self, key) -> int:
+        """Sorted position of ``key``; raises ``KeyError`` if absent."""
+        node, end = self._head, self._end
+        position = 0
+        for level in reversed(range(self.max_levels)):
+            while node.next[level] is not end and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+        if node.next[0] is self._end or node.next[0].key != key:
+            raise KeyError(key)
+        return position
+
+    def first(self, count: int) -> List:
+        """The first ``count`` keys in order."""
+        keys = []
+        node = self._head.next[0]
+        while node is not self._end and len(keys) < count:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+
+class PlayerRecord:
+    """Totals and win streaks of one player."""
+
+    __slots__ = ('name', 'wins', 'losses', 'ties', 'streak', 'best_streak')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+        self.streak = 0  # Current run of wins
+        self.best_streak = 0
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.losses + self.ties
+
+    @property
+    def win_rate(self) -> float:
+        games = self.games
+        return self.wins / games * 100 if games else 0.0
+
+    def add(self, results: str):
+        """Count a run of ``W``/``L``/``T`` results in order."""
+        wins = results.count('W')
+        losses = results.count('L')
+        self.wins += wins
+        self.losses += losses
+        self.ties += len(results) - wins - losses
+        if wins == len(results):
+            self.streak += wins
+        elif wins:
+            runs = results.replace('T', 'L').split('L')
+            self.best_streak = max(self.best_streak, self.streak + len(runs[0]), max(map(len, runs)))
+            self.streak = len(runs[-1])
+        else:
+            self.best_streak = max(self.best_streak, self.streak)
+            self.streak = 0
+        if self.streak > self.best_streak:
+            self.best_streak = self.streak
+
+    def to_dict(self) -> dict:
+        """Convert the record to a JSON-serializable dictionary."""
+        return {'player': self.name, 'wins': self.wins, 'losses': self.losses, 'ties': self.ties,
+                'games': self.games, 'win_rate': self.win_rate, 'streak': self.streak,
+                'best_streak': self.best_streak}
+
+
+def encode_results(results: Union[str, Iterable[GameResult]]) -> str:
+    """Results as a ``W``/``L``/``T`` string (strings are passed through)."""
+    if isinstance(results, str):
+        return results
+    return ''.join(RESULT_LETTERS[result] for result in results)
+
+
+class Leaderboard:
+    """Per-player aggregates with incrementally maintained rankings."""
+
+    def __init__(self, min_games: int = 10):
+        """Players need ``min_games`` rounds before they are ranked by win rate."""
+        self.min_games = min_games
+        self.players: Dict[str, PlayerRecord] = {}
+        self.rounds = 0
+        self._indexes = {metric: RankIndex(seed=index) for index, metric in enumerate(METRICS)}
+        self._keys: Dict[str, Dict[str, tuple]] = {metric: {} for metric in METRICS}
+
+    def _sort_key(self, metric: str, record: PlayerRecord) -> Optional[tuple]:
+        """Ascending sort key (best first) of a player in a ranking, or None if unranked."""
+        if metric == 'win_rate':
+            if record.games < self.min_games:
+                return None
+            return (-record.win_rate, -record.games, record.name)
+        if metric == 'games':
+            return (-record.games, record.name)
+        if metric == 'wins':
+            return (-record.wins, record.name)
+        return (-record.best_streak, -record.games, record.name)
+
+    def _reindex(self, record: PlayerRecord):
+        """Move a changed player to their new place in every ranking."""
+        for metric in METRICS:
+            keys = self._keys[metric]
+            old = keys.get(record.name)
+            new = self._sort_key(metric, record)
+            if old == new:
+                continue
+            index = self._indexes[metric]
+            if old is not None:
+                index.remove(old)
+            if new is None:
+                keys.pop(record.name, None)
+            else:
+                index.insert(new)
+                keys[record.name] = new
+
+    def ingest(self, events: Iterable[Tuple[str, Union[str, Iterable[GameResult]]]]) -> int:
+        """Add a batch of ``(player, results)`` events; returns the rounds added.
+
+        Events for the same player are merged first, so each player is
+        re-ranked once per batch.
+        """
+        batch: Dict[str, List[str]] = {}
+        for player, results in events:
+            batch.setdefault(player, []).append(encode_results(results))
+        merged = {player: ''.join(runs) for player, runs in batch.items()}
+        # Check the whole batch first so a bad event leaves the board untouched
+        for player, results in merged.items():
+            if results.strip('WLT'):
+                raise ValueError(f"results for {player!r} must only contain W, L and T")
+
+        added = 0
+        for player, results in merged.items():
+            record = self.players.get(player)
+            if record is None:
+                record = self.players[player] = PlayerRecord(player)
+            record.add(results)
+            added += len(results)
+            self._reindex(record)
+        self.rounds += added
+        return added
+
+    def ingest_stats(self, player: str, stats: GameStats):
+        """Replace a player's totals with an uploaded ``GameStats`` snapshot."""
+        record = self.players.get(player)
+        if record is None:
+            record = self.players[player] = PlayerRecord(player)
+        self.rounds += stats.total_games - record.games
+        record.wins, record.losses, record.ties = stats.wins, stats.losses, stats.ties
+        self._reindex(record)
+
+    def _value(self, metric: str, record: PlayerRecord):
+        return record.best_streak if metric == 'streak' else getattr(record, metric)
+
+    def top(self, metric: str = 'win_rate', k: int = 10) -> List[dict]:
+        """The best ``k`` players of a ranking, with 1-based ranks."""
+        if metric not in self._indexes:
+            raise ValueError(f"unknown metric {metric!r}; choose from {', '.join(METRICS)}")
+        entries = []
+        for position, key in enumerate(self._indexes[metric].first(k), 1):
+            record = self.players[key[-1]]
+            entries.append({'rank': position, 'player': record.name,
+                            'value': self._value(metric, record), 'games': record.games})
+        return entries
+
+    def rank(self, metric: str, player: str) -> Optional[dict]:
+        """A player's 1-based rank in a ranking, or None if unknown or unranked."""
+        if metric not in self._indexes:
+            raise ValueError(f"unknown metric {metric!r}; choose from {', '.join(METRICS)}")
+        key = self._keys[metric].get(player)
+        if key is None:
+            return None
+        index = self._indexes[metric]
+        return {'rank': index.rank(key) + 1, 'of': len(index), 'player': player,
+                'value': self._value(metric, self.players[player])}
+
+    def player(self, player: str) -> Optional[dict]:
+        """One player's totals and streaks."""
+        record = self.players.get(player)
+        return record.to_dict() if record is not None else None
+
+
+class LeaderboardServer:
+    """Serves a ``Leaderboard`` over the line protocol in the module docstring."""
+
+    def __init__(self, board: Optional[Leaderboard] = None,
+                 host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Configure the board and listening address (port 0 picks a free port)."""
+        self.board = board if board is not None else Leaderboard()
+        self.host = host
+        self.port = port
+        self._server = None
+
+    async def start(self):
+        """Start listening; the bound port is available as ``self.port``."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_LINE)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Start (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer one client's commands until it disconnects."""
+        try:
+            while True:
+                words = await self._read_words(reader)
+                if words is None or words[0] == 'QUIT':
+                    break
+                reply = await self._dispatch(reader, words)
+                writer.write(reply.encode('ascii', 'replace') + b'\n')
+                await writer.drain()
+        except (ConnectionError, ValueError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_words(reader: asyncio.StreamReader) -> Optional[List[str]]:
+        """Next non-empty line split into words, or None at end of stream."""
+        while True:
+            line = await reader.readline()
+            if not line:
+                return None
+            words = line.decode('ascii', 'replace').split()
+            if words:
+                return words
+
+    async def _dispatch(self, reader: asyncio.StreamReader, words: Sequence[str]) -> str:
+        """Run one command and return the reply line."""
+        command = words[0]
+        try:
+            if command == 'INGEST' and len(words) == 2 and words[1].isdigit():
+                # Read every line before validating so the next command stays in step
+                events = [await self._read_words(reader) for _ in range(int(words[1]))]
+                if any(event is None or len(event) != 2 for event in events):
+                    return "ERROR INGEST expects <player> <results> lines"
+                # Undecodable bytes arrive as U+FFFD; names are echoed back, so keep them ASCII
+                if not all(player.isascii() and player.isprintable() for player, _ in events):
+                    return "ERROR player names must be printable ASCII"
+                added = self.board.ingest(events)
+                return "OK " + json.dumps({'rounds': added, 'total_rounds': self.board.rounds})
+            if command == 'TOP' and len(words) == 3 and words[2].isdigit():
+                return "OK " + json.dumps(self.board.top(words[1], int(words[2])))
+            if command == 'RANK' and len(words) == 3:
+                entry = self.board.rank(words[1], words[2])
+                return "OK " + json.dumps(entry) if entry is not None else "ERROR unranked"
+            if command == 'PLAYER' and len(words) == 2:
+                entry = self.board.player(words[1])
+                return "OK " + json.dumps(entry) if entry is not None else "ERROR unknown player"
+        except ValueError as e:
+            return f"ERROR {e}"
+        return "ERROR unknown command"
+
+
+class LeaderboardClient:
+    """Connection to a ``LeaderboardServer``."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Remember the server address; call ``connect`` first."""
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+
+    async def connect(self):
+        """Open the connection."""
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port, limit=MAX_LINE)
+
+    async def close(self):
+        """Say goodbye and close the connection."""
+        if self._writer is not None:
+            try:
+                self._writer.write(b"QUIT\n")
+                self._writer.close()
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._writer = None
+
+    async def _request(self, lines: Sequence[str]):
+        """Send command lines and decode the ``OK`` reply's JSON."""
+        self._writer.write(('\n'.join(lines) + '\n').encode('ascii'))
+        await self._writer.drain()
+        reply = (await self._reader.readline()).decode('ascii').strip()
+        if not reply:
+            raise ConnectionError("connection closed by server")
+        if not reply.startswith('OK '):
+            raise ValueError(reply.partition(' ')[2] or reply)
+        return json.loads(reply[3:])
+
+    async def ingest(self, events: Iterable[Tuple[str, Union[str, Iterable[GameResult]]]]) -> dict:
+        """Send a batch of ``(player, results)`` events."""
+        lines = []
+        for player, results in events:
+            if player.split() != [player] or not (player.isascii() and player.isprintable()):
+                raise ValueError(f"player name {player!r} must be one printable-ASCII word")
+            lines.append(f"{player} {encode_results(results)}")
+        return await self._request([f"INGEST {len(lines)}"] + lines)
+
+    async def top(self, metric: str = 'win_rate', k: int = 10) -> List[dict]:
+        """The best ``k`` players of a ranking."""
+        return await self._request([f"TOP {metric} {k}"])
+
+    async def rank(self, metric: str, player: str) -> dict:
+        """One player's rank; raises ``ValueError`` if unranked."""
+        return await self._request([f"RANK {metric} {player}"])
+
+    async def player(self, player: str) -> dict:
+        """One player's totals."""
+        return await self._request([f"PLAYER {player}"])
+
+
+def benchmark(players: int = 100_000, rounds: int = 2_000_000, batch_rounds: int = 20,
+              queries: int = 10_000, seed: int = 0) -> dict:
+    """Ingest random rounds in-process and time ingestion, rank and top-K queries."""
+    rng = random.Random(seed)
+    board = Leaderboard()
+    names = [f"player{index}" for index in range(players)]
+    letters = 'WLT'
+
+    batches = [[(rng.choice(names), ''.join(rng.choices(letters, k=batch_rounds)))
+                for _ in range(1000)]
+               for _ in range(max(1, rounds // (batch_rounds * 1000)))]
+
+    start = time.perf_counter()
+    for events in batches:
+        board.ingest(events)
+    ingest_elapsed = time.perf_counter() - start
+
+    latencies = []
+    for _ in range(queries):
+        name = rng.choice(names)
+        query_start = time.perf_counter()
+        board.rank('win_rate', name)
+        latencies.append(time.perf_counter() - query_start)
+    latencies.sort()
+
+    start = time.perf_counter()
+    board.top('win_rate', 10)
+    top_elapsed = time.perf_counter() - start
+    return {
+        'players': len(board.players),
+        'rounds': board.rounds,
+        'ingest_rounds_per_sec': board.rounds / ingest_elapsed,
+        'rank_p50_us': percentile(latencies, 0.50) * 1e6,
+        'rank_p99_us': percentile(latencies, 0.99) * 1e6,
+        'top10_us': top_elapsed * 1e6
+    }
+
+
+def main():
+    """Command-line entry point: serve a leaderboard or benchmark one."""
+    parser = argparse.ArgumentParser(description="Rock-Paper-Scissors leaderboard service")
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help="serve a leaderboard on a socket")
+    serve.add_argument("--host", default=DEFAULT_HOST, help=f"address to bind (default: {DEFAULT_HOST})")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to bind (default: {DEFAULT_PORT})")
+    serve.add_argument("--min-games", type=int, default=10, help="rounds before a player is ranked by win rate")
+    bench = commands.add_parser('bench', help="time ingestion and queries in-process")
+    bench.add_argument("--players", type=int, default=100_000)
+    bench.add_argument("--rounds", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    if args.command == 'bench':
+        report = benchmark(args.players, args.rounds)
+        print(f"🏆 {report['players']:,} players, {report['rounds']:,} rounds "
+              f"ingested at {report['ingest_rounds_per_sec']:,.0f} rounds/s")
+        print(f"⏱️ Rank query p50 {report['rank_p50_us']:.1f} µs, p99 {report['rank_p99_us']:.1f} µs; "
+              f"top 10 in {report['top10_us']:.1f} µs")
+        return
+
+    server = LeaderboardServer(Leaderboard(args.min_games), args.host, args.port)
+
+    async def run():
+        await server.start()
+        print(f"🏆 Leaderboard listening on {server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print(f"👋 Stopped after {server.board.rounds:,} rounds from {len(server.board.players):,} players")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Rock-Paper-Scissors Load Generator
+Drives many concurrent bot matches against a match server.
+
+By default an in-process server is started on a free localhost port, so
+``python loadgen.py --matches 1000`` measures the whole stack on one
+machine.  Round latency is measured per client from sending ``COMMIT`` to
+receiving ``RESULT``.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List, Optional
+
+from client import MatchClient
+from engine import CHOICE_ORDER
+from instrument import percentile
+from server import DEFAULT_HOST, MatchServer
+
+
+async def bot(host: str, port: int, name: str, rounds: int, seed: int,
+              latencies: List[float], ready: asyncio.Semaphore):
+    """Connect, get matched and play ``rounds`` random rounds."""
+    rng = random.Random(seed)
+    client = MatchClient(host, port)
+    async with ready:
+        await client.connect()
+    try:
+        await client.join(name, 'load')
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await client.play(rng.choice(CHOICE_ORDER))
+            latencies.append(time.perf_counter() - start)
+    finally:
+        await client.close()
+
+
+async def run_load(matches: int = 100, rounds: int = 100, host: str = DEFAULT_HOST,
+                   port: Optional[int] = None, seed: int = 0,
+                   connect_concurrency: int = 256) -> dict:
+    """Play ``matches`` concurrent matches and report latency percentiles.
+
+    With ``port`` of None an in-process server is started for the run.
+    """
+    server = None
+    if port is None:
+        server = MatchServer(host, 0)
+        await server.start()
+        port = server.port
+
+    latencies: List[float] = []
+    # Limit simultaneous connects so the listen backlog is not overrun
+    ready = asyncio.Semaphore(connect_concurrency)
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(
+            bot(host, port, f"bot{index}", rounds, seed + index, latencies, ready)
+            for index in range(matches * 2)
+        ))
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    total_rounds = len(latencies) // 2
+    return {
+        'matches': matches,
+        'rounds': total_rounds,
+        'elapsed_s': elapsed,
+        'rounds_per_sec': total_rounds / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': (latencies[-1] if latencies else 0.0) * 1000
+    }
+
+
+def main():
+    """Command-line entry point for the load generator."""
+    parser = argparse.ArgumentParser(description="Load generator for the match server")
+    parser.add_argument("--matches", type=int, default=500, help="concurrent matches (2 clients each)")
+    parser.add_argument("--rounds", type=int, default=50, help="rounds per match")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="server address")
+    parser.add_argument("--port", type=int, default=None,
+                        help="server port (default: start a server in-process)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the bots' moves")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args.matches, args.rounds, args.host, args.port, args.seed))
+    print(f"🌐 {report['matches']:,} matches, {report['rounds']:,} rounds in {report['elapsed_s']:.2f}s "
+          f"({report['rounds_per_sec']:,.0f} rounds/s)")
+    print(f"⏱️ Round latency p50 {report['p50_ms']:.2f} ms, p99 {report['p99_ms']:.2f} ms, "
+          f"max {report['max_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
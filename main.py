@@ -1,54 +1,40 @@
-
 """
 Rock-Paper-Scissors Game
 A modern GUI-based implementation with score tracking and beautiful interface.
 """
 
+# Start the startup clock before anything heavy is imported
+from startup import StartupProfiler
+PROFILE = StartupProfiler()
+
+import argparse
+import random
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple
 import tkinter as tk
 from tkinter import ttk, messagebox
-import random
-from enum import Enum
-from dataclasses import dataclass
-from typing import Optional
-import json
-import os
-
-class Choice(Enum):
-    """Game choices enumeration."""
-    ROCK = "rock"
-    PAPER = "paper"
-    SCISSORS = "scissors"
-
-class GameResult(Enum):
-    """Game result enumeration."""
-    WIN = "win"
-    LOSE = "lose"
-    TIE = "tie"
-
-@dataclass
-class GameStats:
-    """Player statistics."""
-    wins: int = 0
-    losses: int = 0
-    ties: int = 0
-    total_games: int = 0
-
-    @property
-    def win_rate(self) -> float:
-        """Calculate win percentage."""
-        if self.total_games == 0:
-            return 0.0
-        return (self.wins / self.total_games) * 100
+PROFILE.mark('import tkinter')
+from animation import COMPUTER_LABEL, RESULT_LABEL, compile_choice_animation
+from engine import Choice, GameResult, GameStats, GameEngine, RULES, determine_winner
+from instrument import Instrumentation
+from pump import EventPump
+from replay import SessionLog, first_divergence, new_session_seed
+from rules import RuleSet, available_rulesets, describe, load_ruleset
+from storage import DEFAULT_PROFILE, SQLiteBackend, StatsBackend
+from strategies import STRATEGIES, create_opponent
+from theme import DEFAULT_THEME, THEME_GREETINGS, THEME_LABELS, THEMES, Theme
+from viewmodel import ViewModel
+from writer import StatsWriter
+PROFILE.mark('import game modules')
 
 class RockPaperScissorsGame:
     """Main game class with modern GUI interface."""
     
-    # Game rules mapping
-    RULES = {
-        Choice.ROCK: Choice.SCISSORS,
-        Choice.SCISSORS: Choice.PAPER,
-        Choice.PAPER: Choice.ROCK
-    }
+    # Game rules mapping (owned by the headless engine)
+    RULES = RULES
     
     # Choice emojis for visual appeal
     EMOJIS = {
@@ -71,96 +57,241 @@ class RockPaperScissorsGame:
     # Dramatic countdown messages
     COUNTDOWN_MESSAGES = ["3️⃣", "2️⃣", "1️⃣", "🎉"]
     
-    # Dark mode color scheme for modern UI
-    COLORS = {
-        'primary': '#3b82f6',
-        'secondary': '#6366f1',
-        'success': '#10b981',
-        'danger': '#ef4444',
-        'warning': '#f59e0b',
-        'background': '#0f172a',
-        'surface': '#1e293b',
-        'card': '#334155',
-        'text': '#f1f5f9',
-        'text_secondary': '#94a3b8',
-        'border': '#475569'
+    # Keyboard shortcuts for rapid play
+    KEY_BINDINGS = {
+        'r': Choice.ROCK,
+        'p': Choice.PAPER,
+        's': Choice.SCISSORS
     }
+    
+    # Inputs kept while an animation is running; more are refused, never dropped silently
+    MAX_QUEUED_INPUTS = 16
+    
+    # Fixed window size, so the window can be centred without a layout pass
+    WINDOW_SIZE = (800, 600)
+    
+    # Rule sets with more choices than this get a grid of small buttons
+    MAX_LARGE_BUTTONS = 5
+    GRID_COLUMNS = 10
+    GRID_ROW_HEIGHT = 30
+    GRID_COLUMN_WIDTH = 95
+    
+    # Startup steps that must finish before the startup profile is printed
+    STARTUP_STEPS = ('first frame', 'secondary panels', 'stats loaded')
+    
+    # Hot paths timed when instrumentation is on (_advance_animation is one animation tick)
+    INSTRUMENTED_METHODS = ('play_round', '_advance_animation', '_reveal_final_result',
+                            'update_stats_display', 'save_stats')
+    OVERLAY_REFRESH_MS = 500
 
-    def __init__(self):
-        """Initialize the game."""
-        self.stats = GameStats()
-        self.load_stats()
+    def __init__(self, opponent: str = "random", turbo: bool = False,
+                 profile: str = DEFAULT_PROFILE, backend: Optional[StatsBackend] = None,
+                 server: Optional[Tuple[str, int]] = None, db_path: Optional[str] = None,
+                 startup_profile: bool = False,
+                 instrumentation: Optional[Instrumentation] = None,
+                 trace_path: Optional[str] = None, seed: Optional[int] = None,
+                 record_path: Optional[str] = None, rules: Optional[RuleSet] = None,
+                 theme: str = DEFAULT_THEME):
+        """Initialize the game against the named opponent strategy.
+
+        With ``server`` set to ``(host, port)`` the opponent is a human
+        found through the match server instead.  Without a ``backend`` a
+        ``SQLiteBackend`` is opened at ``db_path`` in the background.
+        ``instrumentation`` times the hot paths (F12 shows the overlay) and
+        its trace is written to ``trace_path`` on exit.  The computer draws
+        from a generator seeded with ``seed`` (fresh per session if None);
+        the session is saved to ``record_path`` on exit so it can be replayed.
+        ``rules`` plays a variant rule set against a random computer instead
+        of the classic game; its stats are kept under their own profile.
+        ``theme`` names the starting color scheme (the footer button cycles it).
+        """
+        self.seed = seed if seed is not None else new_session_seed()
+        self.engine = GameEngine(create_opponent(opponent, random.Random(self.seed)))
+        self.session_log = SessionLog(self.seed, opponent)
+        self.record_path = record_path
+        self.replay = None
+        self.setup_rules(rules)
+        if rules is not None:
+            profile = f"{profile} ({rules.name})"
+        self.profile = profile
+        self.backend = backend
+        self.db_path = db_path
+        # The writer is created once the stats have loaded; writes before that are held here
+        self.writer = None
+        self._pending_writes = []
+        self.startup_profile = startup_profile
+        self._startup_steps = set(self.STARTUP_STEPS)
+        self.instrumentation = instrumentation
+        self.trace_path = trace_path
+        self.overlay = None
+        self._overlay_after_id = None
         self.animation_running = False
         self.animation_frame = 0
+        self.animation_round = None
+        self.turbo = turbo
+        self.theme_name = theme
+        self.pending_choices = deque()
+        self.rejected_inputs = 0
+        self._stats_display_scheduled = False
+        # Widget render cache and every result message, built once at startup
+        self.view = ViewModel()
+        self.result_messages = self.build_result_messages()
+        # The thinking animation is the same every round, so compile it once
+        self.animation_timeline = compile_choice_animation(
+            self.LOADING_FRAMES, self.THINKING_MESSAGES, self.COUNTDOWN_MESSAGES)
         self.setup_gui()
+        PROFILE.mark('build window shell')
+        if instrumentation is not None:
+            self.enable_instrumentation(instrumentation)
+        
+        # Background workers report back to the widgets through the pump
+        self.pump = EventPump(self.root)
+        self.pump.start()
+        self.load_stats()
+        self.network = None
+        if server is not None:
+            self.start_network_session(*server)
+
+    def setup_rules(self, rules: Optional[RuleSet]):
+        """Choose the choices, labels, keys and winner lookup for the game being played."""
+        self.variant = rules
+        if rules is None:
+            self.choices = tuple(Choice)
+            self.choice_emojis = self.EMOJIS
+            self.choice_names = {choice: choice.value.title() for choice in Choice}
+            self.key_bindings = self.KEY_BINDINGS
+            self._resolve = determine_winner
+        else:
+            self.choices = rules.choices
+            self.choice_emojis = {choice: choice.emoji or choice.name[:2] for choice in rules.choices}
+            self.choice_names = {choice: choice.name for choice in rules.choices}
+            self.key_bindings = {choice.key: choice for choice in rules.choices if choice.key}
+            self._resolve = rules.determine_winner
+            self.rng = random.Random(self.seed)
+        
+        # More choices than fit in a row get a grid of small buttons and a taller window
+        self.window_size = self.WINDOW_SIZE
+        if len(self.choices) > self.MAX_LARGE_BUTTONS:
+            columns = min(len(self.choices), self.GRID_COLUMNS)
+            rows = -(-len(self.choices) // columns)
+            width, height = self.WINDOW_SIZE
+            self.window_size = (max(width, columns * self.GRID_COLUMN_WIDTH + 40),
+                                height + (rows - 1) * self.GRID_ROW_HEIGHT)
+
+    @property
+    def stats(self) -> GameStats:
+        """Statistics tracked by the game engine."""
+        return self.engine.stats
+
+    @stats.setter
+    def stats(self, value: GameStats):
+        self.engine.stats = value
 
     def setup_gui(self):
-        """Set up the modern GUI interface."""
-        # Main window with dark mode
+        """Set up the window shell; the stats and footer panels follow once it is shown."""
+        # Main window
         self.root = tk.Tk()
-        self.root.title("Rock Paper Scissors 🎮 - Dark Mode")
-        self.root.geometry("800x600")
-        self.root.configure(bg=self.COLORS['background'])
+        PROFILE.mark('create Tk root')
         self.root.resizable(False, False)
         
-        # Configure styles
+        # Shared fonts, styles and colors
         self.setup_styles()
+        self.root.title(f"Rock Paper Scissors 🎮 - {self.theme.label}")
+        self.theme.track(self.root, bg='background')
         
-        # Create main layout
+        # Create the part of the layout needed to start playing
         self.create_header()
         self.create_game_area()
-        self.create_stats_area()
-        self.create_footer()
+        self.panels_built = False
+        self.turbo_btn = None
+        self.theme_btn = None
+        
+        # Keyboard controls
+        self.bind_keys()
         
         # Center window on screen
         self.center_window()
+        
+        # Build the rest once the first frame is up (or shortly after, if never mapped)
+        self._map_binding = self.root.bind("<Map>", self._on_first_map, add='+')
+        self.root.after(250, self.build_secondary_panels)
+
+    def _on_first_map(self, event):
+        """Record the first frame and queue the secondary panels behind it."""
+        if event.widget is not self.root or self._map_binding is None:
+            return
+        self.root.unbind("<Map>", self._map_binding)
+        self._map_binding = None
+        PROFILE.mark('first frame')
+        self._startup_step_done('first frame')
+        self.root.after_idle(self.build_secondary_panels)
+
+    def build_secondary_panels(self):
+        """Create the stats area and footer (runs once, after the first frame)."""
+        if self.panels_built:
+            return
+        start = time.perf_counter()
+        self.panels_built = True
+        self.create_stats_area()
+        self.create_footer()
+        PROFILE.record('secondary panels', time.perf_counter() - start)
+        self._startup_step_done('secondary panels')
+
+    def _startup_step_done(self, step: str):
+        """Print the startup profile once every startup step has finished."""
+        self._startup_steps.discard(step)
+        if self.startup_profile and not self._startup_steps:
+            print(f"🖼️ Time to first frame: {PROFILE.elapsed('first frame') * 1000:.1f} ms")
+            print(PROFILE.report())
+
+    def enable_instrumentation(self, instrumentation: Instrumentation):
+        """Time the hot paths and ``after`` drift, and bind F12 to the overlay."""
+        # Only this instance is wrapped; without instrumentation nothing changes
+        instrumentation.wrap(self, *self.INSTRUMENTED_METHODS)
+        instrumentation.wrap_after(self.root)
+        self.root.bind("<F12>", lambda e: self.toggle_overlay())
+
+    def toggle_overlay(self):
+        """Show or hide the instrumentation overlay window."""
+        if self.overlay is not None:
+            if self._overlay_after_id is not None:
+                self.root.after_cancel(self._overlay_after_id)
+                self._overlay_after_id = None
+            self.theme.untrack(self.overlay)
+            self.overlay.destroy()
+            self.overlay = None
+            return
+        self.overlay = self.theme.create(tk.Toplevel, self.root, bg='surface')
+        self.overlay.title("Instrumentation")
+        self.overlay.protocol("WM_DELETE_WINDOW", self.toggle_overlay)
+        self.overlay_label = self.theme.create(tk.Label, self.overlay, justify='left', anchor='nw',
+                                               font='mono', bg='surface', fg='text',
+                                               padx=10, pady=10)
+        self.overlay_label.pack(fill='both', expand=True)
+        self._refresh_overlay()
+
+    def _refresh_overlay(self):
+        """Redraw the overlay while it is open."""
+        if self.overlay is None:
+            return
+        pump = self.pump.metrics()
+        lines = [
+            self.instrumentation.report(),
+            "",
+            f"Tk calls per round: {self.view.average_tk_calls_per_round:.1f} "
+            f"(last {self.view.last_round_tk_calls}, skipped {self.view.skipped_calls})",
+            f"Event pump: backlog {pump['backlog']}, max drain {pump['max_drain_ms']:.2f} ms"
+        ]
+        self.overlay_label.configure(text="\n".join(lines))
+        self._overlay_after_id = self.root.after(self.OVERLAY_REFRESH_MS, self._refresh_overlay)
 
     def setup_styles(self):
-        """Configure ttk styles for modern dark mode appearance."""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Configure button styles for dark mode
-        style.configure('Game.TButton',
-                       padding=(20, 15),
-                       font=('Segoe UI', 12, 'bold'),
-                       borderwidth=0,
-                       focuscolor='none',
-                       background=self.COLORS['primary'],
-                       foreground='white')
-        
-        style.configure('Action.TButton',
-                       padding=(15, 10),
-                       font=('Segoe UI', 10, 'bold'),
-                       borderwidth=0,
-                       focuscolor='none',
-                       background=self.COLORS['secondary'],
-                       foreground='white')
-        
-        # Configure label styles for dark mode
-        style.configure('Title.TLabel',
-                       font=('Segoe UI', 24, 'bold'),
-                       background=self.COLORS['background'],
-                       foreground=self.COLORS['text'])
-        
-        style.configure('Subtitle.TLabel',
-                       font=('Segoe UI', 14),
-                       background=self.COLORS['background'],
-                       foreground=self.COLORS['text_secondary'])
-        
-        style.configure('Choice.TLabel',
-                       font=('Segoe UI', 48),
-                       background=self.COLORS['card'],
-                       foreground=self.COLORS['text'])
-        
-        style.configure('Result.TLabel',
-                       font=('Segoe UI', 16, 'bold'),
-                       background=self.COLORS['card'],
-                       foreground=self.COLORS['text'])
+        """Create the theme: named fonts, ttk styles and the color scheme, built once."""
+        self.theme = Theme(self.root, self.theme_name)
 
     def create_header(self):
         """Create the header section."""
-        header_frame = tk.Frame(self.root, bg=self.COLORS['background'], height=100)
+        header_frame = self.theme.create(tk.Frame, self.root, bg='background', height=100)
         header_frame.pack(fill='x', padx=20, pady=(20, 10))
         header_frame.pack_propagate(False)
         
@@ -177,11 +308,11 @@ class RockPaperScissorsGame:
     def create_game_area(self):
         """Create the main game area."""
         # Game container
-        game_container = tk.Frame(self.root, bg=self.COLORS['background'])
+        game_container = self.theme.create(tk.Frame, self.root, bg='background')
         game_container.pack(fill='both', expand=True, padx=20, pady=10)
         
         # Choice buttons frame
-        buttons_frame = tk.Frame(game_container, bg=self.COLORS['background'])
+        buttons_frame = self.theme.create(tk.Frame, game_container, bg='background')
         buttons_frame.pack(pady=20)
         
         # Create choice buttons
@@ -194,191 +325,260 @@ class RockPaperScissorsGame:
         """Create the choice buttons."""
         ttk.Label(parent, text="Make your choice:", style='Subtitle.TLabel').pack(pady=(0, 15))
         
-        button_frame = tk.Frame(parent, bg=self.COLORS['background'])
+        button_frame = self.theme.create(tk.Frame, parent, bg='background')
         button_frame.pack()
         
         # Store button references for enabling/disabling
         self.choice_buttons = []
         
-        for choice in Choice:
-            btn = tk.Button(button_frame,
-                           text=f"{self.EMOJIS[choice]}\n{choice.value.title()}",
-                           command=lambda c=choice: self.play_round(c),
-                           font=('Segoe UI', 14, 'bold'),
-                           bg=self.COLORS['primary'],
-                           fg='white',
-                           activebackground=self.COLORS['secondary'],
-                           activeforeground='white',
-                           relief='flat',
-                           borderwidth=2,
-                           highlightthickness=0,
-                           padx=30,
-                           pady=20,
-                           cursor='hand2')
-            btn.pack(side='left', padx=10)
+        # One button per choice of the rule set; large ones in a row, or a grid of small ones
+        large = len(self.choices) <= self.MAX_LARGE_BUTTONS
+        columns = len(self.choices) if large else self.GRID_COLUMNS
+        for index, choice in enumerate(self.choices):
+            emoji, name = self.choice_emojis[choice], self.choice_names[choice]
+            btn = self.theme.create(tk.Button, button_frame,
+                                    text=f"{emoji}\n{name}" if large else f"{emoji} {name}",
+                                    command=lambda c=choice: self.play_round(c),
+                                    font='choice_button' if large else 'choice_button_small',
+                                    bg='primary',
+                                    fg='on_accent',
+                                    activebackground='secondary',
+                                    activeforeground='on_accent',
+                                    relief='flat',
+                                    borderwidth=2,
+                                    highlightthickness=0,
+                                    padx=(30 if len(self.choices) <= 3 else 15) if large else 4,
+                                    pady=20 if large else 2,
+                                    cursor='hand2')
+            if large:
+                btn.pack(side='left', padx=10)
+            else:
+                btn.grid(row=index // columns, column=index % columns, padx=2, pady=2, sticky='ew')
             self.choice_buttons.append(btn)
             
-            # Add hover effects for dark mode
-            btn.bind("<Enter>", lambda e, b=btn: self._on_button_hover(b) if not self.animation_running else None)
-            btn.bind("<Leave>", lambda e, b=btn: self._on_button_leave(b) if not self.animation_running else None)
-    
-    def _on_button_hover(self, button):
-        """Handle button hover effect."""
-        if button.cget('state') == 'normal':
-            button.configure(bg=self.COLORS['secondary'], 
-                           highlightbackground=self.COLORS['text_secondary'])
-    
-    def _on_button_leave(self, button):
-        """Handle button leave effect."""
-        if button.cget('state') == 'normal':
-            button.configure(bg=self.COLORS['primary'],
-                           highlightbackground=self.COLORS['border'])
+            # Hover effect, handled in Tcl (disabled buttons are left alone)
+            self.theme.bind_hover(btn, 'primary', 'secondary')
 
     def create_result_area(self, parent):
         """Create the result display area."""
         # Result container with modern card design for dark mode
-        result_container = tk.Frame(parent, bg=self.COLORS['card'], relief='flat', 
-                                   borderwidth=1, highlightbackground=self.COLORS['border'])
+        result_container = self.theme.create(tk.Frame, parent, bg='card', relief='flat',
+                                             borderwidth=1, highlightbackground='border')
         result_container.pack(fill='x', pady=20, ipady=20)
         
         # Battle display
-        battle_frame = tk.Frame(result_container, bg=self.COLORS['card'])
+        battle_frame = self.theme.create(tk.Frame, result_container, bg='card')
         battle_frame.pack(pady=10)
         
         # Player choice display
-        player_frame = tk.Frame(battle_frame, bg=self.COLORS['card'])
+        player_frame = self.theme.create(tk.Frame, battle_frame, bg='card')
         player_frame.pack(side='left', padx=40)
         
-        ttk.Label(player_frame, text="You", style='Subtitle.TLabel').pack()
+        self.player_title_label = ttk.Label(player_frame, text="You", style='Subtitle.TLabel')
+        self.player_title_label.pack()
         self.player_choice_label = ttk.Label(player_frame, text="❓", style='Choice.TLabel')
         self.player_choice_label.pack()
         
         # VS label
-        vs_frame = tk.Frame(battle_frame, bg=self.COLORS['card'])
+        vs_frame = self.theme.create(tk.Frame, battle_frame, bg='card')
         vs_frame.pack(side='left', padx=20)
         
-        ttk.Label(vs_frame, text="VS", font=('Segoe UI', 20, 'bold'), 
-                 background=self.COLORS['card'], foreground=self.COLORS['text_secondary']).pack(pady=40)
+        ttk.Label(vs_frame, text="VS", style='Versus.TLabel').pack(pady=40)
         
         # Computer choice display
-        computer_frame = tk.Frame(battle_frame, bg=self.COLORS['card'])
+        computer_frame = self.theme.create(tk.Frame, battle_frame, bg='card')
         computer_frame.pack(side='left', padx=40)
         
-        ttk.Label(computer_frame, text="Computer", style='Subtitle.TLabel').pack()
+        self.opponent_title_label = ttk.Label(computer_frame, text="Computer", style='Subtitle.TLabel')
+        self.opponent_title_label.pack()
         self.computer_choice_label = ttk.Label(computer_frame, text="❓", style='Choice.TLabel')
         self.computer_choice_label.pack()
+        self.view.remember(self.player_title_label, "You")
+        self.view.remember(self.player_choice_label, "❓")
+        self.view.remember(self.computer_choice_label, "❓")
         
         # Result message
         self.result_label = ttk.Label(result_container, text="Choose your weapon to start!", 
                                      style='Result.TLabel')
         self.result_label.pack(pady=10)
+        self.view.remember(self.result_label, "Choose your weapon to start!")
+        
+        # Labels driven by the animation timeline
+        self.animation_labels = {
+            COMPUTER_LABEL: self.computer_choice_label,
+            RESULT_LABEL: self.result_label
+        }
 
     def create_stats_area(self):
         """Create the statistics area."""
-        stats_container = tk.Frame(self.root, bg=self.COLORS['surface'], relief='flat', 
-                                  borderwidth=1, highlightbackground=self.COLORS['border'])
+        stats_container = self.theme.create(tk.Frame, self.root, bg='surface', relief='flat',
+                                            borderwidth=1, highlightbackground='border')
         stats_container.pack(fill='x', padx=20, pady=10, ipady=15)
         
-        ttk.Label(stats_container, text="📊 Game Statistics", 
-                 font=('Segoe UI', 14, 'bold'), background=self.COLORS['surface'],
-                 foreground=self.COLORS['text']).pack(pady=(0, 10))
+        ttk.Label(stats_container, text="📊 Game Statistics",
+                 style='Heading.TLabel').pack(pady=(0, 10))
         
-        stats_frame = tk.Frame(stats_container, bg=self.COLORS['surface'])
+        stats_frame = self.theme.create(tk.Frame, stats_container, bg='surface')
         stats_frame.pack()
         
         # Stats display with dark mode colors
-        self.wins_label = ttk.Label(stats_frame, text="Wins: 0", 
-                                   font=('Segoe UI', 12), background=self.COLORS['surface'],
-                                   foreground=self.COLORS['text'])
+        self.wins_label = ttk.Label(stats_frame, text="Wins: 0", style='Stat.TLabel')
         self.wins_label.pack(side='left', padx=20)
         
-        self.losses_label = ttk.Label(stats_frame, text="Losses: 0", 
-                                     font=('Segoe UI', 12), background=self.COLORS['surface'],
-                                     foreground=self.COLORS['text'])
+        self.losses_label = ttk.Label(stats_frame, text="Losses: 0", style='Stat.TLabel')
         self.losses_label.pack(side='left', padx=20)
         
-        self.ties_label = ttk.Label(stats_frame, text="Ties: 0", 
-                                   font=('Segoe UI', 12), background=self.COLORS['surface'],
-                                   foreground=self.COLORS['text'])
+        self.ties_label = ttk.Label(stats_frame, text="Ties: 0", style='Stat.TLabel')
         self.ties_label.pack(side='left', padx=20)
         
-        self.winrate_label = ttk.Label(stats_frame, text="Win Rate: 0%", 
-                                      font=('Segoe UI', 12), background=self.COLORS['surface'],
-                                      foreground=self.COLORS['text'])
+        self.winrate_label = ttk.Label(stats_frame, text="Win Rate: 0%", style='Stat.TLabel')
         self.winrate_label.pack(side='left', padx=20)
+        
+        # Seed the render cache with the initial texts, then show loaded stats
+        self.view.remember(self.wins_label, 0)
+        self.view.remember(self.losses_label, 0)
+        self.view.remember(self.ties_label, 0)
+        self.view.remember(self.winrate_label, 0.0)
+        self.update_stats_display()
 
     def create_footer(self):
         """Create the footer with action buttons."""
-        footer_frame = tk.Frame(self.root, bg=self.COLORS['background'], height=80)
+        footer_frame = self.theme.create(tk.Frame, self.root, bg='background', height=80)
         footer_frame.pack(fill='x', padx=20, pady=10)
         footer_frame.pack_propagate(False)
         
-        button_frame = tk.Frame(footer_frame, bg=self.COLORS['background'])
+        button_frame = self.theme.create(tk.Frame, footer_frame, bg='background')
         button_frame.pack(expand=True)
         
         # Reset stats button with dark mode styling
-        reset_btn = tk.Button(button_frame,
-                             text="🔄 Reset Stats",
-                             command=self.reset_stats,
-                             font=('Segoe UI', 10, 'bold'),
-                             bg=self.COLORS['warning'],
-                             fg='white',
-                             activebackground='#d97706',
-                             activeforeground='white',
-                             relief='flat',
-                             borderwidth=1,
-                             highlightthickness=0,
-                             highlightbackground=self.COLORS['border'],
-                             padx=20,
-                             pady=10,
-                             cursor='hand2')
+        reset_btn = self.theme.create(tk.Button, button_frame,
+                                      text="🔄 Reset Stats",
+                                      command=self.reset_stats,
+                                      font='action_button',
+                                      bg='warning',
+                                      fg='on_accent',
+                                      activebackground='warning_active',
+                                      activeforeground='on_accent',
+                                      relief='flat',
+                                      borderwidth=1,
+                                      highlightthickness=0,
+                                      highlightbackground='border',
+                                      padx=20,
+                                      pady=10,
+                                      cursor='hand2')
         reset_btn.pack(side='left', padx=10)
         
         # Add hover effects
-        reset_btn.bind("<Enter>", lambda e: reset_btn.configure(bg='#d97706'))
-        reset_btn.bind("<Leave>", lambda e: reset_btn.configure(bg=self.COLORS['warning']))
+        self.theme.bind_hover(reset_btn, 'warning', 'warning_active')
         
         # Exit button with dark mode styling
-        exit_btn = tk.Button(button_frame,
-                            text="❌ Exit Game",
-                            command=self.exit_game,
-                            font=('Segoe UI', 10, 'bold'),
-                            bg=self.COLORS['danger'],
-                            fg='white',
-                            activebackground='#dc2626',
-                            activeforeground='white',
-                            relief='flat',
-                            borderwidth=1,
-                            highlightthickness=0,
-                            highlightbackground=self.COLORS['border'],
-                            padx=20,
-                            pady=10,
-                            cursor='hand2')
+        exit_btn = self.theme.create(tk.Button, button_frame,
+                                     text="❌ Exit Game",
+                                     command=self.exit_game,
+                                     font='action_button',
+                                     bg='danger',
+                                     fg='on_accent',
+                                     activebackground='danger_active',
+                                     activeforeground='on_accent',
+                                     relief='flat',
+                                     borderwidth=1,
+                                     highlightthickness=0,
+                                     highlightbackground='border',
+                                     padx=20,
+                                     pady=10,
+                                     cursor='hand2')
         exit_btn.pack(side='right', padx=10)
         
         # Add hover effects
-        exit_btn.bind("<Enter>", lambda e: exit_btn.configure(bg='#dc2626'))
-        exit_btn.bind("<Leave>", lambda e: exit_btn.configure(bg=self.COLORS['danger']))
+        self.theme.bind_hover(exit_btn, 'danger', 'danger_active')
+        
+        # Turbo mode toggle: no animation, instant results
+        self.turbo_btn = self.theme.create(tk.Button, button_frame,
+                                           text=self._turbo_button_text(),
+                                           command=self.toggle_turbo,
+                                           font='action_button',
+                                           bg='secondary',
+                                           fg='on_accent',
+                                           activebackground='primary',
+                                           activeforeground='on_accent',
+                                           relief='flat',
+                                           borderwidth=1,
+                                           highlightthickness=0,
+                                           highlightbackground='border',
+                                           padx=20,
+                                           pady=10,
+                                           cursor='hand2')
+        self.turbo_btn.pack(side='left', padx=10)
+        
+        # Color scheme toggle: recolors the window in place
+        self.theme_btn = self.theme.create(tk.Button, button_frame,
+                                           text=self._theme_button_text(),
+                                           command=self.switch_theme,
+                                           font='action_button',
+                                           bg='secondary',
+                                           fg='on_accent',
+                                           activebackground='primary',
+                                           activeforeground='on_accent',
+                                           relief='flat',
+                                           borderwidth=1,
+                                           highlightthickness=0,
+                                           highlightbackground='border',
+                                           padx=20,
+                                           pady=10,
+                                           cursor='hand2')
+        self.theme_btn.pack(side='left', padx=10)
+
+    def bind_keys(self):
+        """Bind R/P/S (or the rule set's keys) to the choices and T to turbo mode."""
+        for key, choice in self.key_bindings.items():
+            handler = lambda e, c=choice: self.play_round(c)
+            self.root.bind(f"<KeyPress-{key}>", handler)
+            self.root.bind(f"<KeyPress-{key.upper()}>", handler)
+        self.root.bind("<KeyPress-t>", lambda e: self.toggle_turbo())
+        self.root.bind("<KeyPress-T>", lambda e: self.toggle_turbo())
+
+    def _turbo_button_text(self) -> str:
+        """Label for the turbo toggle button."""
+        return "⚡ Turbo: On" if self.turbo else "⚡ Turbo: Off"
+
+    def toggle_turbo(self):
+        """Switch between animated and instant rounds."""
+        self.turbo = not self.turbo
+        if self.turbo_btn is not None:
+            self.turbo_btn.configure(text=self._turbo_button_text())
+        if not self.turbo:
+            # Make sure batched stats are on screen when leaving turbo
+            self.update_stats_display()
+
+    def _theme_button_text(self) -> str:
+        """Label for the theme toggle button."""
+        return f"🎨 {self.theme.label}"
+
+    def switch_theme(self, name: Optional[str] = None):
+        """Recolor the window with another scheme (the next one if ``name`` is None)."""
+        self.theme.use(name or self.theme.next_name())
+        self.root.title(f"Rock Paper Scissors 🎮 - {self.theme.label}")
+        if self.theme_btn is not None:
+            self.theme_btn.configure(text=self._theme_button_text())
 
     def center_window(self):
         """Center the window on the screen."""
-        self.root.update_idletasks()
-        x = (self.root.winfo_screenwidth() // 2) - (self.root.winfo_width() // 2)
-        y = (self.root.winfo_screenheight() // 2) - (self.root.winfo_height() // 2)
-        self.root.geometry(f"+{x}+{y}")
-
-    def disable_choice_buttons(self):
-        """Disable choice buttons during animation."""
-        # Store reference to choice buttons for easier access
-        if hasattr(self, 'choice_buttons'):
-            for btn in self.choice_buttons:
-                btn.configure(state='disabled', cursor='wait')
-    
-    def enable_choice_buttons(self):
-        """Re-enable choice buttons after animation."""
-        if hasattr(self, 'choice_buttons'):
-            for btn in self.choice_buttons:
-                btn.configure(state='normal', cursor='hand2')
+        # The size is fixed, so there is no need to force a layout pass first
+        width, height = self.window_size
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
+
+    def _show_queued_inputs(self, full: bool = False):
+        """Show how many inputs wait for the current round next to the player's title."""
+        if self.replay is not None:
+            return  # The whole recorded session is queued; nothing to show
+        queued = len(self.pending_choices)
+        if full:
+            text = f"You (queue full: {queued})"
+        else:
+            text = f"You (+{queued} queued)" if queued else "You"
+        self.view.render(self.player_title_label, text)
     
     def _disable_buttons_recursive(self, widget):
         """Recursively disable buttons in widget tree."""
@@ -396,134 +596,252 @@ class RockPaperScissorsGame:
     
     def animate_computer_choice(self, player_choice: Choice, computer_choice: Choice):
         """Animate the computer's choice selection with loading effect."""
-        total_frames = len(self.LOADING_FRAMES) * 4  # Extended animation
-        
-        if self.animation_frame < total_frames:
-            # Phase 1: Loading animation (first 75% of frames)
-            if self.animation_frame < total_frames * 0.75:
-                frame_index = self.animation_frame % len(self.LOADING_FRAMES)
-                self.computer_choice_label.configure(text=self.LOADING_FRAMES[frame_index])
-                
-                # Cycle through thinking messages
-                message_index = (self.animation_frame // 3) % len(self.THINKING_MESSAGES)
-                self.result_label.configure(text=self.THINKING_MESSAGES[message_index])
-                
-                # Speed up animation as it progresses
-                delay = max(80, 200 - (self.animation_frame * 3))
-            else:
-                # Phase 2: Dramatic countdown (last 25% of frames)
-                countdown_phase = self.animation_frame - int(total_frames * 0.75)
-                countdown_index = countdown_phase // 3
-                
-                if countdown_index < len(self.COUNTDOWN_MESSAGES):
-                    self.result_label.configure(text=self.COUNTDOWN_MESSAGES[countdown_index])
-                    self.computer_choice_label.configure(text="❓")
-                    delay = 400  # Slower for dramatic effect
-                else:
-                    delay = 100
+        self.animation_round = (player_choice, computer_choice)
+        self.animation_frame = 0
+        self._advance_animation()
+    
+    def _advance_animation(self):
+        """Apply the next precompiled animation step and schedule the one after."""
+        steps = self.animation_timeline.steps
+        
+        if self.animation_frame < len(steps):
+            updates, delay = steps[self.animation_frame]
+            for label, text in updates:
+                self.view.render(self.animation_labels[label], text)
             
             self.animation_frame += 1
-            self.root.after(delay, lambda: self.animate_computer_choice(player_choice, computer_choice))
+            # The bound method is reused for every tick, no per-tick closure
+            self.root.after(delay, self._advance_animation)
         else:
             # Animation finished, show final result
-            self.finish_round(player_choice, computer_choice)
-    
-    def finish_round(self, player_choice: Choice, computer_choice: Choice):
-        """Finish the round by showing final results."""
-        # Show computer's final choice with a brief flash effect
-        self.computer_choice_label.configure(text="💫")
-        self.result_label.configure(text="🎭 Revealing...")
-        
-        # After a brief pause, show the actual choice
-        self.root.after(300, lambda: self._reveal_final_result(player_choice, computer_choice))
+            player_choice, computer_choice = self.animation_round
+            self._reveal_final_result(player_choice, computer_choice)
     
     def _reveal_final_result(self, player_choice: Choice, computer_choice: Choice):
         """Reveal the final result with dramatic effect."""
         # Show computer's final choice
-        self.computer_choice_label.configure(text=self.EMOJIS[computer_choice])
+        self.view.render(self.computer_choice_label, self.choice_emojis[computer_choice])
         
         # Determine result
         result = self.determine_winner(player_choice, computer_choice)
         
-        # Update stats
-        self.update_stats(result)
+        # Update stats and let an adaptive opponent learn from the round
+        self.update_stats(result, player_choice, computer_choice)
+        if self.variant is None:
+            self.engine.observe(player_choice, computer_choice)
+            if self.network is None:
+                self.session_log.append(player_choice, computer_choice)
         
         # Display result with enhanced messages
         self.display_result(player_choice, computer_choice, result)
         
-        # Re-enable buttons and reset animation state
+        # Reset animation state
         self.animation_running = False
-        self.enable_choice_buttons()
+        
+        self.view.end_round()
+        
+        # Play any input that arrived during the animation
+        if self.pending_choices:
+            self.root.after_idle(self._play_queued_choice)
+        elif self.replay is not None and len(self.session_log) >= len(self.replay):
+            self._finish_replay()
+
+    def _play_queued_choice(self):
+        """Play the oldest input queued during an animation."""
+        if self.pending_choices and not self.animation_running:
+            player_choice = self.pending_choices.popleft()
+            self._show_queued_inputs()
+            self.play_round(player_choice)
 
     def play_round(self, player_choice: Choice):
         """Play a single round of the game with loading animation."""
         if self.animation_running:
-            return  # Prevent multiple animations running simultaneously
+            # Queue clicks and keys alike instead of running animations simultaneously
+            if len(self.pending_choices) >= self.MAX_QUEUED_INPUTS:
+                self.rejected_inputs += 1
+                self.root.bell()
+                self._show_queued_inputs(full=True)
+                return
+            self.pending_choices.append(player_choice)
+            self._show_queued_inputs()
+            return
+        
+        self.view.begin_round()
         
-        # Disable buttons during animation
-        self.disable_choice_buttons()
+        if self.network is not None:
+            self.play_network_round(player_choice)
+            return
+        
+        if self.turbo:
+            self.play_turbo_round(player_choice)
+            return
         
         # Show player choice immediately
-        self.player_choice_label.configure(text=self.EMOJIS[player_choice])
+        self.view.render(self.player_choice_label, self.choice_emojis[player_choice])
         
         # Start loading animation for computer choice
         self.animation_running = True
         self.animation_frame = 0
-        computer_choice = random.choice(list(Choice))
+        computer_choice = self.computer_choice()
         
         # Start the loading animation
         self.animate_computer_choice(player_choice, computer_choice)
 
+    def start_replay(self, session: SessionLog):
+        """Feed a recorded session's choices through the full round pipeline at maximum speed."""
+        self.replay = session
+        self.animation_timeline = self.animation_timeline.scaled(0)
+        # Each reveal plays the next queued choice, so the whole session runs unattended
+        self.pending_choices = deque(session.player_choices())
+        self._replay_started = time.perf_counter()
+        if self.pending_choices:
+            self.root.after_idle(self._play_queued_choice)
+        else:
+            self._finish_replay()
+
+    def _finish_replay(self):
+        """Report the replay's speed and whether it reproduced the recording, then quit."""
+        elapsed = time.perf_counter() - self._replay_started
+        rounds = len(self.session_log)
+        print(f"🔁 Replayed {rounds:,} rounds in {elapsed:.2f}s "
+              f"({rounds / elapsed if elapsed else 0.0:,.0f} rounds/s)")
+        divergence = first_divergence(self.replay, self.session_log)
+        if divergence is None:
+            print("✅ Every computer move matched the recording")
+        else:
+            print(f"❌ Computer moves diverge from the recording at round {divergence + 1}")
+        self.replay = None
+        self.shutdown()
+
+    def play_turbo_round(self, player_choice: Choice):
+        """Resolve a round immediately, without scheduling any animation."""
+        self.view.render(self.player_choice_label, self.choice_emojis[player_choice])
+        self._reveal_final_result(player_choice, self.computer_choice())
+
+    def computer_choice(self):
+        """The computer's next move: from the opponent strategy, or uniformly for a variant."""
+        if self.variant is None:
+            return self.engine.computer_choice()
+        return self.variant.choices[self.rng.randrange(self.variant.size)]
+
+    def start_network_session(self, host: str, port: int):
+        """Connect to a match server and wait for a human opponent."""
+        # asyncio is only needed for network play, so keep it off the startup path
+        from netplay import NetworkSession
+        self.network = NetworkSession(self.pump, host, port, self.profile,
+                                      on_status=self._on_network_waiting,
+                                      on_matched=self._on_network_matched,
+                                      on_result=self._on_network_result,
+                                      on_error=self._on_network_waiting,
+                                      on_disconnected=self._on_network_disconnected)
+        self._on_network_waiting("🌐 Connecting...")
+        self.network.start()
+
+    def play_network_round(self, player_choice: Choice):
+        """Send a move to the match server; the result arrives via the pump."""
+        self.animation_running = True
+        self.view.render(self.player_choice_label, self.choice_emojis[player_choice])
+        self.view.render(self.computer_choice_label, self.LOADING_FRAMES[0])
+        self.view.render(self.result_label, "⏳ Waiting for your opponent's move...")
+        self.network.submit(player_choice)
+
+    def _on_network_waiting(self, text: str):
+        """Show a status message while no match is in progress."""
+        self.animation_running = True  # Queue any input until matched
+        self.view.render(self.opponent_title_label, "Opponent")
+        self.view.render(self.result_label, text)
+
+    def _on_network_matched(self, opponent_name: str):
+        """A human opponent was found: let the player choose."""
+        self.view.render(self.opponent_title_label, opponent_name)
+        self.view.render(self.result_label, f"🎮 Matched with {opponent_name}! Choose your weapon!")
+        self.animation_running = False
+        if self.pending_choices:
+            self.root.after_idle(self._play_queued_choice)
+
+    def _on_network_result(self, player_choice: Choice, opponent_choice: Choice, result: GameResult):
+        """Show a round resolved by the match server."""
+        self._reveal_final_result(player_choice, opponent_choice)
+
+    def _on_network_disconnected(self, text: str):
+        """Fall back to playing the computer when the server is unreachable."""
+        self.network = None
+        self.view.render(self.opponent_title_label, "Computer")
+        self.view.render(self.result_label, f"{text} Playing against the computer.")
+        self.animation_running = False
+
     def determine_winner(self, player_choice: Choice, computer_choice: Choice) -> GameResult:
         """Determine the winner of the round."""
-        if player_choice == computer_choice:
-            return GameResult.TIE
-        elif self.RULES[player_choice] == computer_choice:
-            return GameResult.WIN
-        else:
-            return GameResult.LOSE
+        return self._resolve(player_choice, computer_choice)
 
-    def update_stats(self, result: GameResult):
-        """Update game statistics."""
-        self.stats.total_games += 1
+    def update_stats(self, result: GameResult, player_choice: Choice, computer_choice: Choice):
+        """Update game statistics and persist the round."""
+        self.stats.record(result)
         
-        if result == GameResult.WIN:
-            self.stats.wins += 1
-        elif result == GameResult.LOSE:
-            self.stats.losses += 1
+        if self.turbo:
+            self.schedule_stats_display()
         else:
-            self.stats.ties += 1
-        
+            self.update_stats_display()
+        self.record_round(player_choice, computer_choice, result)
+
+    def schedule_stats_display(self):
+        """Refresh the stats once the event queue is idle, coalescing rapid rounds."""
+        if not self._stats_display_scheduled:
+            self._stats_display_scheduled = True
+            self.root.after_idle(self._flush_stats_display)
+
+    def _flush_stats_display(self):
+        """Run a scheduled stats refresh."""
+        self._stats_display_scheduled = False
         self.update_stats_display()
-        self.save_stats()
 
     def update_stats_display(self):
         """Update the statistics display."""
-        self.wins_label.configure(text=f"Wins: {self.stats.wins}")
-        self.losses_label.configure(text=f"Losses: {self.stats.losses}")
-        self.ties_label.configure(text=f"Ties: {self.stats.ties}")
-        self.winrate_label.configure(text=f"Win Rate: {self.stats.win_rate:.1f}%")
+        if not self.panels_built:
+            return  # Shown when the stats panel is built
+        # Only counters that changed reach Tk
+        self.view.render(self.wins_label, self.stats.wins, "Wins: {}")
+        self.view.render(self.losses_label, self.stats.losses, "Losses: {}")
+        self.view.render(self.ties_label, self.stats.ties, "Ties: {}")
+        self.view.render(self.winrate_label, round(self.stats.win_rate, 1), "Win Rate: {:.1f}%")
+
+    def build_result_messages(self) -> dict:
+        """Precompute the result message for every pair of choices."""
+        messages = {}
+        for player_choice in self.choices:
+            for computer_choice in self.choices:
+                result = self.determine_winner(player_choice, computer_choice)
+                if self.variant is not None and result != GameResult.TIE:
+                    # Variants say how the winner won, e.g. "Spock vaporizes Rock"
+                    how = describe(self.variant, player_choice, computer_choice, result)
+                    text = (f"🎉 VICTORY! {how}! 🏆" if result == GameResult.WIN
+                            else f"� DEFEAT! {how}! 😢")
+                elif result == GameResult.WIN:
+                    text = f"🎉 VICTORY! {self.choice_names[player_choice]} beats {self.choice_names[computer_choice]}! 🏆"
+                elif result == GameResult.LOSE:
+                    text = f"� DEFEAT! {self.choice_names[computer_choice]} beats {self.choice_names[player_choice]}! 😢"
+                else:
+                    text = f"🤝 TIE GAME! You both chose {self.choice_names[player_choice]}! 🎯"
+                messages[(player_choice, computer_choice)] = text
+        return messages
 
     def display_result(self, player_choice: Choice, computer_choice: Choice, result: GameResult):
         """Display the round result with enhanced messages."""
-        messages = {
-            GameResult.WIN: f"🎉 VICTORY! {player_choice.value.title()} beats {computer_choice.value.title()}! 🏆",
-            GameResult.LOSE: f"� DEFEAT! {computer_choice.value.title()} beats {player_choice.value.title()}! 😢",
-            GameResult.TIE: f"🤝 TIE GAME! You both chose {player_choice.value.title()}! 🎯"
-        }
+        self.view.render(self.result_label, self.result_messages[(player_choice, computer_choice)])
         
-        self.result_label.configure(text=messages[result])
+        if self.turbo:
+            return  # No per-round effects in turbo mode
         
         # Add a subtle color effect to the result message based on outcome
         if result == GameResult.WIN:
             # Briefly highlight in success color
-            self.root.after(100, lambda: self._flash_result_color(self.COLORS['success']))
+            self.root.after(100, lambda: self._flash_result_color(self.theme.colors['success']))
         elif result == GameResult.LOSE:
             # Briefly highlight in danger color
-            self.root.after(100, lambda: self._flash_result_color(self.COLORS['danger']))
+            self.root.after(100, lambda: self._flash_result_color(self.theme.colors['danger']))
         else:
             # Briefly highlight in warning color for tie
-            self.root.after(100, lambda: self._flash_result_color(self.COLORS['warning']))
+            self.root.after(100, lambda: self._flash_result_color(self.theme.colors['warning']))
     
     def _flash_result_color(self, color):
         """Flash the result area with a color for visual feedback."""
@@ -539,43 +857,94 @@ class RockPaperScissorsGame:
             self.save_stats()
             
             # Reset visual elements
-            self.player_choice_label.configure(text="❓")
-            self.computer_choice_label.configure(text="❓")
-            self.result_label.configure(text="Statistics reset! Choose your weapon to start!")
+            self.view.render(self.player_choice_label, "❓")
+            self.view.render(self.computer_choice_label, "❓")
+            self.view.render(self.result_label, "Statistics reset! Choose your weapon to start!")
             
             # Reset animation state
             self.animation_running = False
             self.animation_frame = 0
-            self.enable_choice_buttons()
+            self.pending_choices.clear()
+            self._show_queued_inputs()
 
     def load_stats(self):
-        """Load statistics from file."""
+        """Load the current profile's statistics on a background thread."""
+        threading.Thread(target=self._load_stats_worker, name='StatsLoader', daemon=True).start()
+
+    def _load_stats_worker(self):
+        """Open the backend and read the stats, then hand them to the Tk thread."""
+        start = time.perf_counter()
+        backend = self.backend
+        stats = GameStats()
         try:
-            if os.path.exists('game_stats.json'):
-                with open('game_stats.json', 'r') as f:
-                    data = json.load(f)
-                    self.stats = GameStats(**data)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.stats = GameStats()
+            if backend is None:
+                backend = SQLiteBackend(self.db_path)
+            stats = backend.load_stats(self.profile)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error loading stats: {e}")
+        PROFILE.record('load stats (background)', time.perf_counter() - start)
+        self.pump.post(self._on_stats_loaded, backend, stats)
+
+    def _on_stats_loaded(self, backend: Optional[StatsBackend], stats: GameStats):
+        """Adopt the loaded stats and start writing, replaying early writes."""
+        pending, self._pending_writes = self._pending_writes, None
+        # Rounds played before the load finished count on top of the saved ones,
+        # unless the player already reset the stats
+        if not any(kind == 'snapshot' for kind, _ in pending):
+            self.stats = stats.merge(self.stats)
+        self.backend = backend
+        if backend is not None:
+            self.writer = StatsWriter(backend, self.profile)
+            self.writer.start()
+            for kind, payload in pending:
+                if kind == 'round':
+                    self.writer.record_round(*payload)
+                else:
+                    self.writer.save_snapshot(payload)
+        self.update_stats_display()
+        self._startup_step_done('stats loaded')
+
+    def record_round(self, player_choice: Choice, computer_choice: Choice, result: GameResult):
+        """Queue a finished round for the background stats writer."""
+        if self.variant is not None:
+            # Round history stores classic choice codes; variants keep their totals only
+            self.save_stats()
+            return
+        if self.writer is not None:
+            self.writer.record_round(player_choice, computer_choice, result)
+        elif self._pending_writes is not None:
+            self._pending_writes.append(('round', (player_choice, computer_choice, result)))
 
     def save_stats(self):
-        """Save statistics to file."""
-        try:
-            with open('game_stats.json', 'w') as f:
-                json.dump({
-                    'wins': self.stats.wins,
-                    'losses': self.stats.losses,
-                    'ties': self.stats.ties,
-                    'total_games': self.stats.total_games
-                }, f)
-        except Exception as e:
-            print(f"Error saving stats: {e}")
+        """Queue a snapshot of the current statistics."""
+        if self.writer is not None:
+            self.writer.save_snapshot(self.stats)
+        elif self._pending_writes is not None:
+            self._pending_writes.append(('snapshot', GameStats(**self.stats.to_dict())))
 
     def exit_game(self):
         """Exit the game with confirmation."""
         if messagebox.askyesno("Exit Game", "Are you sure you want to exit?"):
-            self.save_stats()
-            self.root.quit()
+            self.shutdown()
+
+    def shutdown(self):
+        """Save everything, stop the background workers and leave the main loop."""
+        self.save_stats()
+        if self.writer is not None:
+            self.writer.close()
+        if self.instrumentation is not None and self.trace_path:
+            self.instrumentation.export_chrome_trace(self.trace_path)
+            print(f"📈 Trace written to {self.trace_path}")
+        if self.record_path:
+            try:
+                self.session_log.save(self.record_path)
+                print(f"💾 Session (seed {self.seed}) saved to {self.record_path}")
+            except OSError as e:
+                print(f"Error saving session: {e}")
+        if self.network is not None:
+            self.network.close()
+        self.pump.stop()
+        self.root.quit()
 
     def run(self):
         """Run the game."""
@@ -587,11 +956,86 @@ class RockPaperScissorsGame:
 
 def main():
     """Main function to start the game."""
-    print("🎮 Starting Rock-Paper-Scissors Game (Dark Mode)...")
+    parser = argparse.ArgumentParser(description="Rock-Paper-Scissors game")
+    parser.add_argument("--opponent", choices=sorted(STRATEGIES), default="random",
+                        help="computer strategy (default: random)")
+    parser.add_argument("--turbo", action="store_true",
+                        help="start in turbo mode: no animation, play with R/P/S keys")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE,
+                        help="player profile to load and save stats for")
+    parser.add_argument("--db", default=None,
+                        help="stats database path (default: per-user data directory)")
+    parser.add_argument("--connect", metavar="HOST:PORT", default=None,
+                        help="play a human opponent through a match server")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print time to first frame and per-phase startup timings")
+    parser.add_argument("--instrument", action="store_true",
+                        help="time the hot paths; press F12 for the overlay")
+    parser.add_argument("--trace", metavar="FILE", default=None,
+                        help="write a Chrome trace-event JSON file on exit (implies --instrument)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for the computer's moves (default: fresh per session)")
+    parser.add_argument("--record", metavar="FILE", default=None,
+                        help="save the session's seed and moves on exit for --replay")
+    parser.add_argument("--replay", metavar="FILE", default=None,
+                        help="replay a recorded session through the GUI at full speed, then exit")
+    parser.add_argument("--rules", metavar="NAME_OR_FILE", default=None,
+                        help="play a variant rule set (shipped: "
+                             f"{', '.join(available_rulesets()) or 'none'}) or a rule file")
+    parser.add_argument("--theme", choices=list(THEMES), default=DEFAULT_THEME,
+                        help=f"color scheme (default: {DEFAULT_THEME})")
+    args = parser.parse_args()
+    
+    server = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(':')
+        if not host or not port.isdigit():
+            parser.error("--connect expects HOST:PORT")
+        server = (host, int(port))
+    
+    print(f"🎮 Starting Rock-Paper-Scissors Game ({THEME_LABELS[args.theme]})...")
     print("💡 Close the game window or click 'Exit Game' to quit.")
-    print("🌙 Enjoy the beautiful dark theme!")
+    print(THEME_GREETINGS[args.theme])
+    
+    rules = None
+    if args.rules:
+        try:
+            rules = load_ruleset(args.rules)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot load rule set {args.rules}: {e}")
+        if server is not None or args.replay or args.record:
+            parser.error("--rules cannot be combined with --connect, --replay or --record")
+        if args.opponent != "random":
+            parser.error("rule set variants are played against the random opponent")
+    
+    session = None
+    if args.replay:
+        try:
+            session = SessionLog.load(args.replay)
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"cannot read session {args.replay}: {e}")
+        if session.opponent not in STRATEGIES:
+            parser.error(f"session uses unknown opponent {session.opponent!r}")
+        if server is not None:
+            parser.error("--replay cannot be combined with --connect")
     
-    game = RockPaperScissorsGame()
+    PROFILE.mark('parse arguments')
+    instrumentation = Instrumentation() if args.instrument or args.trace else None
+    if session is not None:
+        # Replays never touch the real profile's stats
+        game = RockPaperScissorsGame(opponent=session.opponent, turbo=args.turbo,
+                                     backend=SQLiteBackend(':memory:', legacy_paths=[]),
+                                     instrumentation=instrumentation, trace_path=args.trace,
+                                     seed=session.seed, record_path=args.record,
+                                     theme=args.theme)
+        game.start_replay(session)
+    else:
+        game = RockPaperScissorsGame(opponent=args.opponent, turbo=args.turbo,
+                                     profile=args.profile, server=server, db_path=args.db,
+                                     startup_profile=args.startup_profile,
+                                     instrumentation=instrumentation, trace_path=args.trace,
+                                     seed=args.seed, record_path=args.record, rules=rules,
+                                     theme=args.theme)
     game.run()
 
 if __name__ == "__main__":
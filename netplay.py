@@ -0,0 +1,101 @@
+"""
+Rock-Paper-Scissors Network Play
+Runs a match server connection on a background thread for the GUI.
+
+``NetworkSession`` owns an asyncio event loop in a daemon thread.  The GUI
+calls ``submit(choice)`` from the Tk thread; everything the session learns
+(status changes, matches, round results, errors) is reported back through
+the ``EventPump``, so the callbacks always run on the Tk thread.
+"""
+
+import asyncio
+import threading
+from typing import Callable
+
+from client import MatchClient, MatchEnded, MatchError
+from engine import Choice
+from pump import EventPump
+
+
+class NetworkSession:
+    """A background connection that plays rounds against a remote human."""
+
+    def __init__(self, pump: EventPump, host: str, port: int, name: str,
+                 on_status: Callable, on_matched: Callable,
+                 on_result: Callable, on_error: Callable,
+                 on_disconnected: Callable):
+        """Configure the server address, player name and Tk-thread callbacks.
+
+        ``on_status(text)``, ``on_matched(opponent_name)``,
+        ``on_result(player_choice, opponent_choice, result)``, ``on_error(text)``
+        (match ended, the session rejoins the queue) and
+        ``on_disconnected(text)`` (the session is over) are always invoked
+        through ``pump``.
+        """
+        self.pump = pump
+        self.host = host
+        self.port = port
+        # Names are one printable-ASCII protocol word
+        name = ''.join(ch for ch in name if ch.isascii() and (ch.isprintable() or ch.isspace()))
+        self.name = '_'.join(name.split()) or 'player'
+        self.on_status = on_status
+        self.on_matched = on_matched
+        self.on_result = on_result
+        self.on_error = on_error
+        self.on_disconnected = on_disconnected
+        self._loop = None
+        self._choices = None
+        self._thread = None
+        self._closed = False
+
+    def start(self):
+        """Connect and look for an opponent in the background."""
+        self._thread = threading.Thread(target=self._run, name='NetworkSession', daemon=True)
+        self._thread.start()
+
+    def submit(self, choice: Choice):
+        """Play ``choice`` in the current match (called on the Tk thread)."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._choices.put_nowait, choice)
+
+    def close(self):
+        """Disconnect and stop the background thread."""
+        self._closed = True
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._choices.put_nowait, None)
+
+    def _run(self):
+        """Thread entry point: run the session's event loop."""
+        try:
+            asyncio.run(self._main())
+        except (OSError, MatchError) as e:
+            self.pump.post(self.on_disconnected, f"🔌 Connection lost: {e}.")
+        except Exception as e:  # Never let the thread die without telling the GUI
+            self.pump.post(self.on_disconnected, f"🔌 Network error: {e}.")
+
+    async def _main(self):
+        """Join, play submitted moves, and rejoin when a match ends."""
+        self._choices = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        client = MatchClient(self.host, self.port)
+        self.pump.post(self.on_status, f"🌐 Connecting to {self.host}:{self.port}...")
+        await client.connect()
+        try:
+            while not self._closed:
+                self.pump.post(self.on_status, "🔎 Looking for an opponent...")
+                opponent = None
+                try:
+                    opponent = await client.join(self.name)
+                    self.pump.post(self.on_matched, opponent)
+                    while True:
+                        choice = await self._choices.get()
+                        if choice is None:
+                            return
+                        result, opponent_choice = await client.play(choice)
+                        self.pump.post(self.on_result, choice, opponent_choice, result)
+                except MatchError as e:
+                    if opponent is None and not isinstance(e, MatchEnded):
+                        raise  # The server refused the JOIN; retrying would not help
+                    self.pump.post(self.on_error, f"👋 Match ended: {e}")
+        finally:
+            await client.close()
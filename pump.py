@@ -0,0 +1,117 @@
+"""
+Rock-Paper-Scissors Event Pump
+Thread-safe hand-off from background workers to the Tk main loop.
+
+Tk widgets may only be touched from the thread running ``mainloop``.
+Workers call ``EventPump.post(callback, *args)`` from any thread; a single
+periodic ``root.after`` tick on the main thread drains the queue and runs
+the callbacks.  Each tick stops after ``max_batch`` events or once
+``budget_ms`` has been spent, so a burst of worker results can never stall
+the UI.  When a backlog remains, the next tick is scheduled right away
+instead of after the full interval.
+"""
+
+import queue
+import time
+import traceback
+
+
+class EventPump:
+    """Runs callbacks posted from any thread on the Tk main thread."""
+
+    def __init__(self, root, interval_ms: int = 16, max_batch: int = 64,
+                 budget_ms: float = 8.0):
+        """Attach to ``root`` with the given tick interval and per-tick limits."""
+        self.root = root
+        self.interval_ms = interval_ms
+        self.max_batch = max_batch
+        self.budget = budget_ms / 1000
+        self._queue = queue.SimpleQueue()
+        self._after_id = None
+
+        # Metrics
+        self.ticks = 0
+        self.events_processed = 0
+        self.last_drain_ms = 0.0
+        self.max_drain_ms = 0.0
+        self.budget_overruns = 0
+
+    def post(self, callback, *args):
+        """Queue ``callback(*args)`` to run on the Tk thread. Safe from any thread."""
+        self._queue.put((callback, args))
+
+    @property
+    def backlog(self) -> int:
+        """Approximate number of events waiting to run."""
+        return self._queue.qsize()
+
+    def start(self):
+        """Begin ticking."""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        """Stop ticking; queued events stay queued."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def drain(self, max_events: int = 0) -> int:
+        """Run queued events now (all of them if ``max_events`` is 0)."""
+        processed = 0
+        while not max_events or processed < max_events:
+            try:
+                callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._run(callback, args)
+            processed += 1
+        self.events_processed += processed
+        return processed
+
+    def _run(self, callback, args):
+        """Run one callback, keeping the pump alive if it raises."""
+        try:
+            callback(*args)
+        except Exception:
+            traceback.print_exc()
+
+    def _tick(self):
+        """Drain one bounded batch, then reschedule."""
+        start = time.perf_counter()
+        deadline = start + self.budget
+        processed = 0
+        get = self._queue.get_nowait
+
+        while processed < self.max_batch:
+            try:
+                callback, args = get()
+            except queue.Empty:
+                break
+            self._run(callback, args)
+            processed += 1
+            if time.perf_counter() >= deadline:
+                self.budget_overruns += 1
+                break
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.ticks += 1
+        self.events_processed += processed
+        self.last_drain_ms = elapsed_ms
+        if elapsed_ms > self.max_drain_ms:
+            self.max_drain_ms = elapsed_ms
+
+        # Catch up quickly on a backlog, otherwise idle until the next interval
+        delay = 1 if processed and not self._queue.empty() else self.interval_ms
+        self._after_id = self.root.after(delay, self._tick)
+
+    def metrics(self) -> dict:
+        """Return tick and drain-time figures."""
+        return {
+            'backlog': self.backlog,
+            'ticks': self.ticks,
+            'events_processed': self.events_processed,
+            'last_drain_ms': self.last_drain_ms,
+            'max_drain_ms': self.max_drain_ms,
+            'budget_overruns': self.budget_overruns
+        }
@@ -0,0 +1,174 @@
+"""
+Rock-Paper-Scissors Session Replay
+Seeded sessions that can be recorded and played back exactly.
+
+Every game session owns a ``random.Random`` seeded with a per-session seed,
+and the computer opponent draws only from that generator.  A ``SessionLog``
+stores the seed, the opponent strategy and each round as one packed digit
+(``player * 3 + computer``), so replaying the player's choices against a
+fresh opponent with the same seed must reproduce every computer move.
+``python replay.py session.json`` replays a log through the headless engine;
+``python main.py --replay session.json`` drives the full GUI at maximum speed.
+"""
+
+import argparse
+import json
+import random
+import secrets
+import time
+from typing import List, Optional
+
+from engine import CHOICE_CODES, CHOICE_ORDER, Choice, GameEngine, GameStats
+from strategies import STRATEGIES, create_opponent
+
+SESSION_VERSION = 1
+
+
+def new_session_seed() -> int:
+    """A fresh random 64-bit seed for a new session."""
+    return secrets.randbits(64)
+
+
+def session_rng(seed: int) -> random.Random:
+    """The generator that drives the computer for the session with ``seed``."""
+    return random.Random(seed)
+
+
+class SessionLog:
+    """The seed, opponent and rounds of one session."""
+
+    def __init__(self, seed: int, opponent: str = "random", rounds: str = ""):
+        """Start a log for ``seed``; ``rounds`` holds packed round digits."""
+        self.seed = seed
+        self.opponent = opponent
+        self._digits = bytearray(rounds, 'ascii')  # One ASCII digit per round
+
+    @property
+    def rounds(self) -> str:
+        """Every round so far as a string of packed digits."""
+        return self._digits.decode('ascii')
+
+    def __len__(self) -> int:
+        return len(self._digits)
+
+    def append(self, player_choice: Choice, computer_choice: Choice):
+        """Record one round."""
+        self._digits.append(48 + CHOICE_CODES[player_choice] * 3 + CHOICE_CODES[computer_choice])
+
+    def player_choices(self) -> List[Choice]:
+        """The player's moves, in order."""
+        return [CHOICE_ORDER[(digit - 48) // 3] for digit in self._digits]
+
+    def computer_choices(self) -> List[Choice]:
+        """The computer's moves, in order."""
+        return [CHOICE_ORDER[(digit - 48) % 3] for digit in self._digits]
+
+    def new_engine(self) -> GameEngine:
+        """A fresh engine whose opponent replays this session's random draws."""
+        return GameEngine(create_opponent(self.opponent, session_rng(self.seed)))
+
+    def to_dict(self) -> dict:
+        """Convert the log to a JSON-serializable dictionary."""
+        return {'version': SESSION_VERSION, 'seed': self.seed,
+                'opponent': self.opponent, 'rounds': self.rounds}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionLog":
+        """Create a log from a dictionary written by ``to_dict``."""
+        if not isinstance(data, dict):
+            raise ValueError("a session log must be a JSON object")
+        rounds = str(data.get('rounds', ''))
+        if not all(code in '012345678' for code in rounds):
+            raise ValueError("session rounds must be digits 0-8")
+        try:
+            seed = int(data['seed'])
+        except TypeError:
+            raise ValueError("session seed must be an integer") from None
+        return cls(seed, str(data.get('opponent', 'random')), rounds)
+
+    def save(self, path: str):
+        """Write the log as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "SessionLog":
+        """Read a log written by ``save``."""
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+def first_divergence(expected: SessionLog, actual: SessionLog) -> Optional[int]:
+    """Index of the first round that differs between two logs, or None if they match."""
+    expected_rounds, actual_rounds = expected.rounds, actual.rounds
+    for index, (want, got) in enumerate(zip(expected_rounds, actual_rounds)):
+        if want != got:
+            return index
+    if len(expected_rounds) != len(actual_rounds):
+        return min(len(expected_rounds), len(actual_rounds))
+    return None
+
+
+def replay_engine(session: SessionLog) -> dict:
+    """Replay the player's choices through a fresh headless engine."""
+    engine = session.new_engine()
+    replayed = SessionLog(session.seed, session.opponent)
+    start = time.perf_counter()
+    for player_choice in session.player_choices():
+        computer_choice = engine.computer_choice()
+        engine.play_round(player_choice, computer_choice)
+        replayed.append(player_choice, computer_choice)
+    elapsed = time.perf_counter() - start
+    return {
+        'rounds': len(replayed),
+        'elapsed_s': elapsed,
+        'rounds_per_sec': len(replayed) / elapsed if elapsed else 0.0,
+        'stats': engine.stats,
+        'divergence': first_divergence(session, replayed)
+    }
+
+
+def record_session(opponent: str, rounds: int, seed: int, player_seed: int = 0) -> SessionLog:
+    """Play ``rounds`` random player moves against ``opponent`` and log them."""
+    session = SessionLog(seed, opponent)
+    engine = session.new_engine()
+    player_rng = random.Random(player_seed)
+    for _ in range(rounds):
+        player_choice = player_rng.choice(CHOICE_ORDER)
+        computer_choice = engine.computer_choice()
+        engine.play_round(player_choice, computer_choice)
+        session.append(player_choice, computer_choice)
+    return session
+
+
+def main():
+    """Command-line entry point: replay a session log, or record a synthetic one."""
+    parser = argparse.ArgumentParser(description="Replay a recorded Rock-Paper-Scissors session")
+    parser.add_argument("session", help="session log (JSON) to replay, or to create with --generate")
+    parser.add_argument("--generate", type=int, metavar="ROUNDS", default=None,
+                        help="write a synthetic session with this many random player moves")
+    parser.add_argument("--opponent", choices=sorted(STRATEGIES), default="random",
+                        help="strategy for --generate")
+    parser.add_argument("--seed", type=int, default=None, help="session seed for --generate")
+    args = parser.parse_args()
+
+    if args.generate is not None:
+        seed = new_session_seed() if args.seed is None else args.seed
+        record_session(args.opponent, args.generate, seed).save(args.session)
+        print(f"💾 Wrote {args.generate:,} rounds (seed {seed}) to {args.session}")
+        return
+
+    report = replay_engine(SessionLog.load(args.session))
+    stats: GameStats = report['stats']
+    print(f"🔁 Replayed {report['rounds']:,} rounds in {report['elapsed_s'] * 1000:.1f} ms "
+          f"({report['rounds_per_sec']:,.0f} rounds/s)")
+    print(f"📊 Wins {stats.wins}, losses {stats.losses}, ties {stats.ties} "
+          f"({stats.win_rate:.1f}% win rate)")
+    if report['divergence'] is None:
+        print("✅ Every computer move matched the recording")
+    else:
+        print(f"❌ Computer moves diverge from the recording at round {report['divergence'] + 1}")
+
+
+if __name__ == "__main__":
+    main()
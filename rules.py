@@ -0,0 +1,184 @@
+"""
+Rock-Paper-Scissors Rule Sets
+Game variants with any number of choices, loaded from data files.
+
+A rule set is a JSON file in ``rulesets/`` listing the choices and who beats
+whom, either explicitly (``"rules": [["scissors", "cuts", "paper"], ...]``)
+or as a balanced cycle (``"cyclic": true``: with an odd number of choices,
+each one beats the ``(N - 1) / 2`` choices that follow it in the list).  At
+load time the rules are validated and compiled into a flat ``N * N``
+outcome table, so resolving a round is one indexed read whatever the number
+of choices.  The classic three-choice game is built from the engine's
+``RULES`` and needs no file.
+"""
+
+import json
+import os
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from engine import RESULT_CODES, RESULT_ORDER, RULES, CHOICE_ORDER, GameResult
+
+RULESET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rulesets')
+
+_TIE = RESULT_CODES[GameResult.TIE]
+_WIN = RESULT_CODES[GameResult.WIN]
+_LOSE = RESULT_CODES[GameResult.LOSE]
+
+_CLASSIC_EMOJIS = {'rock': "🪨", 'paper': "📄", 'scissors': "✂️"}
+_RESERVED_KEYS = {'t': "turbo mode"}
+
+
+class RuleChoice(NamedTuple):
+    """One choice of a rule set; ``index`` is its row/column in the outcome table."""
+    index: int
+    id: str
+    name: str
+    emoji: str
+    key: str = ''
+
+
+class RuleSet:
+    """A validated rule set compiled into an outcome table."""
+
+    def __init__(self, name: str, choices: Sequence[RuleChoice],
+                 beats: Dict[Tuple[int, int], str]):
+        """Compile ``beats`` (``(winner, loser)`` index pairs mapped to a verb).
+
+        Every pair of different choices must be decided exactly once.
+        """
+        self.name = name
+        self.choices = tuple(choices)
+        self.size = len(self.choices)
+        if self.size < 3:
+            raise ValueError(f"rule set {name!r} needs at least 3 choices")
+
+        table = bytearray(self.size * self.size)  # TIE on the diagonal
+        for winner, loser in beats:
+            if winner == loser:
+                raise ValueError(f"{self.choices[winner].name} cannot beat itself")
+            if (loser, winner) in beats:
+                raise ValueError(f"{self.choices[winner].name} and {self.choices[loser].name} "
+                                 f"beat each other")
+            table[winner * self.size + loser] = _WIN
+            table[loser * self.size + winner] = _LOSE
+        missing = [(a, b) for a in range(self.size) for b in range(a + 1, self.size)
+                   if table[a * self.size + b] == _TIE]
+        if missing:
+            a, b = missing[0]
+            raise ValueError(f"rule set {name!r} does not say who wins between "
+                             f"{self.choices[a].name} and {self.choices[b].name} "
+                             f"({len(missing)} pairs undecided)")
+
+        # Result codes for bulk use, and the same table as enum members for the GUI
+        self.outcome_codes = bytes(table)
+        self.outcomes = tuple(RESULT_ORDER[code] for code in table)
+        self.verbs = dict(beats)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def determine_winner(self, player: RuleChoice, computer: RuleChoice) -> GameResult:
+        """Result of a round from the player's point of view."""
+        return self.outcomes[player.index * self.size + computer.index]
+
+    def verb(self, winner: RuleChoice, loser: RuleChoice) -> str:
+        """How ``winner`` beats ``loser`` (e.g. "vaporizes")."""
+        return self.verbs.get((winner.index, loser.index), "beats")
+
+    def choice(self, choice_id: str) -> RuleChoice:
+        """Look a choice up by its id."""
+        for choice in self.choices:
+            if choice.id == choice_id:
+                return choice
+        raise KeyError(choice_id)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RuleSet":
+        """Build a rule set from parsed rule-file JSON."""
+        if not isinstance(data, dict):
+            raise ValueError("a rule set must be a JSON object")
+        name = str(data.get('name', 'Custom'))
+        choices = []
+        keys: Dict[str, str] = {}
+        for index, entry in enumerate(data['choices']):
+            if isinstance(entry, str):
+                entry = {'id': entry}
+            choice_id = str(entry['id'])
+            key = str(entry.get('key', '')).lower()  # Bound in both cases
+            if key:
+                if len(key) != 1 or not (key.isascii() and key.isalnum()):
+                    raise ValueError(f"key {key!r} of {choice_id} must be a single letter or digit")
+                if key in _RESERVED_KEYS:
+                    raise ValueError(f"key {key!r} of {choice_id} is reserved for {_RESERVED_KEYS[key]}")
+                if key in keys:
+                    raise ValueError(f"key {key!r} is used by both {keys[key]} and {choice_id}")
+                keys[key] = choice_id
+            choices.append(RuleChoice(index, choice_id, str(entry.get('name', choice_id.title())),
+                                      str(entry.get('emoji', '')), key))
+        index_of = {choice.id: choice.index for choice in choices}
+        if len(index_of) != len(choices):
+            raise ValueError(f"rule set {name!r} lists a choice twice")
+
+        beats: Dict[Tuple[int, int], str] = {}
+        if data.get('cyclic'):
+            size = len(choices)
+            if size % 2 == 0:
+                raise ValueError(f"cyclic rule set {name!r} needs an odd number of choices")
+            for winner in range(size):
+                for step in range(1, (size - 1) // 2 + 1):
+                    beats[(winner, (winner + step) % size)] = "beats"
+        for rule in data.get('rules', ()):
+            winner, verb, loser = rule
+            try:
+                beats[(index_of[winner], index_of[loser])] = str(verb)
+            except KeyError as e:
+                raise ValueError(f"rule {rule} names unknown choice {e}") from None
+        return cls(name, choices, beats)
+
+    @classmethod
+    def classic(cls) -> "RuleSet":
+        """The three-choice game, compiled from the engine's ``RULES``."""
+        choices = [RuleChoice(index, choice.value, choice.value.title(),
+                              _CLASSIC_EMOJIS[choice.value], choice.value[0])
+                   for index, choice in enumerate(CHOICE_ORDER)]
+        beats = {(CHOICE_ORDER.index(winner), CHOICE_ORDER.index(loser)): "beats"
+                 for winner, loser in RULES.items()}
+        return cls("Rock Paper Scissors", choices, beats)
+
+
+def available_rulesets() -> List[str]:
+    """Names of the rule files shipped in ``rulesets/``."""
+    try:
+        return sorted(name[:-5] for name in os.listdir(RULESET_DIR) if name.endswith('.json'))
+    except OSError:
+        return []
+
+
+def load_ruleset(name_or_path: str) -> RuleSet:
+    """Load and compile a rule set by shipped name or by file path.
+
+    Raises ``OSError`` if the file cannot be read and ``ValueError`` if it
+    is not a valid rule set.
+    """
+    path = name_or_path
+    if not os.path.exists(path):
+        path = os.path.join(RULESET_DIR, f"{name_or_path}.json")
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+    try:
+        return RuleSet.from_dict(data)
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"{path}: malformed rule set ({e})") from None
+
+
+def describe(rules: RuleSet, player: RuleChoice, computer: RuleChoice,
+             result: Optional[GameResult] = None) -> str:
+    """A one-line description of a round, e.g. "Spock vaporizes Rock"."""
+    result = result or rules.determine_winner(player, computer)
+    if result is GameResult.TIE:
+        return f"Both chose {player.name}"
+    winner, loser = (player, computer) if result is GameResult.WIN else (computer, player)
+    return f"{winner.name} {rules.verb(winner, loser)} {loser.name}"
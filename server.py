@@ -0,0 +1,276 @@
+"""
+Rock-Paper-Scissors Match Server
+Human-vs-human play over the network with an asyncio line protocol.
+
+Protocol (one ASCII command per line, words separated by spaces):
+
+    client -> server                    server -> client
+    JOIN <name> [pool]                  QUEUED <pool>
+                                        MATCH <match id> <opponent name>
+    COMMIT <sha256 hex>                 REVEAL            (both committed)
+    OPEN <choice> <nonce>               RESULT <win|lose|tie> <opponent choice>
+    LEAVE                               LEFT              (you or your opponent left)
+    QUIT                                ERROR <reason>
+
+Each round both players first commit to ``sha256("<choice>:<nonce>")``.
+Only once both commitments are in does the server ask for the reveal, so
+neither side can see the other's move before choosing its own.  The server
+checks every reveal against its commitment and resolves the round with
+``determine_winner``.  All match state changes happen synchronously in the
+connection handlers, so one process can host thousands of matches.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import secrets
+from collections import defaultdict, deque
+from typing import Deque, Dict, Optional, Tuple
+
+from engine import Choice, determine_winner
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_POOL = 'default'
+MAX_LINE = 256
+
+_CHOICES = {choice.value: choice for choice in Choice}
+
+
+def make_commitment(choice: Choice, nonce: Optional[str] = None) -> Tuple[str, str]:
+    """Return ``(digest, nonce)`` committing to ``choice``."""
+    nonce = nonce or secrets.token_hex(8)
+    digest = hashlib.sha256(f"{choice.value}:{nonce}".encode('ascii')).hexdigest()
+    return digest, nonce
+
+
+def _is_token(text: str) -> bool:
+    """Whether ``text`` is printable ASCII (names and pools are echoed to other clients)."""
+    return text.isascii() and text.isprintable()
+
+
+class Player:
+    """A connected client."""
+
+    __slots__ = ('name', 'writer', 'pool', 'match', 'commit', 'choice', 'match_ended')
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.name = '?'
+        self.writer = writer
+        self.pool = None
+        self.match = None
+        self.commit = None
+        self.choice = None
+        self.match_ended = False  # LEFT was sent; late moves are dropped until the next JOIN
+
+    def send(self, line: str):
+        """Queue a line for the client (flushed by the event loop)."""
+        if not self.writer.is_closing():
+            self.writer.write(line.encode('ascii') + b'\n')
+
+
+class Match:
+    """Two players exchanging commit-then-reveal rounds."""
+
+    __slots__ = ('id', 'players', 'rounds')
+
+    def __init__(self, match_id: int, first: Player, second: Player):
+        self.id = match_id
+        self.players = (first, second)
+        self.rounds = 0
+
+    def opponent(self, player: Player) -> Player:
+        return self.players[1] if self.players[0] is player else self.players[0]
+
+
+class MatchServer:
+    """Matchmaking queues plus server-side round resolution."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Configure the listening address (port 0 picks a free port)."""
+        self.host = host
+        self.port = port
+        self.pools: Dict[str, Deque[Player]] = defaultdict(deque)
+        self.active_matches = 0
+        self.matches_started = 0
+        self.rounds_resolved = 0
+        self._match_ids = itertools.count(1)
+        self._server = None
+
+    async def start(self):
+        """Start listening; the bound port is available as ``self.port``."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_LINE)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Start (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Read and dispatch one client's commands until it disconnects."""
+        player = Player(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    player.send("ERROR line too long")
+                    break
+                if not line:
+                    break
+                words = line.decode('ascii', 'replace').split()
+                if not words:
+                    continue
+                if words[0] == 'QUIT':
+                    break
+                try:
+                    self._dispatch(player, words)
+                except ValueError:  # Including text that cannot be encoded as ASCII
+                    player.send("ERROR bad command")
+                if writer.transport.get_write_buffer_size() > 64 * 1024:
+                    await writer.drain()  # Slow reader: apply backpressure
+        except ConnectionError:
+            pass
+        finally:
+            self._leave(player)
+            writer.close()
+
+    def _dispatch(self, player: Player, words):
+        """Apply one command to the player's state."""
+        command = words[0]
+        if command == 'JOIN' and len(words) in (2, 3):
+            self._join(player, words[1], words[2] if len(words) == 3 else DEFAULT_POOL)
+        elif command == 'COMMIT' and len(words) == 2:
+            self._commit(player, words[1])
+        elif command == 'OPEN' and len(words) == 3:
+            self._open(player, words[1], words[2])
+        elif command == 'LEAVE':
+            self._leave(player)
+        else:
+            player.send("ERROR unknown command")
+
+    def _join(self, player: Player, name: str, pool: str):
+        """Queue a player for matchmaking, pairing them if someone is waiting."""
+        if player.match is not None or player.pool is not None:
+            player.send("ERROR already joined")
+            return
+        if not _is_token(name) or not _is_token(pool):
+            player.send("ERROR bad name")
+            return
+        player.name = name[:32]
+        player.match_ended = False
+        waiting = self.pools[pool]
+        while waiting and waiting[0].writer.is_closing():
+            waiting.popleft()
+        if waiting:
+            opponent = waiting.popleft()
+            opponent.pool = None
+            match = Match(next(self._match_ids), opponent, player)
+            opponent.match = player.match = match
+            self.active_matches += 1
+            self.matches_started += 1
+            opponent.send(f"MATCH {match.id} {player.name}")
+            player.send(f"MATCH {match.id} {opponent.name}")
+        else:
+            player.pool = pool
+            waiting.append(player)
+            player.send(f"QUEUED {pool}")
+
+    def _commit(self, player: Player, digest: str):
+        """Record a commitment; ask both for reveals once both are in."""
+        match = player.match
+        if match is None and player.match_ended:
+            return  # Sent before the player saw LEFT
+        if match is None or player.commit is not None:
+            player.send("ERROR not expecting a commit")
+            return
+        if len(digest) != 64:
+            player.send("ERROR bad commitment")
+            return
+        player.commit = digest.lower()
+        opponent = match.opponent(player)
+        if opponent.commit is not None:
+            player.send("REVEAL")
+            opponent.send("REVEAL")
+
+    def _open(self, player: Player, choice_text: str, nonce: str):
+        """Check a reveal against its commitment and resolve when both are open."""
+        match = player.match
+        if match is None and player.match_ended:
+            return  # Sent before the player saw LEFT
+        if match is None or player.commit is None or match.opponent(player).commit is None:
+            player.send("ERROR not expecting a reveal")
+            return
+        choice = _CHOICES.get(choice_text)
+        if choice is None or make_commitment(choice, nonce)[0] != player.commit:
+            player.send("ERROR reveal does not match commitment")
+            return
+        player.choice = choice
+
+        opponent = match.opponent(player)
+        if opponent.choice is None:
+            return
+
+        # Both moves are verified: resolve on the server
+        first, second = match.players
+        result = determine_winner(first.choice, second.choice)
+        mirrored = determine_winner(second.choice, first.choice)
+        first.send(f"RESULT {result.value} {second.choice.value}")
+        second.send(f"RESULT {mirrored.value} {first.choice.value}")
+        match.rounds += 1
+        self.rounds_resolved += 1
+        for each in match.players:
+            each.commit = None
+            each.choice = None
+
+    def _leave(self, player: Player):
+        """Take a player out of their queue or match."""
+        if player.pool is not None:
+            try:
+                self.pools[player.pool].remove(player)
+            except ValueError:
+                pass
+            player.pool = None
+        match = player.match
+        if match is not None:
+            self.active_matches -= 1
+            for each in match.players:
+                each.match = None
+                each.commit = None
+                each.choice = None
+                each.match_ended = True
+                each.send("LEFT")
+
+
+def main():
+    """Command-line entry point for the match server."""
+    parser = argparse.ArgumentParser(description="Rock-Paper-Scissors match server")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to bind (default: {DEFAULT_PORT})")
+    args = parser.parse_args()
+
+    server = MatchServer(args.host, args.port)
+
+    async def run():
+        await server.start()
+        print(f"🌐 Match server listening on {server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print(f"👋 Stopped after {server.matches_started} matches, {server.rounds_resolved} rounds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Rock-Paper-Scissors Startup Profiler
+Tiny phase timer for measuring cold start.
+
+``main.py`` creates a ``StartupProfiler`` before its heavier imports and
+marks each phase as it completes.  Phases that finish out of order (work
+done lazily or on a background thread) are recorded with an explicit
+duration.  This module only imports ``time`` so it adds nothing to the
+startup it measures.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+
+class StartupProfiler:
+    """Records named startup phases relative to its creation time."""
+
+    def __init__(self):
+        """Start the clock."""
+        self.start = time.perf_counter()
+        self._last = self.start
+        self.phases: List[Tuple[str, float, float]] = []  # (name, duration, since start)
+
+    def mark(self, name: str):
+        """Close a phase that ran since the previous mark."""
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last, now - self.start))
+        self._last = now
+
+    def record(self, name: str, duration: float, finished_at: Optional[float] = None):
+        """Add a phase measured separately, e.g. on a worker thread."""
+        finished_at = time.perf_counter() if finished_at is None else finished_at
+        self.phases.append((name, duration, finished_at - self.start))
+
+    def elapsed(self, name: str) -> Optional[float]:
+        """Seconds from start until the named phase finished."""
+        for phase, _, since_start in self.phases:
+            if phase == name:
+                return since_start
+        return None
+
+    def report(self) -> str:
+        """Format the phases as a table, in order of completion."""
+        lines = ["⏱️ Startup profile (ms)", f"  {'phase':<28}{'took':>10}{'at':>10}"]
+        for name, duration, since_start in sorted(self.phases, key=lambda phase: phase[2]):
+            lines.append(f"  {name:<28}{duration * 1000:>10.1f}{since_start * 1000:>10.1f}")
+        return "\n".join(lines)
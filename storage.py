@@ -0,0 +1,291 @@
+"""
+Rock-Paper-Scissors Storage Backends
+Where per-profile statistics and round history are persisted.
+
+``StatsBackend`` is the interface the GUI and ``StatsWriter`` talk to.
+``SQLiteBackend`` is the default: one database in the user's data
+directory holds every profile's totals and full round history.  Round
+batches are inserted in a single transaction and profile totals are bulk
+upserted, using fixed SQL strings so sqlite3 reuses its prepared
+statements.  ``JournalBackend`` keeps the single-profile JSON snapshot plus
+journal format, and is also what the SQLite backend migrates from.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from engine import Choice, GameResult, GameStats, CHOICE_CODES, RESULT_CODES
+from history import RoundHistory
+from journal import StatsJournal
+
+DEFAULT_PROFILE = 'default'
+LEGACY_STATS_FILE = 'game_stats.json'
+
+# A queued round: (player choice, computer choice, result, unix timestamp)
+RoundEvent = Tuple[Choice, Choice, GameResult, float]
+
+
+def default_data_dir() -> str:
+    """Per-user data directory, independent of the working directory."""
+    override = os.environ.get('RPS_DATA_DIR')
+    if override:
+        return override
+    if sys.platform == 'win32':
+        base = os.environ.get('APPDATA') or os.path.expanduser('~')
+        return os.path.join(base, 'RockPaperScissors')
+    if sys.platform == 'darwin':
+        return os.path.expanduser('~/Library/Application Support/RockPaperScissors')
+    base = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+    return os.path.join(base, 'rock-paper-scissors')
+
+
+def default_db_path() -> str:
+    """Location of the default SQLite database."""
+    return os.path.join(default_data_dir(), 'stats.db')
+
+
+def legacy_stats_paths() -> List[str]:
+    """Places an older version may have written ``game_stats.json``."""
+    candidates = [
+        os.path.join(os.getcwd(), LEGACY_STATS_FILE),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), LEGACY_STATS_FILE)
+    ]
+    # Keep order, drop duplicates
+    return list(dict.fromkeys(os.path.normpath(path) for path in candidates))
+
+
+class StatsBackend:
+    """Interface for persisting per-profile stats and rounds."""
+
+    def load_stats(self, profile: str = DEFAULT_PROFILE) -> GameStats:
+        """Return the stored totals for ``profile`` (zeros if unknown)."""
+        raise NotImplementedError
+
+    def save_stats(self, profile: str, stats: GameStats):
+        """Overwrite the stored totals for ``profile``, e.g. after a reset."""
+        raise NotImplementedError
+
+    def record_rounds(self, profile: str, rounds: Sequence[RoundEvent]):
+        """Persist a batch of finished rounds and add them to the totals."""
+        raise NotImplementedError
+
+    def load_history(self, profile: str = DEFAULT_PROFILE) -> RoundHistory:
+        """Return every recorded round for ``profile``."""
+        raise NotImplementedError(f"{type(self).__name__} does not keep round history")
+
+    def profiles(self) -> List[str]:
+        """Names of all stored profiles."""
+        return [DEFAULT_PROFILE]
+
+    def close(self):
+        """Flush and release any resources."""
+
+
+class JournalBackend(StatsBackend):
+    """Single-profile backend over the JSON snapshot and round journal."""
+
+    def __init__(self, snapshot_path: str = LEGACY_STATS_FILE, **options):
+        """Open the journal next to ``snapshot_path``."""
+        self.journal = StatsJournal(snapshot_path, **options)
+
+    def load_stats(self, profile: str = DEFAULT_PROFILE) -> GameStats:
+        return self.journal.load()
+
+    def save_stats(self, profile: str, stats: GameStats):
+        self.journal.compact(stats)
+
+    def record_rounds(self, profile: str, rounds: Sequence[RoundEvent]):
+        self.journal.append_many(rounds)
+
+    def close(self):
+        self.journal.close()
+
+
+# Schema and statements. Keeping the SQL text fixed lets sqlite3's statement
+# cache hand back the same prepared statement on every call.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    ties INTEGER NOT NULL DEFAULT 0,
+    total_games INTEGER NOT NULL DEFAULT 0,
+    win_rate REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS profiles_by_win_rate ON profiles (win_rate DESC, total_games DESC);
+CREATE INDEX IF NOT EXISTS profiles_by_wins ON profiles (wins DESC);
+CREATE INDEX IF NOT EXISTS profiles_by_games ON profiles (total_games DESC);
+CREATE TABLE IF NOT EXISTS rounds (
+    profile_id INTEGER NOT NULL REFERENCES profiles (id),
+    seq INTEGER NOT NULL,
+    code INTEGER NOT NULL,
+    result INTEGER NOT NULL,
+    played_at REAL NOT NULL,
+    PRIMARY KEY (profile_id, seq)
+) WITHOUT ROWID;
+"""
+
+_SELECT_PROFILE = "SELECT id, wins, losses, ties, total_games FROM profiles WHERE name = ?"
+_INSERT_PROFILE = "INSERT OR IGNORE INTO profiles (name) VALUES (?)"
+_LAST_SEQ = "SELECT COALESCE(MAX(seq), 0) FROM rounds WHERE profile_id = ?"
+_INSERT_ROUND = "INSERT INTO rounds (profile_id, seq, code, result, played_at) VALUES (?, ?, ?, ?, ?)"
+_ADD_TOTALS = """
+INSERT INTO profiles (name, wins, losses, ties, total_games, win_rate, updated_at)
+VALUES (?, ?, ?, ?, ?, 0, ?)
+ON CONFLICT (name) DO UPDATE SET
+    wins = wins + excluded.wins,
+    losses = losses + excluded.losses,
+    ties = ties + excluded.ties,
+    total_games = total_games + excluded.total_games,
+    win_rate = CAST(wins + excluded.wins AS REAL) * 100
+               / MAX(total_games + excluded.total_games, 1),
+    updated_at = excluded.updated_at
+"""
+_SET_TOTALS = """
+INSERT INTO profiles (name, wins, losses, ties, total_games, win_rate, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (name) DO UPDATE SET
+    wins = excluded.wins,
+    losses = excluded.losses,
+    ties = excluded.ties,
+    total_games = excluded.total_games,
+    win_rate = excluded.win_rate,
+    updated_at = excluded.updated_at
+"""
+_DELETE_ROUNDS = "DELETE FROM rounds WHERE profile_id = ?"
+_SELECT_ROUNDS = "SELECT code FROM rounds WHERE profile_id = ? ORDER BY seq"
+_LEADERBOARD = {
+    'win_rate': "SELECT name, wins, losses, ties, total_games FROM profiles "
+                "WHERE total_games >= ? ORDER BY win_rate DESC, total_games DESC LIMIT ?",
+    'wins': "SELECT name, wins, losses, ties, total_games FROM profiles "
+            "WHERE total_games >= ? ORDER BY wins DESC LIMIT ?",
+    'total_games': "SELECT name, wins, losses, ties, total_games FROM profiles "
+                   "WHERE total_games >= ? ORDER BY total_games DESC LIMIT ?"
+}
+
+
+class SQLiteBackend(StatsBackend):
+    """Multi-profile stats and round history in one SQLite database.
+
+    The connection is shared between the GUI thread and the background
+    writer, so every operation runs under a lock.
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 legacy_paths: Optional[Iterable[str]] = None):
+        """Open (creating if needed) the database and migrate old JSON stats."""
+        self.path = path or default_db_path()
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=64)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        self._profile_ids = {}
+        self._migrate_legacy(legacy_stats_paths() if legacy_paths is None else legacy_paths)
+
+    def _migrate_legacy(self, paths: Iterable[str]):
+        """Import the first existing ``game_stats.json`` as the default profile, once."""
+        if self._conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_migrated'").fetchone():
+            return
+        for path in paths:
+            if os.path.exists(path):
+                try:
+                    stats = StatsJournal(path).load()
+                except OSError as e:
+                    print(f"Error migrating stats from {path}: {e}")
+                    continue
+                self.save_stats(DEFAULT_PROFILE, stats)
+                break
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_migrated', ?)",
+                               (str(time.time()),))
+
+    def _profile_id(self, profile: str) -> int:
+        """Row id for ``profile``, creating the profile on first use."""
+        profile_id = self._profile_ids.get(profile)
+        if profile_id is None:
+            self._conn.execute(_INSERT_PROFILE, (profile,))
+            profile_id = self._conn.execute(_SELECT_PROFILE, (profile,)).fetchone()[0]
+            self._profile_ids[profile] = profile_id
+        return profile_id
+
+    def load_stats(self, profile: str = DEFAULT_PROFILE) -> GameStats:
+        with self._lock:
+            row = self._conn.execute(_SELECT_PROFILE, (profile,)).fetchone()
+        if row is None:
+            return GameStats()
+        return GameStats(wins=row[1], losses=row[2], ties=row[3], total_games=row[4])
+
+    def save_stats(self, profile: str, stats: GameStats):
+        with self._lock, self._conn:
+            row = self._conn.execute(_SELECT_PROFILE, (profile,)).fetchone()
+            if row is not None and stats.total_games < row[4]:
+                # A reset: the recorded rounds no longer add up to the totals
+                self._conn.execute(_DELETE_ROUNDS, (row[0],))
+            self._conn.execute(_SET_TOTALS, (profile, stats.wins, stats.losses, stats.ties,
+                                             stats.total_games, stats.win_rate, time.time()))
+
+    def record_rounds(self, profile: str, rounds: Sequence[RoundEvent]):
+        if not rounds:
+            return
+        batch = GameStats()
+        with self._lock, self._conn:
+            # Take the write lock before reading the last seq, so another
+            # process writing this profile cannot claim the same numbers
+            self._conn.execute("BEGIN IMMEDIATE")
+            profile_id = self._profile_id(profile)
+            seq = self._conn.execute(_LAST_SEQ, (profile_id,)).fetchone()[0]
+
+            rows = []
+            for player_choice, computer_choice, result, timestamp in rounds:
+                seq += 1
+                code = CHOICE_CODES[player_choice] * 3 + CHOICE_CODES[computer_choice]
+                rows.append((profile_id, seq, code, RESULT_CODES[result],
+                             time.time() if timestamp is None else timestamp))
+                batch.record(result)
+
+            self._conn.executemany(_INSERT_ROUND, rows)
+            self._conn.execute(_ADD_TOTALS, (profile, batch.wins, batch.losses, batch.ties,
+                                             batch.total_games, time.time()))
+
+    def load_history(self, profile: str = DEFAULT_PROFILE) -> RoundHistory:
+        with self._lock:
+            row = self._conn.execute(_SELECT_PROFILE, (profile,)).fetchone()
+            if row is None:
+                return RoundHistory()
+            codes = bytes(code for (code,) in self._conn.execute(_SELECT_ROUNDS, (row[0],)))
+        return RoundHistory.from_bytes(codes)
+
+    def profiles(self) -> List[str]:
+        with self._lock:
+            return [name for (name,) in self._conn.execute("SELECT name FROM profiles ORDER BY name")]
+
+    def leaderboard(self, order_by: str = 'win_rate', limit: int = 10,
+                    min_games: int = 1) -> List[Tuple[str, GameStats]]:
+        """Top profiles by ``win_rate``, ``wins`` or ``total_games``."""
+        try:
+            query = _LEADERBOARD[order_by]
+        except KeyError:
+            raise ValueError(f"cannot rank by {order_by!r}; choose from {', '.join(_LEADERBOARD)}") from None
+        with self._lock:
+            rows = self._conn.execute(query, (min_games, limit)).fetchall()
+        return [(name, GameStats(wins=wins, losses=losses, ties=ties, total_games=total))
+                for name, wins, losses, ties, total in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,172 @@
+"""
+Rock-Paper-Scissors Opponent Strategies
+Adaptive computer opponents that learn from the player's move history.
+
+Every strategy updates in constant time and memory per round: state lives in
+fixed-size count tables, and the recent move history of the Markov model is
+packed into a single base-3 context number that acts as a ring buffer.
+"""
+
+import random
+from typing import Dict, List, Optional, Sequence
+
+from engine import Choice, Opponent, RandomOpponent, CHOICE_CODES, CHOICE_ORDER
+
+# Code of the move that beats rock (0), paper (1) and scissors (2)
+_BEATS = (1, 2, 0)
+
+
+def _counter_move(counts: Sequence[float], rng) -> Choice:
+    """Play the move that beats the most likely next player move."""
+    best = max(counts)
+    if best <= 0:
+        return rng.choice(CHOICE_ORDER)  # Nothing learned yet
+    candidates = [code for code in range(3) if counts[code] == best]
+    predicted = candidates[0] if len(candidates) == 1 else rng.choice(candidates)
+    return CHOICE_ORDER[_BEATS[predicted]]
+
+
+class FrequencyOpponent(Opponent):
+    """Counters the move the player has chosen most often.
+
+    With ``decay`` below 1.0 older moves fade out, so the model follows a
+    player who changes habits.
+    """
+
+    name = "frequency"
+
+    def __init__(self, rng=None, decay: float = 1.0):
+        """Initialize empty counts for the three player moves."""
+        self.rng = rng if rng is not None else random
+        self.decay = decay
+        self.counts = [0.0, 0.0, 0.0]
+
+    def choose(self) -> Choice:
+        """Beat the player's most frequent move."""
+        return _counter_move(self.counts, self.rng)
+
+    def observe(self, player_choice: Choice, computer_choice: Choice):
+        """Count the player's move."""
+        counts = self.counts
+        if self.decay != 1.0:
+            counts[0] *= self.decay
+            counts[1] *= self.decay
+            counts[2] *= self.decay
+        counts[CHOICE_CODES[player_choice]] += 1
+
+
+class MarkovOpponent(Opponent):
+    """Predicts the player's next move from their last ``order`` moves.
+
+    The last ``order`` moves form a base-3 context number, updated with
+    ``(context * 3 + move) % 3 ** order``.  Transition counts live in a flat
+    table of ``3 ** order * 3`` entries, so memory never grows with the
+    number of rounds played.
+    """
+
+    name = "markov"
+
+    def __init__(self, rng=None, order: int = 2, decay: float = 1.0):
+        """Initialize an empty transition table for the given order."""
+        if order < 1:
+            raise ValueError("order must be at least 1")
+        self.rng = rng if rng is not None else random
+        self.order = order
+        self.decay = decay
+        self._contexts = 3 ** order
+        self._table = [0.0] * (self._contexts * 3)
+        self._context = 0
+        self._seen = 0
+
+    def choose(self) -> Choice:
+        """Beat the most likely continuation of the current context."""
+        if self._seen < self.order:
+            return self.rng.choice(CHOICE_ORDER)
+        base = self._context * 3
+        return _counter_move(self._table[base:base + 3], self.rng)
+
+    def observe(self, player_choice: Choice, computer_choice: Choice):
+        """Record the transition and shift the move into the context."""
+        code = CHOICE_CODES[player_choice]
+        if self._seen >= self.order:
+            base = self._context * 3
+            table = self._table
+            if self.decay != 1.0:
+                # Only the touched row decays, keeping the update O(1)
+                table[base] *= self.decay
+                table[base + 1] *= self.decay
+                table[base + 2] *= self.decay
+            table[base + code] += 1
+        else:
+            self._seen += 1
+        self._context = (self._context * 3 + code) % self._contexts
+
+
+class EnsembleOpponent(Opponent):
+    """Meta-strategy that plays the move of its best-scoring member.
+
+    Every member proposes a move each round and is scored as if it had been
+    played (+1 win, -1 loss), with exponential ``decay`` so the ensemble
+    switches quickly when the player adapts.  Cost per round is linear in
+    the (fixed) number of members.
+    """
+
+    name = "ensemble"
+
+    def __init__(self, rng=None, members: Optional[List[Opponent]] = None,
+                 decay: float = 0.9):
+        """Initialize with the given members, or a default mix."""
+        self.rng = rng if rng is not None else random
+        if members is None:
+            members = [
+                RandomOpponent(self.rng),
+                FrequencyOpponent(self.rng, decay=0.95),
+                MarkovOpponent(self.rng, order=1),
+                MarkovOpponent(self.rng, order=2),
+                MarkovOpponent(self.rng, order=3)
+            ]
+        self.members = members
+        self.decay = decay
+        self.scores = [0.0] * len(members)
+        self._proposals = [None] * len(members)
+
+    def choose(self) -> Choice:
+        """Collect every member's move and play the current leader's."""
+        proposals = self._proposals
+        best = 0
+        for index, member in enumerate(self.members):
+            proposals[index] = member.choose()
+            if self.scores[index] > self.scores[best]:
+                best = index
+        return proposals[best]
+
+    def observe(self, player_choice: Choice, computer_choice: Choice):
+        """Score each member's proposal and let the members learn."""
+        player_code = CHOICE_CODES[player_choice]
+        scores = self.scores
+        for index, member in enumerate(self.members):
+            proposal = self._proposals[index]
+            if proposal is not None:
+                # Result code from the computer's side: 1 win, 2 loss, 0 tie
+                outcome = (CHOICE_CODES[proposal] - player_code) % 3
+                reward = 1 if outcome == 1 else -1 if outcome == 2 else 0
+                scores[index] = scores[index] * self.decay + reward
+            member.observe(player_choice, computer_choice)
+
+
+# Strategy registry used by the GUI and simulations
+STRATEGIES: Dict[str, type] = {
+    RandomOpponent.name: RandomOpponent,
+    FrequencyOpponent.name: FrequencyOpponent,
+    MarkovOpponent.name: MarkovOpponent,
+    EnsembleOpponent.name: EnsembleOpponent
+}
+
+
+def create_opponent(name: str, rng=None, **options) -> Opponent:
+    """Build a registered strategy by name."""
+    try:
+        factory = STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"unknown strategy {name!r}; choose from {', '.join(STRATEGIES)}") from None
+    return factory(rng, **options)
@@ -0,0 +1,226 @@
+"""
+Rock-Paper-Scissors Themes
+Shared fonts, ttk styles and color schemes that can be switched at runtime.
+
+A ``Theme`` creates each font once as a named ``tkinter.font.Font`` and
+configures each ttk style once.  Widgets then refer to them by name instead
+of carrying their own font tuple and color values.  Plain Tk widgets are
+created through ``Theme.create``, which records which option shows which
+theme color.  ``Theme.use`` can then recolor the window in place: one
+``style.configure`` per ttk style and one ``configure`` per tracked widget,
+with no widget rebuilt.
+
+Hover effects are Tcl scripts bound directly to the buttons.  They read the
+current colors from the Tcl array ``rpsTheme``, so an Enter or Leave event
+never calls back into Python.
+"""
+
+import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+from typing import Dict, List, Tuple
+
+DEFAULT_THEME = 'dark'
+
+# Color schemes; every scheme defines the same keys
+THEMES = {
+    'dark': {
+        'primary': '#3b82f6',
+        'secondary': '#6366f1',
+        'success': '#10b981',
+        'danger': '#ef4444',
+        'danger_active': '#dc2626',
+        'warning': '#f59e0b',
+        'warning_active': '#d97706',
+        'background': '#0f172a',
+        'surface': '#1e293b',
+        'card': '#334155',
+        'text': '#f1f5f9',
+        'text_secondary': '#94a3b8',
+        'on_accent': '#ffffff',
+        'border': '#475569'
+    },
+    'light': {
+        'primary': '#2563eb',
+        'secondary': '#4f46e5',
+        'success': '#059669',
+        'danger': '#dc2626',
+        'danger_active': '#b91c1c',
+        'warning': '#d97706',
+        'warning_active': '#b45309',
+        'background': '#f8fafc',
+        'surface': '#e2e8f0',
+        'card': '#ffffff',
+        'text': '#0f172a',
+        'text_secondary': '#475569',
+        'on_accent': '#ffffff',
+        'border': '#cbd5e1'
+    },
+    'contrast': {
+        'primary': '#0033cc',
+        'secondary': '#000000',
+        'success': '#00ff00',
+        'danger': '#cc0000',
+        'danger_active': '#ff0000',
+        'warning': '#b35900',
+        'warning_active': '#ff8000',
+        'background': '#000000',
+        'surface': '#000000',
+        'card': '#1a1a1a',
+        'text': '#ffffff',
+        'text_secondary': '#ffff00',
+        'on_accent': '#ffffff',
+        'border': '#ffffff'
+    }
+}
+
+THEME_LABELS = {'dark': "Dark Mode", 'light': "Light Mode", 'contrast': "High Contrast"}
+THEME_GREETINGS = {
+    'dark': "🌙 Enjoy the beautiful dark theme!",
+    'light': "☀️ Enjoy the bright light theme!",
+    'contrast': "🔳 Enjoy the high-contrast theme!"
+}
+
+# Named fonts: (family, size, weight)
+FONTS = {
+    'title': ('Segoe UI', 24, 'bold'),
+    'subtitle': ('Segoe UI', 14, 'normal'),
+    'choice': ('Segoe UI', 48, 'normal'),
+    'result': ('Segoe UI', 16, 'bold'),
+    'versus': ('Segoe UI', 20, 'bold'),
+    'heading': ('Segoe UI', 14, 'bold'),
+    'stat': ('Segoe UI', 12, 'normal'),
+    'game_button': ('Segoe UI', 12, 'bold'),
+    'choice_button': ('Segoe UI', 14, 'bold'),
+    'choice_button_small': ('Segoe UI', 9, 'bold'),
+    'action_button': ('Segoe UI', 10, 'bold'),
+    'mono': ('Consolas', 10, 'normal')
+}
+
+# ttk styles: the font and options that never change, then the options that show theme colors
+STYLE_FONTS = {
+    'Game.TButton': 'game_button',
+    'Action.TButton': 'action_button',
+    'Title.TLabel': 'title',
+    'Subtitle.TLabel': 'subtitle',
+    'Choice.TLabel': 'choice',
+    'Result.TLabel': 'result',
+    'Versus.TLabel': 'versus',
+    'Heading.TLabel': 'heading',
+    'Stat.TLabel': 'stat'
+}
+STYLE_LAYOUT = {
+    'Game.TButton': {'padding': (20, 15), 'borderwidth': 0, 'focuscolor': 'none'},
+    'Action.TButton': {'padding': (15, 10), 'borderwidth': 0, 'focuscolor': 'none'}
+}
+STYLE_COLORS = {
+    'Game.TButton': {'background': 'primary', 'foreground': 'on_accent'},
+    'Action.TButton': {'background': 'secondary', 'foreground': 'on_accent'},
+    'Title.TLabel': {'background': 'background', 'foreground': 'text'},
+    'Subtitle.TLabel': {'background': 'background', 'foreground': 'text_secondary'},
+    'Choice.TLabel': {'background': 'card', 'foreground': 'text'},
+    'Result.TLabel': {'background': 'card', 'foreground': 'text'},
+    'Versus.TLabel': {'background': 'card', 'foreground': 'text_secondary'},
+    'Heading.TLabel': {'background': 'surface', 'foreground': 'text'},
+    'Stat.TLabel': {'background': 'surface', 'foreground': 'text'}
+}
+
+# Tk widget options whose values name theme colors in ``Theme.create``
+COLOR_OPTIONS = frozenset({'bg', 'fg', 'background', 'foreground', 'activebackground',
+                           'activeforeground', 'highlightbackground', 'highlightcolor',
+                           'disabledforeground'})
+
+# Tcl array holding the current colors, read by the hover bindings
+COLOR_ARRAY = 'rpsTheme'
+_HOVER_SCRIPT = 'if {{[%W cget -state] ne "disabled"}} {{%W configure -background $::{}({})}}'
+
+
+class Theme:
+    """Fonts, styles and colors of one Tk window, switchable at runtime."""
+
+    def __init__(self, root: tk.Tk, name: str = DEFAULT_THEME):
+        """Create the named fonts and styles for ``root`` in the ``name`` scheme."""
+        if name not in THEMES:
+            raise ValueError(f"unknown theme {name!r}; choose from {', '.join(THEMES)}")
+        self.root = root
+        self.name = name
+        self.colors = THEMES[name]
+        self.fonts = {
+            font_name: tkfont.Font(root, name=f"rps_{font_name}", family=family,
+                                   size=size, weight=weight)
+            for font_name, (family, size, weight) in FONTS.items()
+        }
+        self._tracked: List[Tuple[tk.Misc, Dict[str, str]]] = []
+
+        self.style = ttk.Style(root)
+        self.style.theme_use('clam')
+        for style_name, font_name in STYLE_FONTS.items():
+            self.style.configure(style_name, font=self.fonts[font_name],
+                                 **STYLE_LAYOUT.get(style_name, {}))
+        self._apply_colors()
+
+    @property
+    def label(self) -> str:
+        """Display name of the current scheme."""
+        return THEME_LABELS.get(self.name, self.name.title())
+
+    def create(self, widget_class, parent, **options):
+        """Create a Tk widget and track its colors.
+
+        Color options (``bg``, ``fg``, ...) take theme color keys and
+        ``font`` takes a font name; both are resolved here.
+        """
+        roles = {option: key for option, key in options.items() if option in COLOR_OPTIONS}
+        for option, key in roles.items():
+            options[option] = self.colors[key]
+        if isinstance(options.get('font'), str):
+            options['font'] = self.fonts[options['font']]
+        widget = widget_class(parent, **options)
+        if roles:
+            self._tracked.append((widget, roles))
+        return widget
+
+    def track(self, widget, **roles):
+        """Color an existing widget (e.g. the root) from theme keys and keep it in sync."""
+        widget.configure(**{option: self.colors[key] for option, key in roles.items()})
+        self._tracked.append((widget, roles))
+        return widget
+
+    def untrack(self, widget: tk.Misc):
+        """Stop recoloring ``widget`` and its children, e.g. before destroying them."""
+        prefix = str(widget) + '.'
+        self._tracked = [(tracked, roles) for tracked, roles in self._tracked
+                         if tracked is not widget and not str(tracked).startswith(prefix)]
+
+    def bind_hover(self, button: tk.Button, normal: str, hover: str):
+        """Swap a button's background between two theme colors on hover, in Tcl only."""
+        button.bind("<Enter>", _HOVER_SCRIPT.format(COLOR_ARRAY, hover))
+        button.bind("<Leave>", _HOVER_SCRIPT.format(COLOR_ARRAY, normal))
+
+    def use(self, name: str):
+        """Switch every tracked widget and style to another scheme in place."""
+        if name not in THEMES:
+            raise ValueError(f"unknown theme {name!r}; choose from {', '.join(THEMES)}")
+        self.name = name
+        self.colors = THEMES[name]
+        self._apply_colors()
+        alive = []
+        for widget, roles in self._tracked:
+            try:
+                widget.configure(**{option: self.colors[key] for option, key in roles.items()})
+            except tk.TclError:  # Destroyed since (e.g. a closed overlay)
+                continue
+            alive.append((widget, roles))
+        self._tracked = alive
+
+    def next_name(self) -> str:
+        """The scheme after the current one, wrapping around."""
+        names = list(THEMES)
+        return names[(names.index(self.name) + 1) % len(names)]
+
+    def _apply_colors(self):
+        """Push the scheme to the ttk styles and to the hover bindings' Tcl array."""
+        for style_name, roles in STYLE_COLORS.items():
+            self.style.configure(style_name, **{option: self.colors[key] for option, key in roles.items()})
+        flat = tuple(item for key_color in self.colors.items() for item in key_color)
+        self.root.tk.call('array', 'set', COLOR_ARRAY, flat)
@@ -0,0 +1,153 @@
+"""
+Rock-Paper-Scissors Tournament Runner
+Round-robin tournaments between opponent strategies across processes.
+
+Each pairing is split into fixed-size shards.  A shard is an independent
+match with fresh strategy instances and its own RNG, seeded from the
+tournament seed, the pairing and the shard number.  Because shard boundaries
+and seeds never depend on the worker count, the same seed always produces
+the same totals whether the shards run in one process or many.
+"""
+
+import argparse
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from compact import StatsRecord
+from engine import CHOICE_CODES, GameStats
+from strategies import STRATEGIES, create_opponent
+
+
+class Shard(NamedTuple):
+    """A unit of tournament work: one slice of one pairing."""
+    first: str
+    second: str
+    index: int
+    rounds: int
+    seed: int
+
+
+def shard_rng(seed: int, first: str, second: str, index: int) -> random.Random:
+    """Deterministic RNG for one shard of a pairing."""
+    return random.Random(f"{seed}:{first}:{second}:{index}")
+
+
+def play_shard(shard: Shard) -> Tuple[str, str, GameStats]:
+    """Play one shard and return the stats from the first strategy's side."""
+    rng = shard_rng(shard.seed, shard.first, shard.second, shard.index)
+    first = create_opponent(shard.first, random.Random(rng.getrandbits(64)))
+    second = create_opponent(shard.second, random.Random(rng.getrandbits(64)))
+    codes = bytearray()  # One packed round code per round
+
+    for _ in range(shard.rounds):
+        first_choice = first.choose()
+        second_choice = second.choose()
+        codes.append(CHOICE_CODES[first_choice] * 3 + CHOICE_CODES[second_choice])
+        # Each side sees the other as "the player" it is learning from
+        first.observe(second_choice, first_choice)
+        second.observe(first_choice, second_choice)
+
+    return shard.first, shard.second, StatsRecord.from_rounds(codes).to_stats()
+
+
+def plan_shards(strategies: Sequence[str], rounds: int, shard_rounds: int,
+                seed: int) -> List[Shard]:
+    """Split every round-robin pairing into shards of ``shard_rounds``."""
+    shards = []
+    for first, second in itertools.combinations(strategies, 2):
+        remaining = rounds
+        index = 0
+        while remaining > 0:
+            size = min(shard_rounds, remaining)
+            shards.append(Shard(first, second, index, size, seed))
+            remaining -= size
+            index += 1
+    return shards
+
+
+def run_tournament(strategies: Sequence[str], rounds: int = 10_000,
+                   seed: int = 0, workers: Optional[int] = None,
+                   shard_rounds: int = 10_000) -> Dict[Tuple[str, str], GameStats]:
+    """Run a round-robin tournament and return merged stats per pairing.
+
+    ``workers`` of 1 runs in-process; ``None`` uses every CPU core.
+    """
+    unknown = [name for name in strategies if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"unknown strategies: {', '.join(unknown)}")
+    if rounds < 0:
+        raise ValueError("rounds must not be negative")
+    if shard_rounds < 1:
+        raise ValueError("shard_rounds must be at least 1")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    shards = plan_shards(strategies, rounds, shard_rounds, seed)
+    results = {pairing: GameStats() for pairing in itertools.combinations(strategies, 2)}
+
+    if workers == 1:
+        for first, second, stats in map(play_shard, shards):
+            results[(first, second)].merge(stats)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(shards) // ((workers or os.cpu_count() or 1) * 4))
+            for first, second, stats in executor.map(play_shard, shards, chunksize=chunksize):
+                results[(first, second)].merge(stats)
+
+    return results
+
+
+def standings(results: Dict[Tuple[str, str], GameStats]) -> Dict[str, GameStats]:
+    """Total each strategy's record over all of its pairings."""
+    table: Dict[str, GameStats] = {}
+    for (first, second), stats in results.items():
+        table.setdefault(first, GameStats()).merge(stats)
+        # The second strategy's record is the mirror image
+        table.setdefault(second, GameStats()).merge(
+            GameStats(stats.losses, stats.wins, stats.ties, stats.total_games))
+    return table
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Command-line entry point for strategy tournaments."""
+    parser = argparse.ArgumentParser(description="Round-robin tournament between opponent strategies")
+    parser.add_argument("strategies", nargs="*", default=sorted(STRATEGIES),
+                        help=f"strategies to enter (default: all of {', '.join(sorted(STRATEGIES))})")
+    parser.add_argument("--rounds", type=int, default=100_000, help="rounds per pairing")
+    parser.add_argument("--seed", type=int, default=0, help="tournament seed")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--shard-rounds", type=int, default=10_000,
+                        help="rounds per shard; changing it changes the results for a seed")
+    args = parser.parse_args(argv)
+    if args.rounds < 0:
+        parser.error("--rounds must not be negative")
+    if args.shard_rounds < 1:
+        parser.error("--shard-rounds must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    start = time.perf_counter()
+    results = run_tournament(args.strategies, args.rounds, args.seed, args.workers, args.shard_rounds)
+    elapsed = time.perf_counter() - start
+
+    print(f"🏆 Tournament: {len(results)} pairings x {args.rounds:,} rounds (seed {args.seed})")
+    for (first, second), stats in results.items():
+        print(f"  {first:>10} vs {second:<10} W {stats.wins:>8,}  L {stats.losses:>8,}  "
+              f"T {stats.ties:>8,}  ({stats.win_rate:.1f}% wins)")
+
+    print("📊 Standings:")
+    table = standings(results)
+    for name, stats in sorted(table.items(), key=lambda item: item[1].wins - item[1].losses, reverse=True):
+        print(f"  {name:>10}  W {stats.wins:>8,}  L {stats.losses:>8,}  T {stats.ties:>8,}  "
+              f"Win Rate {stats.win_rate:.1f}%")
+
+    total_rounds = sum(stats.total_games for stats in results.values())
+    print(f"⏱️ {total_rounds:,} rounds in {elapsed:.2f}s ({total_rounds / elapsed:,.0f} rounds/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Rock-Paper-Scissors View Model
+Caches what each widget currently shows and only pushes changes to Tk.
+
+Every ``configure`` call crosses into the Tcl interpreter, so re-sending an
+unchanged label text is pure overhead.  ``ViewModel.render`` remembers the
+last value rendered per widget option and skips the call when nothing
+changed.  It also counts the Tk calls it makes, in total and per round,
+so the savings can be measured.
+"""
+
+from typing import Any, Dict, Tuple
+
+_MISSING = object()
+
+
+class ViewModel:
+    """Per-widget render cache with Tk call accounting."""
+
+    def __init__(self):
+        """Start with an empty cache and zeroed counters."""
+        self._values: Dict[Tuple[Any, str], Any] = {}
+        self.tk_calls = 0
+        self.skipped_calls = 0
+        self.rounds = 0
+        self.round_tk_calls = 0
+        self.last_round_tk_calls = 0
+        self._round_mark = 0
+
+    def render(self, widget, value, fmt: str = "{}", option: str = 'text') -> bool:
+        """Show ``fmt.format(value)`` in ``widget`` unless it already does.
+
+        ``value`` is compared before formatting, so unchanged values cost
+        neither a format nor a Tk call.  Returns True if Tk was called.
+        """
+        key = (widget, option)
+        if self._values.get(key, _MISSING) == value:
+            self.skipped_calls += 1
+            return False
+        self._values[key] = value
+        widget.configure(**{option: fmt.format(value)})
+        self.tk_calls += 1
+        return True
+
+    def remember(self, widget, value, option: str = 'text'):
+        """Record a value a widget was created with, without calling Tk."""
+        self._values[(widget, option)] = value
+
+    def invalidate(self, widget=None):
+        """Forget cached values for one widget, or for all of them."""
+        if widget is None:
+            self._values.clear()
+        else:
+            for key in [key for key in self._values if key[0] is widget]:
+                del self._values[key]
+
+    def begin_round(self):
+        """Start counting Tk calls for a new round."""
+        self._round_mark = self.tk_calls
+
+    def end_round(self):
+        """Close the current round's Tk call count."""
+        self.rounds += 1
+        self.last_round_tk_calls = self.tk_calls - self._round_mark
+        self.round_tk_calls += self.last_round_tk_calls
+        self._round_mark = self.tk_calls
+
+    @property
+    def average_tk_calls_per_round(self) -> float:
+        """Mean number of Tk calls per finished round."""
+        if self.rounds == 0:
+            return 0.0
+        return self.round_tk_calls / self.rounds
@@ -0,0 +1,157 @@
+"""
+Rock-Paper-Scissors Write-Behind Persistence
+Moves stats file I/O off the Tk main thread.
+
+The GUI hands finished rounds and snapshot requests to ``StatsWriter``, which
+queues them in a bounded queue and returns immediately.  A background thread
+wakes up on an interval (or when asked to flush), drains everything pending
+and writes it to the storage backend in one go: consecutive rounds become a
+single batch and consecutive snapshots collapse into the last one.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from engine import Choice, GameResult, GameStats
+from storage import DEFAULT_PROFILE, StatsBackend
+
+_ROUND = 'round'
+_SNAPSHOT = 'snapshot'
+
+
+class StatsWriter:
+    """Background writer with a bounded queue in front of a ``StatsBackend``."""
+
+    def __init__(self, backend: StatsBackend, profile: str = DEFAULT_PROFILE,
+                 flush_interval: float = 0.5, max_queue: int = 1024):
+        """Configure the target backend and profile, flush interval and queue bound."""
+        self.backend = backend
+        self.profile = profile
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._wakeup = threading.Event()
+        self._written = threading.Condition()
+        self._submitted_count = 0
+        self._written_count = 0
+        self._stopping = False
+        self._thread = None
+
+        # Metrics
+        self.flush_count = 0
+        self.last_flush_latency = 0.0
+        self.max_flush_latency = 0.0
+        self.max_queue_depth = 0
+
+    def start(self):
+        """Start the background writer thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='StatsWriter', daemon=True)
+            self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of updates waiting to be written."""
+        return self._queue.qsize()
+
+    def record_round(self, player_choice: Choice, computer_choice: Choice, result: GameResult):
+        """Queue a finished round for journaling."""
+        self._submit((_ROUND, (player_choice, computer_choice, result, time.time())))
+
+    def save_snapshot(self, stats: GameStats):
+        """Queue a snapshot of ``stats`` (copied now, written later)."""
+        self._submit((_SNAPSHOT, GameStats(**stats.to_dict())))
+
+    def _submit(self, item):
+        """Enqueue an item, blocking only if the queue is full."""
+        with self._written:
+            self._submitted_count += 1
+        if self._queue.full():
+            self._wakeup.set()  # Let the writer catch up before we block
+        self._queue.put(item)
+        depth = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write everything queued so far; return False on timeout."""
+        with self._written:
+            target = self._submitted_count
+        if self._thread is None:
+            self._drain()
+            return True
+        self._wakeup.set()
+        with self._written:
+            return self._written.wait_for(lambda: self._written_count >= target, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Flush pending updates, stop the thread and close the backend."""
+        self.flush(timeout)
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.backend.close()
+
+    def metrics(self) -> dict:
+        """Return queue depth and flush latency figures."""
+        return {
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'flush_count': self.flush_count,
+            'last_flush_latency_ms': self.last_flush_latency * 1000,
+            'max_flush_latency_ms': self.max_flush_latency * 1000
+        }
+
+    def _run(self):
+        """Writer thread main loop."""
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+        self._drain()
+
+    def _drain(self):
+        """Write every queued item, coalescing rounds and snapshots."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        rounds = []
+        snapshot = None
+        try:
+            for kind, payload in batch:
+                if kind == _ROUND:
+                    if snapshot is not None:
+                        # Rounds after a reset must land after its snapshot
+                        self.backend.save_stats(self.profile, snapshot)
+                        snapshot = None
+                    rounds.append(payload)
+                else:
+                    if rounds:
+                        self.backend.record_rounds(self.profile, rounds)
+                        rounds = []
+                    snapshot = payload  # Later snapshots supersede earlier ones
+            if rounds:
+                self.backend.record_rounds(self.profile, rounds)
+            if snapshot is not None:
+                self.backend.save_stats(self.profile, snapshot)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error saving stats: {e}")
+        finally:
+            elapsed = time.perf_counter() - start
+            self.flush_count += 1
+            self.last_flush_latency = elapsed
+            self.max_flush_latency = max(self.max_flush_latency, elapsed)
+            with self._written:
+                self._written_count += len(batch)
+                self._written.notify_all()